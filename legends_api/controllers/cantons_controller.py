@@ -5,11 +5,14 @@ from legends_config.database.db_config import get_connection_db
 from legends_entities.responses import ApiResponse
 from legends_bl import CantonBL
 from legends_entities import CantonEntity
+from legends_cache import cached_response, catalog_response_cache
+from legends_observability import InstrumentedRoute
 
 # Creación del objeto router para agrupar los endpoints relacionados con distritos
 cantons_router = APIRouter(
     prefix="/cantons",  # Prefijo URL para todos los endpoints de este router
-    tags=["Cantons"]  # Categoría en la documentación
+    tags=["Cantons"],  # Categoría en la documentación
+    route_class=InstrumentedRoute,  # Mide el endpoint como capa `controller` al perfilar
 )
 
 
@@ -34,6 +37,7 @@ def get_canton_bl(db: Session = Depends(get_connection_db)):
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ApiResponse},
     }
 )
+@cached_response(catalog_response_cache)
 def get_all(response: Response, canton_bl: CantonBL = Depends(get_canton_bl)) -> ApiResponse[List[CantonEntity]]:
     """
     Obtiene todos los cantones registrados en la base de datos.
@@ -74,16 +78,19 @@ def get_all(response: Response, canton_bl: CantonBL = Depends(get_canton_bl)) ->
         status.HTTP_404_NOT_FOUND: {"model": ApiResponse},
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ApiResponse}
     })
+@cached_response(catalog_response_cache)
 def get_by_province(response: Response, province_name: str, canton_bl: CantonBL = Depends(get_canton_bl)):
     """
     Obtiene los cantones por el nombre de una provincia.
 
+    El nombre admite diferencias de tildes, mayúsculas y errores de escritura menores.
+
     **Parámetros**:
     - `provincia_name (str)`: Nombre de la provincia a buscar.
 
     **Posibles respuestas**:
     - ✅ `200 OK`: Lista de los cantones obtenida correctamente.
-    - ⚠️ `404 Not Found`: No hay distritos registrados en la base de datos.
+    - ⚠️ `404 Not Found`: La provincia no existe; el mensaje incluye las provincias más parecidas.
     - ⚠️ `500 Internal Server Error`: Ocurrió un error inesperado en el servidor.
 
     **Returns**:
@@ -115,6 +122,7 @@ def get_by_province(response: Response, province_name: str, canton_bl: CantonBL
         status.HTTP_404_NOT_FOUND: {"model": ApiResponse},
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ApiResponse}
     })
+@cached_response(catalog_response_cache)
 def get_by_province_id(response: Response, province_id: int, canton_bl: CantonBL = Depends(get_canton_bl)):
     """
     Endpoint para obtener los cantones por el identificador único de una provincia.
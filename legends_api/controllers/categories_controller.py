@@ -5,10 +5,13 @@ from legends_config.database.db_config import get_connection_db
 from legends_entities.responses import ApiResponse
 from legends_bl import CategoryBL
 from legends_entities import CategoryEntity
+from legends_cache import cached_response, catalog_response_cache
+from legends_observability import InstrumentedRoute
 
 categories_router = APIRouter(
     prefix="/categories",  # Prefijo URL para todos los endpoints de este router
-    tags=["Categories"]  # Categoría en la documentación
+    tags=["Categories"],  # Categoría en la documentación
+    route_class=InstrumentedRoute,  # Mide el endpoint como capa `controller` al perfilar
 )
 
 
@@ -33,6 +36,7 @@ def get_category_bl(db: Session = Depends(get_connection_db)):
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ApiResponse},
     }
 )
+@cached_response(catalog_response_cache)
 def get_all(response: Response, category_bl: CategoryBL = Depends(get_category_bl)) -> ApiResponse[List[CategoryEntity]]:
     """
     Obtiene todas las categorías registradas en la base de datos.
@@ -5,11 +5,14 @@ from legends_config.database.db_config import get_connection_db
 from legends_entities.responses import ApiResponse
 from legends_bl import DistrictBL
 from legends_entities.districts import DistrictEntity
+from legends_cache import cached_response, catalog_response_cache
+from legends_observability import InstrumentedRoute
 
 # Creación del objeto router para agrupar los endpoints relacionados con distritos
 district_router = APIRouter(
     prefix="/districts",  # Prefijo URL para todos los endpoints de este router
-    tags=["Districts"]  # Categoría en la documentación 
+    tags=["Districts"],  # Categoría en la documentación
+    route_class=InstrumentedRoute,  # Mide el endpoint como capa `controller` al perfilar
 )
 
 
@@ -34,6 +37,7 @@ def get_district_bl(db: Session = Depends(get_connection_db)):
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ApiResponse},
     }
 )
+@cached_response(catalog_response_cache)
 def get_all(response: Response, district_bl: DistrictBL = Depends(get_district_bl)) -> ApiResponse[List[DistrictEntity]]:
     """
     Obtiene todos los distritos registrados en la base de datos.
@@ -73,16 +77,19 @@ def get_all(response: Response, district_bl: DistrictBL = Depends(get_district_b
         status.HTTP_404_NOT_FOUND: {"model": ApiResponse},
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ApiResponse}
     })
+@cached_response(catalog_response_cache)
 def get_by_canton(response: Response, canton_name: str, district_bl: DistrictBL = Depends(get_district_bl)):
     """
     Obtiene los distritos por el nombre de un cantón.
 
+    El nombre admite diferencias de tildes, mayúsculas y errores de escritura menores.
+
     **Parámetros**:
     - `canton_name (str)`: Nombre del cantón a buscar.
 
     **Posibles respuestas**:
     - ✅ `200 OK`: Lista de distritos obtenida correctamente.
-    - ⚠️ `404 Not Found`: No hay distritos de este cantón registrados en la base de datos.
+    - ⚠️ `404 Not Found`: El cantón no existe; el mensaje incluye los cantones más parecidos.
     - ⚠️ `500 Internal Server Error`: Ocurrió un error inesperado en el servidor.
 
     **Returns**:
@@ -114,6 +121,7 @@ def get_by_canton(response: Response, canton_name: str, district_bl: DistrictBL
         status.HTTP_404_NOT_FOUND: {"model": ApiResponse},
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ApiResponse}
     })
+@cached_response(catalog_response_cache)
 def get_by_canton_id(response: Response, canton_id: int, district_bl: DistrictBL = Depends(get_district_bl)):
     """
     Obtiene los distritos por el identificador único de un cantón.
@@ -0,0 +1,72 @@
+from fastapi import APIRouter, Request, status, Response
+from legends_api.startup import thread_pool_monitor
+from legends_entities import ThreadPoolMetricsEntity
+from legends_entities.responses import ApiResponse
+
+# Creación del objeto router para agrupar los endpoints de estado del servicio
+health_router = APIRouter(
+    tags=["Health"]  # Categoría en la documentación
+)
+
+
+@health_router.get(
+    "/ready",
+    response_model=ApiResponse,
+    responses={
+        status.HTTP_200_OK: {"model": ApiResponse},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ApiResponse},
+    }
+)
+def ready(request: Request, response: Response):
+    """
+    Indica si el worker terminó su calentamiento y puede recibir tráfico.
+
+    **Posibles respuestas**:
+    - ✅ `200 OK`: El worker está listo.
+    - ⚠️ `503 Service Unavailable`: El worker todavía se está calentando.
+
+    **Returns**:
+        ApiResponse: Respuesta estructurada con el estado correspondiente.
+    """
+    if not getattr(request.app.state, "is_ready", False):
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return ApiResponse(
+            statusCode=response.status_code,
+            success=False,
+            message="El servicio se está calentando"
+        )
+
+    response.status_code = status.HTTP_200_OK
+    return ApiResponse(
+        statusCode=response.status_code,
+        success=True,
+        message="El servicio está listo"
+    )
+
+
+@health_router.get(
+    "/metrics/thread-pool",
+    response_model=ApiResponse[ThreadPoolMetricsEntity],
+    responses={
+        status.HTTP_200_OK: {"model": ApiResponse[ThreadPoolMetricsEntity]},
+    }
+)
+async def thread_pool_metrics(response: Response):
+    """
+    Devuelve la ocupación del pool de hilos de este worker y el tiempo que las solicitudes esperan por un hilo.
+
+    Es `async` para responder desde el ciclo de eventos aunque todos los hilos estén ocupados.
+
+    **Posibles respuestas**:
+    - ✅ `200 OK`: Métricas del worker que atendió la solicitud.
+
+    **Returns**:
+        ApiResponse[ThreadPoolMetricsEntity]: Respuesta estructurada con las métricas.
+    """
+    response.status_code = status.HTTP_200_OK
+    return ApiResponse[ThreadPoolMetricsEntity](
+        statusCode=response.status_code,
+        success=True,
+        message="Métricas del pool de hilos obtenidas correctamente.",
+        data=thread_pool_monitor.snapshot()
+    )
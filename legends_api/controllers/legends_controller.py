@@ -1,16 +1,23 @@
 from uuid import UUID
-from fastapi import APIRouter, Depends, status, Response
-from typing import List
+from fastapi import APIRouter, Depends, Header, Query, status, Response
+from typing import List, Literal, Optional
+from datetime import date as DateType
 from sqlalchemy.orm import Session
 from legends_config.database.db_config import get_connection_db
 from legends_entities.responses import ApiResponse
 from legends_bl import LegendBL
-from legends_entities import LegendCreateEntity, LegendEntity
+from legends_entities import LegendCreateEntity, LegendEntity, LegendBatchEntity, LegendFilterEntity, LegendChangesEntity
+from legends_entities import LegendSummaryEntity, LegendNearbyEntity, LegendSuggestionEntity, LegendFullEntity
+from legends_config.settings import settings
+from legends_cache import coalesced_response, legends_single_flight
+from legends_cache import REPLAYED_HEADER, idempotent_response, legends_idempotency_store
+from legends_observability import InstrumentedRoute
 
 # Creación del objeto router para agrupar los endpoints relacionados con distritos
 legends_router = APIRouter(
     prefix="/legends",  # Prefijo URL para todos los endpoints de este router
-    tags=["Legends"]  # Categoría en la documentación
+    tags=["Legends"],  # Categoría en la documentación
+    route_class=InstrumentedRoute,  # Mide el endpoint como capa `controller` al perfilar
 )
 
 
@@ -33,15 +40,27 @@ def get_legend_bl(db: Session = Depends(get_connection_db)):
     responses={
         status.HTTP_201_CREATED: {"model": ApiResponse},
         status.HTTP_400_BAD_REQUEST: { "model": ApiResponse},
+        status.HTTP_409_CONFLICT: {"model": ApiResponse},
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": ApiResponse},
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ApiResponse}
     }
 )
-def create(response: Response, create_entity: LegendCreateEntity, legend_bl: LegendBL = Depends(get_legend_bl)):
+@idempotent_response(legends_idempotency_store)
+def create(
+    response: Response,
+    create_entity: LegendCreateEntity,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
+    legend_bl: LegendBL = Depends(get_legend_bl)
+):
     """
     Endpoint para crear una nueva leyenda en la base de datos.
 
+    Si se envía el encabezado `Idempotency-Key`, los reintentos con la misma clave devuelven la
+    respuesta original (con `Idempotent-Replayed: true`) sin crear otra leyenda.
+
     **Parámetros**:
     - `create_entity` (LegendCreateEntity): DTO que representa los datos ingresados por el usuario para registrar una nueva leyenda.
+    - `Idempotency-Key` (str, encabezado): Clave única elegida por el cliente para esta creación (opcional).
 
     **Returns**:
     - `ApiResponse`: Estructura de respuesta con el estado, mensaje y datos procesados.
@@ -49,9 +68,11 @@ def create(response: Response, create_entity: LegendCreateEntity, legend_bl: Leg
     **Posibles respuestas**:
     - ✅ `201 Created`: La leyenda se ha creado correctamente. 
     - ❌ `400 Bad Request`: Datos inválidos. La solicitud no cumple con los requisitos esperados.
+    - ⚠️ `409 Conflict`: Una solicitud con la misma `Idempotency-Key` sigue en proceso.
+    - ❌ `422 Unprocessable Entity`: La `Idempotency-Key` ya se usó con otros datos.
     - ⚠️ `500 Internal Server Error`: Ocurrió un error inesperado en el servidor.
     """
-    result = legend_bl.create(create_entity)
+    result = legend_bl.create(create_entity, idempotency_key)
 
     if "error" in result:
         response.status_code = result["status"]
@@ -62,6 +83,9 @@ def create(response: Response, create_entity: LegendCreateEntity, legend_bl: Leg
             data=None
         )
 
+    if result.get("replayed"):
+        # La leyenda ya se había creado con esta clave, posiblemente en otro worker
+        response.headers[REPLAYED_HEADER] = "true"
     response.status_code = status.HTTP_201_CREATED
     return ApiResponse(
         statusCode=response.status_code,
@@ -192,6 +216,226 @@ def delete(response: Response, legend_id: UUID, legend_bl: LegendBL = Depends(ge
     )
 
 
+@legends_router.get(
+    "/batch",
+    response_model=ApiResponse[LegendBatchEntity],
+    responses={
+        status.HTTP_200_OK: {"model": ApiResponse[LegendBatchEntity]},
+        status.HTTP_400_BAD_REQUEST: {"model": ApiResponse},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ApiResponse}
+    }
+)
+@coalesced_response(legends_single_flight)
+def get_by_ids(response: Response, ids: List[str] = Query(...), legend_bl: LegendBL = Depends(get_legend_bl)):
+    """
+    Endpoint para obtener varias leyendas por sus IDs en una sola solicitud.
+
+    **Parámetros**:
+    - `ids` (List[str]): Identificadores únicos de las leyendas, repitiendo el parámetro
+      (`?ids=a&ids=b`) o separados por comas (`?ids=a,b`).
+
+    **Returns**:
+    - `ApiResponse[LegendBatchEntity]`: Leyendas encontradas en el orden solicitado y los IDs que no existen.
+
+    **Posibles respuestas**:
+    - ✅ `200 OK`: Las leyendas han sido obtenidas correctamente.
+    - ❌ `400 Bad Request`: Algún ID no tiene un formato válido o se superó el máximo permitido.
+    - ⚠️ `500 Internal Server Error`: Ocurrió un error inesperado en el servidor.
+    """
+    try:
+        legend_ids = [UUID(x.strip()) for value in ids for x in value.split(",") if x.strip()]
+    except ValueError:
+        legend_ids = None
+
+    if not legend_ids:
+        response.status_code = status.HTTP_400_BAD_REQUEST
+        return ApiResponse(
+            statusCode=response.status_code,
+            success=False,
+            message="No se proporcionaron IDs válidos. Por favor, envíe UUIDs correctos."
+        )
+
+    if len(legend_ids) > settings.legends_batch_max_ids:
+        response.status_code = status.HTTP_400_BAD_REQUEST
+        return ApiResponse(
+            statusCode=response.status_code,
+            success=False,
+            message=f"Se pueden consultar como máximo {settings.legends_batch_max_ids} leyendas por solicitud."
+        )
+
+    result = legend_bl.get_by_ids(legend_ids)
+    if isinstance(result, dict) and "error" in result:
+        response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        return ApiResponse(
+            statusCode=response.status_code,
+            success=False,
+            message=result["error"]
+        )
+
+    response.status_code = status.HTTP_200_OK
+    return ApiResponse[LegendBatchEntity](
+        statusCode=response.status_code,
+        success=True,
+        message="Las leyendas han sido obtenidas correctamente.",
+        data=result
+    )
+
+
+@legends_router.get(
+    "/changes",
+    response_model=ApiResponse[LegendChangesEntity],
+    responses={
+        status.HTTP_200_OK: {"model": ApiResponse[LegendChangesEntity]},
+        status.HTTP_400_BAD_REQUEST: {"model": ApiResponse},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ApiResponse}
+    }
+)
+@coalesced_response(legends_single_flight)
+def get_changes(
+    response: Response,
+    since: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=settings.legends_changes_max_limit),
+    legend_bl: LegendBL = Depends(get_legend_bl)
+):
+    """
+    Endpoint para obtener las leyendas creadas, modificadas o eliminadas después de un cursor.
+
+    Permite a los clientes sincronizarse de forma incremental en lugar de volver a descargar
+    todo el listado: se consulta sin `since` la primera vez y luego con el `nextCursor` recibido.
+
+    **Parámetros**:
+    - `since` (str): Cursor devuelto por la consulta anterior (opcional).
+    - `limit` (int): Cantidad máxima de cambios a devolver.
+
+    **Returns**:
+    - `ApiResponse[LegendChangesEntity]`: Cambios ordenados, el cursor siguiente y si quedan más cambios.
+
+    **Posibles respuestas**:
+    - ✅ `200 OK`: Los cambios han sido obtenidos correctamente.
+    - ❌ `400 Bad Request`: El cursor no tiene un formato válido.
+    - ⚠️ `500 Internal Server Error`: Ocurrió un error inesperado en el servidor.
+    """
+    result = legend_bl.get_changes(since, limit)
+    if isinstance(result, dict) and "error" in result:
+        response.status_code = result["status"]
+        return ApiResponse(
+            statusCode=response.status_code,
+            success=False,
+            message=result["error"]
+        )
+
+    response.status_code = status.HTTP_200_OK
+    return ApiResponse[LegendChangesEntity](
+        statusCode=response.status_code,
+        success=True,
+        message="Los cambios de leyendas han sido obtenidos correctamente.",
+        data=result
+    )
+
+
+@legends_router.get(
+    "/autocomplete",
+    response_model=ApiResponse[List[LegendSuggestionEntity]],
+    responses={
+        status.HTTP_200_OK: {"model": ApiResponse[List[LegendSuggestionEntity]]},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ApiResponse}
+    }
+)
+def autocomplete(
+    response: Response,
+    prefix: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=settings.autocomplete_max_results),
+    legend_bl: LegendBL = Depends(get_legend_bl)
+):
+    """
+    Endpoint para autocompletar nombres de leyendas mientras el usuario escribe.
+
+    Se devuelven las leyendas activas cuyo nombre empieza con `prefix` y luego las que tienen una
+    palabra que empieza con él, sin tener en cuenta tildes ni mayúsculas.
+
+    **Parámetros**:
+    - `prefix` (str): Texto escrito por el usuario.
+    - `limit` (int): Cantidad máxima de sugerencias a devolver.
+
+    **Returns**:
+    - `ApiResponse[List[LegendSuggestionEntity]]`: Sugerencias con el ID y el nombre de cada leyenda.
+
+    **Posibles respuestas**:
+    - ✅ `200 OK`: Las sugerencias han sido obtenidas correctamente (la lista puede estar vacía).
+    - ⚠️ `500 Internal Server Error`: Ocurrió un error inesperado en el servidor.
+    """
+    result = legend_bl.autocomplete(prefix, limit)
+    if isinstance(result, dict) and "error" in result:
+        response.status_code = result["status"]
+        return ApiResponse(
+            statusCode=response.status_code,
+            success=False,
+            message=result["error"]
+        )
+
+    response.status_code = status.HTTP_200_OK
+    return ApiResponse[List[LegendSuggestionEntity]](
+        statusCode=response.status_code,
+        success=True,
+        message="Las sugerencias han sido obtenidas correctamente.",
+        data=result
+    )
+
+
+@legends_router.get(
+    "/nearby",
+    response_model=ApiResponse[List[LegendNearbyEntity]],
+    responses={
+        status.HTTP_200_OK: {"model": ApiResponse[List[LegendNearbyEntity]]},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ApiResponse}
+    }
+)
+@coalesced_response(legends_single_flight)
+def get_nearby(
+    response: Response,
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    radius: float = Query(10.0, gt=0, le=settings.nearby_max_radius_km),
+    limit: int = Query(20, ge=1, le=settings.nearby_max_results),
+    legend_bl: LegendBL = Depends(get_legend_bl)
+):
+    """
+    Endpoint para obtener las leyendas cercanas a un punto geográfico.
+
+    Se devuelven las leyendas activas cuyo distrito tiene el centroide a `radius` kilómetros o
+    menos del punto, de la más cercana a la más lejana. Los distritos sin coordenadas no participan.
+
+    **Parámetros**:
+    - `lat` (float): Latitud del punto, en grados.
+    - `lon` (float): Longitud del punto, en grados.
+    - `radius` (float): Radio de búsqueda en kilómetros.
+    - `limit` (int): Cantidad máxima de leyendas a devolver.
+
+    **Returns**:
+    - `ApiResponse[List[LegendNearbyEntity]]`: Leyendas encontradas con su distancia en kilómetros.
+
+    **Posibles respuestas**:
+    - ✅ `200 OK`: Las leyendas cercanas han sido obtenidas correctamente (la lista puede estar vacía).
+    - ⚠️ `500 Internal Server Error`: Ocurrió un error inesperado en el servidor.
+    """
+    result = legend_bl.get_nearby(lat, lon, radius, limit)
+    if isinstance(result, dict) and "error" in result:
+        response.status_code = result["status"]
+        return ApiResponse(
+            statusCode=response.status_code,
+            success=False,
+            message=result["error"]
+        )
+
+    response.status_code = status.HTTP_200_OK
+    return ApiResponse[List[LegendNearbyEntity]](
+        statusCode=response.status_code,
+        success=True,
+        message="Las leyendas cercanas han sido obtenidas correctamente.",
+        data=result
+    )
+
+
 @legends_router.get(
     "/{legend_id}",
     response_model=ApiResponse[LegendEntity],
@@ -202,6 +446,7 @@ def delete(response: Response, legend_id: UUID, legend_bl: LegendBL = Depends(ge
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ApiResponse}
     }
 )
+@coalesced_response(legends_single_flight)
 def get_by_id(response: Response, legend_id: UUID, legend_bl: LegendBL = Depends(get_legend_bl)):
     """
     Endpoint para obtener una leyenda específica desde la base de datos.
@@ -251,31 +496,127 @@ def get_by_id(response: Response, legend_id: UUID, legend_bl: LegendBL = Depends
         data=result
     )
 
+
+@legends_router.get(
+    "/{legend_id}/full",
+    response_model=ApiResponse[LegendFullEntity],
+    responses={
+        status.HTTP_200_OK: {"model": ApiResponse[LegendFullEntity]},
+        status.HTTP_404_NOT_FOUND: {"model": ApiResponse},
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": ApiResponse},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ApiResponse}
+    }
+)
+@coalesced_response(legends_single_flight)
+def get_full_by_id(response: Response, legend_id: UUID, legend_bl: LegendBL = Depends(get_legend_bl)):
+    """
+    Endpoint para obtener una leyenda junto con su categoría, distrito, cantón y provincia.
+
+    Todo se obtiene con una sola consulta, por lo que una página de detalle no necesita
+    consultar también `/categories/`, `/districts/`, `/cantons/` y `/provinces/`.
+
+    **Parámetros**:
+    - `legend_id` (UUID): Identificador único de la leyenda.
+
+    **Returns**:
+    - `ApiResponse[LegendFullEntity]`: Estructura de respuesta con la leyenda y sus datos relacionados.
+
+    **Posibles respuestas**:
+    - ✅ `200 OK`: La leyenda ha sido obtenida correctamente.
+    - ⚠️ `404 Not Found`: La leyenda no existe en la base de datos.
+    - ❌ `422 Unprocessable Entity`: `legend_id` no tiene un formato válido.
+    - ⚠️ `500 Internal Server Error`: Ocurrió un error inesperado en el servidor.
+    """
+    result = legend_bl.get_full_by_id(legend_id)
+    if result is None:
+        response.status_code = status.HTTP_404_NOT_FOUND
+        return ApiResponse(
+            statusCode=response.status_code,
+            success=False,
+            message="La leyenda no existe en la base de datos."
+        )
+
+    if isinstance(result, dict) and "error" in result:
+        response.status_code = result["status"]
+        return ApiResponse(
+            statusCode=response.status_code,
+            success=False,
+            message=result["error"]
+        )
+
+    response.status_code = status.HTTP_200_OK
+    return ApiResponse[LegendFullEntity](
+        statusCode=response.status_code,
+        success=True,
+        message="La leyenda ha sido obtenida correctamente.",
+        data=result
+    )
+
+
 @legends_router.get(
     "/",
-    response_model=ApiResponse[List[LegendEntity]],
+    response_model=ApiResponse[List[LegendSummaryEntity]],
     responses={
-        status.HTTP_200_OK: {"model":ApiResponse[List[LegendEntity]]},
+        status.HTTP_200_OK: {"model":ApiResponse[List[LegendSummaryEntity]]},
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ApiResponse}
     }
 )
-def get_all(response: Response, legend_bl: LegendBL = Depends(get_legend_bl)):
+@coalesced_response(legends_single_flight)
+def get_all(
+    response: Response,
+    categoryId: Optional[str] = None,
+    districtId: Optional[int] = None,
+    cantonId: Optional[int] = None,
+    provinceId: Optional[int] = None,
+    dateFrom: Optional[DateType] = None,
+    dateTo: Optional[DateType] = None,
+    sort: Optional[Literal["date", "-date", "name", "-name"]] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=100),
+    legend_bl: LegendBL = Depends(get_legend_bl)
+):
     """
-    Endpoint para obtener todas las leyendas desde la base de datos.
+    Endpoint para obtener todas las leyendas desde la base de datos, con filtros y orden opcionales.
+
+    **Parámetros**:
+    - `categoryId` (str): Solo leyendas de esta categoría.
+    - `districtId` (int): Solo leyendas de este distrito.
+    - `cantonId` (int): Solo leyendas de los distritos de este cantón.
+    - `provinceId` (int): Solo leyendas de los distritos de esta provincia.
+    - `dateFrom` / `dateTo` (date): Rango de fechas (inclusive).
+    - `sort` (str): `date`, `-date`, `name` o `-name` (`-` para descendente).
+    - `skip` / `limit` (int): Paginación.
 
     **Returns**:
-    - `ApiResponse[List[LegendEntity]]`: Estructura de respuesta con el estado, mensaje y lista de leyendas.
+    - `ApiResponse[List[LegendSummaryEntity]]`: Estructura de respuesta con el estado, mensaje y lista de leyendas,
+      cada una con un extracto; la descripción completa se obtiene en `/legends/{legend_id}`.
 
     **Posibles respuestas**:
     - ✅ `200 OK`: La lista de leyendas ha sido obtenida correctamente.
     - ⚠️ `500 Internal Server Error`: Ocurrió un error inesperado en el servidor.
     """
-    legends = legend_bl.get_all()
+    filters = LegendFilterEntity(
+        categoryId=categoryId,
+        districtId=districtId,
+        cantonId=cantonId,
+        provinceId=provinceId,
+        dateFrom=dateFrom,
+        dateTo=dateTo,
+        sort=sort
+    )
+    legends = legend_bl.get_all(skip, limit, filters)
+    if isinstance(legends, dict) and "error" in legends:
+        response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        return ApiResponse(
+            statusCode=response.status_code,
+            success=False,
+            message=legends["error"]
+        )
 
     response.status_code = status.HTTP_200_OK
-    return ApiResponse[List[LegendEntity]](
+    return ApiResponse[List[LegendSummaryEntity]](
         statusCode=response.status_code,
         success=True,
         message="Lista de leyendas obtenida correctamente.",
         data=legends
-    )
\ No newline at end of file
+    )
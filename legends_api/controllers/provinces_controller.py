@@ -4,12 +4,15 @@ from sqlalchemy.orm import Session
 from legends_config.database.db_config import get_connection_db
 from legends_entities.responses import ApiResponse
 from legends_bl import ProvinceBL
-from legends_entities import ProvinceEntity
+from legends_entities import ProvinceEntity, ProvinceTreeEntity
+from legends_cache import cached_response, catalog_response_cache
+from legends_observability import InstrumentedRoute
 
 # Creación del objeto router para agrupar los endpoints relacionados con distritos
 provinces_router = APIRouter(
     prefix="/provinces",  # Prefijo URL para todos los endpoints de este router
-    tags=["Provinces"]  # Categoría en la documentación
+    tags=["Provinces"],  # Categoría en la documentación
+    route_class=InstrumentedRoute,  # Mide el endpoint como capa `controller` al perfilar
 )
 
 
@@ -34,6 +37,7 @@ def get_province_bl(db: Session = Depends(get_connection_db)):
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ApiResponse},
     }
 )
+@cached_response(catalog_response_cache)
 def get_all(response: Response, province_bl: ProvinceBL = Depends(get_province_bl)) -> ApiResponse[List[ProvinceEntity]]:
     """
     Obtiene todas las provincia registrados en la base de datos.
@@ -66,6 +70,52 @@ def get_all(response: Response, province_bl: ProvinceBL = Depends(get_province_b
         )
 
 
+@provinces_router.get(
+    "/tree",
+    response_model=ApiResponse[List[ProvinceTreeEntity]],
+    responses={
+        status.HTTP_200_OK: {"model": ApiResponse[List[ProvinceTreeEntity]]},
+        status.HTTP_304_NOT_MODIFIED: {"model": None},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ApiResponse},
+    }
+)
+@cached_response(catalog_response_cache)
+def get_tree(response: Response, province_bl: ProvinceBL = Depends(get_province_bl)):
+    """
+    Obtiene la jerarquía completa de provincias, cantones y distritos en una sola respuesta.
+
+    La respuesta se serializa una sola vez y se reutiliza hasta que cambie el catálogo. Incluye
+    un `ETag`, por lo que los clientes pueden revalidarla con `If-None-Match`.
+
+    **Posibles respuestas**:
+    - ✅ `200 OK`: Jerarquía geográfica obtenida correctamente.
+    - ✅ `304 Not Modified`: El cliente ya tiene la versión vigente.
+    - ⚠️ `500 Internal Server Error`: Ocurrió un error inesperado en el servidor.
+
+    **Returns**:
+        ApiResponse[List[ProvinceTreeEntity]]: Respuesta estructurada con el estado correspondiente.
+    """
+    try:
+        provinces = province_bl.get_tree()
+
+        response.status_code = status.HTTP_200_OK
+        return ApiResponse[List[ProvinceTreeEntity]](
+            statusCode=response.status_code,
+            success=True,
+            message="Jerarquía de provincias obtenida correctamente",
+            data=provinces
+        )
+
+    except Exception as e:
+        response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        return ApiResponse(
+            statusCode=response.status_code,
+            success=False,
+            message=f"Error inesperado: {str(e)}",
+            data=None
+        )
+
+
 @provinces_router.get(
     "/{province_id}",
     response_model=ApiResponse[ProvinceEntity],
@@ -75,6 +125,7 @@ def get_all(response: Response, province_bl: ProvinceBL = Depends(get_province_b
         status.HTTP_404_NOT_FOUND: {"model": ApiResponse},
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ApiResponse}
     })
+@cached_response(catalog_response_cache)
 def get_by_id(response: Response, province_id: int, province_bl: ProvinceBL = Depends(get_province_bl)):
     """
     Obtiene los provincias por el identificador único de una provincia.
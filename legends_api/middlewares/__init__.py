@@ -0,0 +1,3 @@
+from .admission_middleware import AdmissionControlMiddleware
+from .profiling_middleware import ProfilingMiddleware
+from .tracing_middleware import TracingMiddleware
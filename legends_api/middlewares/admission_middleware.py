@@ -0,0 +1,88 @@
+import asyncio
+import math
+from typing import Iterable, Optional
+from fastapi import status
+from legends_api.middlewares.token_bucket import TokenBucketLimiter
+from legends_entities.responses import ApiResponse
+
+# Métodos que solo leen; el resto se considera escritura
+READ_METHODS = {"GET", "HEAD"}
+
+
+class AdmissionControlMiddleware:
+    """
+    Middleware ASGI de control de admisión.
+
+    Limita las solicitudes en curso por worker con presupuestos separados para lecturas y
+    escrituras, de modo que no se acumulen más solicitudes de las que el pool de conexiones
+    puede atender. Una solicitud que no consigue lugar espera como máximo `queue_timeout`
+    segundos y luego se rechaza con `503` y `Retry-After`, en lugar de esperar en
+    `get_connection_db` hasta agotar el tiempo del pool. Opcionalmente aplica un límite de tasa
+    por cliente (token bucket), rechazando con `429`.
+    """
+
+    def __init__(
+        self,
+        app,
+        max_reads: int,
+        max_writes: int,
+        queue_timeout: float,
+        retry_after: int = 1,
+        rate_limit: Optional[float] = None,
+        rate_burst: int = 20,
+        exempt_paths: Iterable[str] = ("/ready", "/metrics/thread-pool", "/docs", "/redoc", "/openapi.json"),
+    ):
+        self.app = app
+        self.reads = asyncio.Semaphore(max_reads)
+        self.writes = asyncio.Semaphore(max_writes)
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self.rate_limiter = TokenBucketLimiter(rate_limit, rate_burst) if rate_limit else None
+        self.exempt_paths = set(exempt_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "OPTIONS" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        if self.rate_limiter is not None:
+            wait = self.rate_limiter.try_acquire(self._client_key(scope))
+            if wait > 0:
+                await self._reject(send, status.HTTP_429_TOO_MANY_REQUESTS, math.ceil(wait),
+                                   "Se superó el límite de solicitudes. Intente nuevamente más tarde.")
+                return
+
+        semaphore = self.reads if scope["method"] in READ_METHODS else self.writes
+        if semaphore.locked():
+            try:
+                await asyncio.wait_for(semaphore.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                await self._reject(send, status.HTTP_503_SERVICE_UNAVAILABLE, self.retry_after,
+                                   "El servicio está saturado. Intente nuevamente más tarde.")
+                return
+        else:
+            await semaphore.acquire()
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            semaphore.release()
+
+    @staticmethod
+    def _client_key(scope) -> str:
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+    @staticmethod
+    async def _reject(send, status_code: int, retry_after: int, message: str):
+        body = ApiResponse(statusCode=status_code, success=False, message=message).model_dump_json().encode()
+        await send({
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(retry_after).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
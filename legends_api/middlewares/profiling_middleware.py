@@ -0,0 +1,130 @@
+import hmac
+import json
+import logging
+import os
+import random
+import re
+import time
+from typing import Iterable, Optional
+import anyio
+from legends_entities.responses import ApiResponse
+from legends_observability import RequestProfile, current_observer, push_observer
+
+logger = logging.getLogger(__name__)
+
+
+class ProfilingMiddleware:
+    """
+    Middleware ASGI de perfilado por solicitud (opt-in).
+
+    Una solicitud se perfila si trae el encabezado `X-Profile` con el secreto configurado o si
+    resulta elegida por el muestreo aleatorio (`sample_rate`), del que se excluyen las rutas de
+    salud y documentación. Las solicitudes perfiladas reciben el encabezado `Server-Timing` con
+    el tiempo de cada capa (controlador, BL, mappers, DAL, SQL y serialización).
+
+    El perfil completo (`RequestProfile.summary` y las estadísticas de `cProfile`) se guarda en
+    `output_dir` o, si no hay directorio, se registra en el log. Con `X-Profile-Output: inline`
+    (solo junto al secreto) se devuelve en el cuerpo, junto a la respuesta original.
+    """
+
+    def __init__(self, app, secret: Optional[str] = None, sample_rate: float = 0.0,
+                 output_dir: Optional[str] = None, top_functions: int = 30,
+                 sample_exempt_paths: Iterable[str] = ("/ready", "/metrics/thread-pool", "/docs", "/redoc",
+                                                       "/openapi.json")):
+        self.app = app
+        self.secret = secret.encode() if secret else None
+        self.sample_rate = sample_rate
+        self.output_dir = output_dir
+        self.top_functions = top_functions
+        self.sample_exempt_paths = set(sample_exempt_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        requested = self._requested(scope)
+        sampled = (self.sample_rate and scope["path"] not in self.sample_exempt_paths
+                   and random.random() < self.sample_rate)
+        if not requested and not sampled:
+            await self.app(scope, receive, send)
+            return
+
+        inline = requested and self._header(scope, b"x-profile-output") == b"inline"
+        profile = RequestProfile(self.top_functions)
+        token = push_observer(profile)
+        response = {"status": 500, "headers": [], "body": []}
+
+        async def send_profiled(message):
+            if message["type"] == "http.response.start":
+                if inline:
+                    response["status"], response["headers"] = message["status"], message.get("headers", [])
+                    return
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", profile.server_timing().encode()))
+                message = {**message, "headers": headers}
+            elif message["type"] == "http.response.body" and inline:
+                response["body"].append(message.get("body", b""))
+                return
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_profiled)
+        finally:
+            current_observer.reset(token)
+            profile.finish()
+
+        if inline:
+            await self._send_inline(send, profile, response)
+        else:
+            await self._store(scope, profile)
+
+    def _requested(self, scope) -> bool:
+        value = self._header(scope, b"x-profile")
+        return self.secret is not None and value is not None and hmac.compare_digest(value, self.secret)
+
+    @staticmethod
+    def _header(scope, name: bytes) -> Optional[bytes]:
+        for key, value in scope.get("headers", ()):
+            if key == name:
+                return value
+        return None
+
+    async def _send_inline(self, send, profile: RequestProfile, response: dict):
+        raw = b"".join(response["body"])
+        try:
+            original = json.loads(raw) if raw else None
+        except ValueError:
+            original = raw.decode("utf-8", "replace")
+
+        body = ApiResponse(statusCode=response["status"], success=response["status"] < 400,
+                           message="Perfil de la solicitud.",
+                           data={"response": original, "profile": profile.summary()}).model_dump_json().encode()
+        await send({
+            "type": "http.response.start",
+            "status": response["status"],
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"server-timing", profile.server_timing().encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def _store(self, scope, profile: RequestProfile):
+        summary = profile.summary()
+        summary.update(method=scope["method"], path=scope["path"])
+        if self.output_dir is None:
+            logger.info("Perfil de %s %s: %.1f ms, capas %s, %d sentencias SQL", scope["method"], scope["path"],
+                        summary["totalMs"], summary["layers"], summary["sqlStatements"])
+            return
+        await anyio.to_thread.run_sync(self._write, scope, profile, summary)
+
+    def _write(self, scope, profile: RequestProfile, summary: dict):
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = re.sub(r"[^\w.-]+", "_", scope["path"]).strip("_") or "root"
+        base = os.path.join(self.output_dir, f"{time.strftime('%Y%m%dT%H%M%S')}-{time.time_ns() % 10**9:09d}"
+                                             f"-{scope['method']}-{path}")
+        with open(f"{base}.json", "w", encoding="utf-8") as file:
+            json.dump(summary, file, ensure_ascii=False, indent=2)
+        profile.dump_stats(f"{base}.prof")
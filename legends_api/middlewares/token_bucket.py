@@ -0,0 +1,45 @@
+import time
+from collections import OrderedDict
+
+
+class TokenBucketLimiter:
+    """
+    Limitador de tasa por cliente con el algoritmo de token bucket.
+
+    Cada cliente tiene un balde con capacidad `burst` que se recarga a `rate` tokens por segundo;
+    cada solicitud consume un token. Se recuerdan como máximo `max_clients` clientes (los menos
+    recientes se descartan), por lo que la memoria queda acotada.
+
+    No usa candados: está pensado para usarse desde el event loop de un único worker.
+    """
+
+    def __init__(self, rate: float, burst: int, max_clients: int = 10000):
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self._buckets: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def try_acquire(self, key: str) -> float:
+        """
+        Intenta consumir un token del balde del cliente.
+
+        Args:
+            key (str): Identificador del cliente.
+
+        Returns:
+            float: 0 si la solicitud se permite; si no, segundos hasta que haya un token disponible.
+        """
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.pop(key, (float(self.burst), now))
+        tokens = min(float(self.burst), tokens + (now - updated_at) * self.rate)
+
+        if tokens >= 1:
+            wait = 0.0
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / self.rate
+
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_clients:
+            self._buckets.popitem(last=False)
+        return wait
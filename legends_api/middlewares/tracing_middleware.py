@@ -0,0 +1,72 @@
+import random
+from typing import Iterable
+from legends_observability import SpanExporter, Trace, current_observer, parse_traceparent, push_observer
+
+
+class TracingMiddleware:
+    """
+    Middleware ASGI de trazas por capa.
+
+    Una solicitud se traza si trae un `traceparent` (W3C Trace Context) marcado como muestreado,
+    que se continúa con el mismo ID de traza, o si no trae uno y resulta elegida por el muestreo
+    aleatorio (`sample_rate`). Un `traceparent` no muestreado se respeta.
+
+    La traza tiene un span raíz por la solicitud (`GET /legends/{legend_id}`) y spans para el
+    controlador, cada método de los `*BL` y `*DAL`, cada lote de conversiones de un `*Mapper` y
+    cada sentencia SQL. Al terminar se entrega al exportador, y la respuesta incluye el
+    encabezado `traceresponse` con el ID de la traza. Las solicitudes no trazadas solo pagan la
+    lectura del encabezado y el sorteo.
+    """
+
+    def __init__(self, app, exporter: SpanExporter, sample_rate: float = 0.0, max_statement_length: int = 1000,
+                 exempt_paths: Iterable[str] = ("/ready", "/metrics/thread-pool", "/docs", "/redoc", "/openapi.json")):
+        self.app = app
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+        self.max_statement_length = max_statement_length
+        self.exempt_paths = set(exempt_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        incoming = None
+        for key, value in scope.get("headers", ()):
+            if key == b"traceparent":
+                incoming = parse_traceparent(value.decode("latin-1"))
+                break
+        sampled = incoming[2] if incoming else self.sample_rate > 0 and random.random() < self.sample_rate
+        if not sampled:
+            await self.app(scope, receive, send)
+            return
+
+        trace = Trace(f"{scope['method']} {scope['path']}", *(incoming[:2] if incoming else ()),
+                      max_statement_length=self.max_statement_length)
+        token = push_observer(trace)
+        status_code = 500
+
+        async def send_traced(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"traceresponse", trace.traceparent.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_traced)
+        except BaseException as e:
+            trace.root.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            current_observer.reset(token)
+            # El router deja la plantilla de la ruta en el scope (ver `InstrumentedRoute`)
+            trace.root.name = f"{scope['method']} {scope.get('route_path', scope['path'])}"
+            self.exporter.export(trace.finish({
+                "http.method": scope["method"],
+                "http.target": scope["path"],
+                "http.route": scope.get("route_path"),
+                "http.status_code": status_code,
+            }))
@@ -0,0 +1,2 @@
+from .thread_pool import admission_budgets, configure_thread_pool, thread_pool_monitor
+from .warmup import run_warmup
\ No newline at end of file
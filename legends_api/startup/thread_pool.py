@@ -0,0 +1,171 @@
+import logging
+import threading
+import time
+from collections import deque
+from typing import Optional, Tuple
+from anyio import to_thread
+from legends_config.database.db_config import engine
+from legends_config.settings import settings
+from legends_entities import ThreadPoolMetricsEntity
+from legends_observability import endpoint_started
+
+logger = logging.getLogger(__name__)
+
+
+def thread_pool_size() -> int:
+    """
+    Cantidad de hilos para los endpoints síncronos.
+
+    Por defecto coincide con las conexiones que puede abrir el pool (`db_pool_size + db_max_overflow`),
+    ya que cada endpoint ocupa un hilo y una conexión durante toda la solicitud.
+
+    **Returns**:
+        int: Tamaño configurado o calculado.
+    """
+    if settings.thread_pool_size is not None:
+        return settings.thread_pool_size
+    return settings.db_pool_size + settings.db_max_overflow
+
+
+def admission_budgets() -> Tuple[int, int]:
+    """
+    Solicitudes de lectura y de escritura que el control de admisión deja en curso por worker.
+
+    Cada solicitud admitida ocupa una conexión, por lo que por defecto ambos presupuestos se
+    reparten las conexiones del pool (`db_pool_size + db_max_overflow`): un quinto para las
+    escrituras (al menos una) y el resto para las lecturas. Si la suma configurada supera las
+    conexiones, se advierte: las solicitudes sobrantes esperarían en el checkout del pool en lugar
+    de rechazarse con `503`.
+
+    **Returns**:
+        Tuple[int, int]: Presupuestos de lecturas y de escrituras.
+    """
+    connections = settings.db_pool_size + settings.db_max_overflow
+    writes = settings.admission_max_writes
+    if writes is None:
+        writes = max(connections // 5, 1)
+    reads = settings.admission_max_reads
+    if reads is None:
+        reads = max(connections - writes, 1)
+
+    if reads + writes > connections:
+        logger.warning(
+            "El control de admisión permite %d solicitudes (%d lecturas + %d escrituras) pero solo hay %d "
+            "conexiones (db_pool_size + db_max_overflow); las sobrantes esperarán una conexión en lugar de "
+            "rechazarse.", reads + writes, reads, writes, connections)
+    return reads, writes
+
+
+def validate_thread_pool(size: int):
+    """
+    Compara el tamaño del pool de hilos con el pool de conexiones y advierte si no están alineados.
+
+    Con más hilos que conexiones, los hilos sobrantes solo esperan en el checkout del pool hasta
+    `db_pool_timeout`, ocupando memoria sin aumentar el rendimiento.
+
+    **Parámetros**:
+    - `size` (int): Tamaño del pool de hilos a validar.
+    """
+    connections = settings.db_pool_size + settings.db_max_overflow
+    if size > connections:
+        logger.warning(
+            "El pool de hilos (%d) supera las conexiones disponibles (%d = db_pool_size + db_max_overflow); "
+            "%d hilos quedarán esperando una conexión bajo carga.", size, connections, size - connections)
+    if settings.warmup_enabled and settings.warmup_connections > connections:
+        logger.warning("warmup_connections (%d) supera las conexiones disponibles (%d).",
+                       settings.warmup_connections, connections)
+
+
+def configure_thread_pool() -> int:
+    """
+    Ajusta el limitador por defecto de AnyIO, que usa FastAPI para ejecutar los endpoints síncronos.
+
+    El limitador pertenece al ciclo de eventos, por lo que debe llamarse desde el `lifespan`.
+
+    **Returns**:
+        int: Tamaño aplicado.
+    """
+    size = thread_pool_size()
+    validate_thread_pool(size)
+    to_thread.current_default_thread_limiter().total_tokens = size
+    return size
+
+
+class ThreadPoolMonitor:
+    """
+    Registra la ocupación del pool de hilos y el tiempo que las solicitudes esperan por un hilo.
+
+    La espera se mide con una dependencia global asíncrona, que marca la hora en el ciclo de
+    eventos, y con `InstrumentedRoute`, que la compara con la hora en que el endpoint empieza en
+    su hilo. Incluye por tanto la espera por los hilos de las dependencias síncronas previas
+    (como la sesión de base de datos), sin agregar saltos al pool.
+    """
+
+    def __init__(self, samples: int = 1024):
+        self._lock = threading.Lock()
+        self._waits = deque(maxlen=samples)
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+        self._peak_busy = 0
+
+    async def track(self):
+        """Dependencia global que mide la espera por un hilo del pool hasta que empieza el endpoint."""
+        limiter = to_thread.current_default_thread_limiter()
+        submitted = time.perf_counter()
+        # Se llama desde el hilo del endpoint: los hilos ocupados incluyen a esta solicitud
+        endpoint_started.set(lambda: self.record(time.perf_counter() - submitted, limiter.borrowed_tokens))
+
+    def record(self, wait: float, busy: int):
+        """
+        Registra una espera por un hilo.
+
+        **Parámetros**:
+        - `wait` (float): Segundos de espera.
+        - `busy` (int): Hilos ocupados al obtener uno.
+        """
+        with self._lock:
+            self._waits.append(wait)
+            self._count += 1
+            self._total += wait
+            self._max = max(self._max, wait)
+            self._peak_busy = max(self._peak_busy, busy)
+
+    def snapshot(self) -> ThreadPoolMetricsEntity:
+        """
+        Obtiene las métricas actuales del pool de hilos y del pool de conexiones.
+
+        Debe llamarse desde el ciclo de eventos (por ejemplo, en un endpoint `async`).
+
+        **Returns**:
+            ThreadPoolMetricsEntity: Métricas del worker actual.
+        """
+        limiter = to_thread.current_default_thread_limiter()
+        statistics = limiter.statistics()
+        with self._lock:
+            waits = sorted(self._waits)
+            count, total, max_wait, peak_busy = self._count, self._total, self._max, self._peak_busy
+
+        return ThreadPoolMetricsEntity(
+            size=int(limiter.total_tokens),
+            busy=statistics.borrowed_tokens,
+            waiting=statistics.tasks_waiting,
+            peakBusy=peak_busy,
+            dbPoolSize=settings.db_pool_size,
+            dbMaxOverflow=settings.db_max_overflow,
+            dbCheckedOut=_checked_out_connections(),
+            queueWaitSamples=count,
+            queueWaitAvgMs=total / count * 1000 if count else 0.0,
+            queueWaitP95Ms=waits[int(len(waits) * 0.95)] * 1000 if waits else 0.0,
+            queueWaitMaxMs=max_wait * 1000,
+        )
+
+
+def _checked_out_connections() -> Optional[int]:
+    """Conexiones del pool en uso, si el tipo de pool lo informa."""
+    checkedout = getattr(engine.pool, "checkedout", None)
+    return checkedout() if checkedout else None
+
+
+# Instancia única por worker
+thread_pool_monitor = ThreadPoolMonitor()
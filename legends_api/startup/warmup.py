@@ -0,0 +1,152 @@
+import logging
+import uuid
+from typing import List
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from legends_bl import LegendBL
+from legends_bl.name_resolver import refresh_name_index
+from legends_cache import canton_name_index, province_name_index
+from legends_config.database.db_config import engine, sessionLocal
+from legends_config.settings import settings
+from legends_dal import CantonDAL, CategoryDAL, DistrictDAL, LegendArchiveDAL, LegendDAL, ProvinceDAL
+from legends_models.legend import utc_now
+from legends_entities.responses import ApiResponse
+
+logger = logging.getLogger(__name__)
+
+
+def warmup_pool(connections: int):
+    """
+    Abre de antemano conexiones del pool para que las primeras solicitudes no paguen el costo de conexión.
+
+    Las conexiones se abren todas a la vez y luego se devuelven al pool, de modo que quedan
+    disponibles para reutilizarse.
+
+    **Parámetros**:
+    - `connections` (int): Cantidad de conexiones a abrir.
+    """
+    opened = []
+    try:
+        for _ in range(connections):
+            opened.append(engine.connect())
+    finally:
+        for connection in opened:
+            connection.close()
+
+
+def warmup_queries():
+    """
+    Ejecuta una vez las consultas más frecuentes de cada DAL.
+
+    Esto llena la caché de sentencias compiladas de SQLAlchemy, por lo que las solicitudes
+    reales reutilizan la compilación en lugar de realizarla por primera vez.
+    """
+    db = sessionLocal()
+    try:
+        CategoryDAL(db).get_all()
+        ProvinceDAL(db).get_all()
+        ProvinceDAL(db).get_names()
+        ProvinceDAL(db).get_by_id(0)
+        CantonDAL(db).get_all()
+        CantonDAL(db).get_names()
+        CantonDAL(db).get_by_id(0)
+        CantonDAL(db).get_by_province_id(0)
+        DistrictDAL(db).get_all()
+        DistrictDAL(db).get_by_id(0)
+        DistrictDAL(db).get_by_canton_id(0)
+        LegendDAL(db).get_all()
+        LegendDAL(db).get_by_id(str(uuid.uuid4()))
+        LegendDAL(db).get_full_by_id(str(uuid.uuid4()))
+        LegendDAL(db).get_by_ids([str(uuid.uuid4())])
+        LegendDAL(db).get_by_ids([str(uuid.uuid4())], summary=True)
+        LegendDAL(db).get_district_ids([str(uuid.uuid4())])
+        LegendDAL(db).get_names([str(uuid.uuid4())])
+        LegendDAL(db).get_changes(utc_now(), str(uuid.uuid4()), utc_now(), 1)
+        LegendArchiveDAL(db).get_changes(utc_now(), str(uuid.uuid4()), utc_now(), 1)
+    finally:
+        db.close()
+
+
+def warmup_nearby_index():
+    """
+    Construye el índice en memoria de leyendas cercanas, para que la primera búsqueda no pague
+    la lectura de todos los distritos y leyendas.
+    """
+    db = sessionLocal()
+    try:
+        result = LegendBL(db).refresh_nearby_index()
+        if isinstance(result, dict) and "error" in result:
+            raise RuntimeError(result["error"])
+    finally:
+        db.close()
+
+
+def warmup_autocomplete_index():
+    """Construye el índice en memoria de autocompletado de nombres de leyendas."""
+    db = sessionLocal()
+    try:
+        result = LegendBL(db).refresh_autocomplete_index()
+        if isinstance(result, dict) and "error" in result:
+            raise RuntimeError(result["error"])
+    finally:
+        db.close()
+
+
+def warmup_name_indexes():
+    """Construye los índices en memoria de nombres de provincias y cantones."""
+    db = sessionLocal()
+    try:
+        for index, load_names in ((province_name_index, ProvinceDAL(db).get_names),
+                                  (canton_name_index, CantonDAL(db).get_names)):
+            result = refresh_name_index(index, load_names)
+            if result is not None:
+                raise RuntimeError(result["error"])
+    finally:
+        db.close()
+
+
+def warmup_response_models(routes: List):
+    """
+    Construye y ejercita los modelos de respuesta de cada endpoint.
+
+    Los genéricos como `ApiResponse[List[...]]` construyen su esquema y serializador de pydantic
+    la primera vez que se usan; al validarlos y serializarlos aquí ese costo se paga al iniciar.
+
+    **Parámetros**:
+    - `routes` (List): Rutas registradas en la aplicación.
+    """
+    for route in routes:
+        if not isinstance(route, APIRoute) or route.response_model is None:
+            continue
+
+        model = route.response_model
+        if isinstance(model, type) and issubclass(model, ApiResponse):
+            model(statusCode=200, success=True, data=None).model_dump_json()
+
+
+def run_warmup(app: FastAPI):
+    """
+    Ejecuta todas las fases de calentamiento y marca la aplicación como lista.
+
+    Un fallo en alguna fase se registra pero no impide que el worker quede listo, ya que el
+    calentamiento solo optimiza las primeras solicitudes.
+
+    **Parámetros**:
+    - `app` (FastAPI): Aplicación cuyo estado `is_ready` se actualiza al finalizar.
+    """
+    if settings.warmup_enabled:
+        phases = (
+            ("pool", lambda: warmup_pool(settings.warmup_connections)),
+            ("queries", warmup_queries),
+            ("nearby_index", warmup_nearby_index),
+            ("name_indexes", warmup_name_indexes),
+            ("autocomplete_index", warmup_autocomplete_index),
+            ("response_models", lambda: warmup_response_models(app.routes)),
+        )
+        for name, phase in phases:
+            try:
+                phase()
+            except Exception as e:
+                logger.warning("Fallo en la fase de calentamiento '%s': %s", name, e)
+
+    app.state.is_ready = True
@@ -2,4 +2,5 @@ from .canton_bl import CantonBL
 from .category_bl import CategoryBL
 from .district_bl import DistrictBL
 from .legend_bl import LegendBL
+from .legend_archive_bl import LegendArchiveBL
 from .province_bl import ProvinceBL
\ No newline at end of file
@@ -1,14 +1,19 @@
 from sqlalchemy.orm import Session
-from legends_dal import CantonDAL
+from legends_dal import CantonDAL, ProvinceDAL
+from legends_cache import province_name_index
+from legends_bl.name_resolver import resolve_name
 from legends_bl.mappers import CantonMapper
+from legends_observability import instrumented
 
 
+@instrumented("bl")
 class CantonBL:
     """Capa de lógica de negocio para canton"""
 
     def __init__(self, db: Session):
         self.db = db
         self.canton_dal = CantonDAL(self.db)
+        self.province_dal = ProvinceDAL(self.db)
 
     def get_all(self):
         """
@@ -18,7 +23,7 @@ class CantonBL:
             list: Lista de objetos DTO de cantones.
         """
         cantons = self.canton_dal.get_all()
-        return [CantonMapper.convert_to_entity(x) for x in cantons]
+        return [CantonMapper.convert_row_to_entity(x) for x in cantons]
 
     def get_by_id(self, canton_id: int):
         """
@@ -41,14 +46,22 @@ class CantonBL:
         """
         Obtiene cantones por nombre de provincia desde la capa DAL y lo transforma en DTOs.
 
+        El nombre se resuelve con el índice en memoria de provincias, que tolera tildes, mayúsculas
+        y errores de escritura (`"San Jose"`, `"Puntarenaz"`).
+
         **Parámetros**:
             province_name (str): Nombre de la provincia a buscar.
 
         **Returns**:
             list | dict: Lista de objetos DTO de cantones si existen, 
-                         diccionario con mensaje de error si no.
+                         diccionario con mensaje de error (y provincias sugeridas) si no.
         """
-        result = self.canton_dal.get_by_province(province_name)
+        province = resolve_name(province_name_index, self.province_dal.get_names, province_name,
+                                "La provincia no existe en la base de datos")
+        if isinstance(province, dict):
+            return province
+
+        result = self.canton_dal.get_by_province_id(province.id)
 
         if "error" in result:
             return result
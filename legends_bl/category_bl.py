@@ -1,8 +1,10 @@
 from sqlalchemy.orm import Session
 from legends_bl.mappers import CategoryMapper
 from legends_dal import CategoryDAL
+from legends_observability import instrumented
 
 
+@instrumented("bl")
 class CategoryBL:
     """Capa de lógica de negocio para categorías"""
 
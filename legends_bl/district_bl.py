@@ -1,14 +1,19 @@
 from sqlalchemy.orm import Session
-from legends_dal import DistrictDAL
+from legends_dal import CantonDAL, DistrictDAL
+from legends_cache import canton_name_index
+from legends_bl.name_resolver import resolve_name
 from legends_bl.mappers import DistrictMapper
+from legends_observability import instrumented
 
 
+@instrumented("bl")
 class DistrictBL:
     """Capa de lógica de negocio para district"""
 
     def __init__(self, db: Session):
         self.db = db
         self.district_dal = DistrictDAL(self.db)
+        self.canton_dal = CantonDAL(self.db)
 
     def get_all(self):
         """
@@ -18,7 +23,7 @@ class DistrictBL:
             list: Lista de objetos DTO de distritos.
         """
         districts = self.district_dal.get_all()
-        return [DistrictMapper.convert_to_entity(x) for x in districts]
+        return [DistrictMapper.convert_row_to_entity(x) for x in districts]
 
     def get_by_id(self, district_id: int):
         """
@@ -41,14 +46,22 @@ class DistrictBL:
         """
         Obtiene distritos por nombre de cantón desde la capa DAL y los transforma en DTOs.
 
+        El nombre se resuelve con el índice en memoria de cantones, que tolera tildes, mayúsculas
+        y errores de escritura (`"Perez Zeledon"`).
+
         Args:
             canton_name (str): Nombre del cantón a buscar.
 
         Returns:
             list | dict: Lista de objetos DTO de distritos si existen, 
-                         diccionario con mensaje de error si no.
+                         diccionario con mensaje de error (y cantones sugeridos) si no.
         """
-        result = self.district_dal.get_by_canton(canton_name)
+        canton = resolve_name(canton_name_index, self.canton_dal.get_names, canton_name,
+                              "El cantón no existe en la base de datos")
+        if isinstance(canton, dict):
+            return canton
+
+        result = self.district_dal.get_by_canton_id(canton.id)
 
         if "error" in result:
             return result
@@ -0,0 +1,64 @@
+from typing import Optional
+from uuid import UUID
+from sqlalchemy.orm import Session
+from legends_dal import LegendArchiveDAL
+from legends_cache import invalidation_bus, legend_key
+from legends_observability import instrumented
+
+
+@instrumented("bl")
+class LegendArchiveBL:
+    """Capa de lógica de negocio para el archivo de leyendas eliminadas"""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.legend_archive_dal = LegendArchiveDAL(self.db)
+
+    def archive_inactive(self, batch_size: int = 500, max_batches: Optional[int] = None):
+        """
+        Mueve las leyendas inactivas de la tabla `legend` a `legend_archive` en lotes.
+
+        Cada lote es una transacción independiente, por lo que el trabajo puede interrumpirse y
+        retomarse sin dejar leyendas duplicadas ni bloquear la tabla por mucho tiempo.
+
+        **Parámetros**:
+        - `batch_size` (int): Cantidad de leyendas por lote.
+        - `max_batches` (Optional[int]): Cantidad máxima de lotes a procesar (`None` para todos).
+
+        **Returns**:
+        - Diccionario con `"message"`, `"status"` y el total de leyendas archivadas en `"count"`.
+        - Diccionario con `"error"` y `"status"` si falla algún lote (incluye lo archivado hasta entonces en `"count"`).
+        """
+        total = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            legend_ids = self.legend_archive_dal.get_inactive_ids(batch_size)
+            if isinstance(legend_ids, dict) and "error" in legend_ids:
+                return {**legend_ids, "count": total}
+            if not legend_ids:
+                break
+
+            result = self.legend_archive_dal.archive(legend_ids)
+            if "error" in result:
+                return {**result, "count": total}
+
+            total += result["count"]
+            batches += 1
+
+        return {"message": f"Se archivaron {total} leyendas.", "status": 200, "count": total}
+
+    def restore(self, legend_id: UUID):
+        """
+        Restaura una leyenda archivada como leyenda activa.
+
+        **Parámetros**:
+        - `legend_id` (UUID): Identificador único de la leyenda a restaurar.
+
+        **Returns**:
+        - Diccionario con `"message"` y `"status"` si la operación es exitosa.
+        - Diccionario con `"error"` y `"status"` si la leyenda no está archivada o si ocurre un fallo.
+        """
+        result = self.legend_archive_dal.restore(str(legend_id))
+        if "error" not in result:
+            invalidation_bus.publish(legend_key(legend_id))
+        return result
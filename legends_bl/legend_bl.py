@@ -1,31 +1,60 @@
+import base64
+import binascii
+from datetime import datetime, timedelta
 from uuid import UUID
+from typing import List, Optional
 from sqlalchemy.orm import Session
-from legends_dal import LegendDAL
+from legends_dal import LegendDAL, DistrictDAL, LegendArchiveDAL, legend_write_queue
+from legends_config.settings import settings
 from legends_bl.mappers import LegendMapper
-from legends_entities import LegendEntity, LegendCreateEntity
+from legends_cache import autocomplete_index, invalidation_bus, legend_key, nearby_index
+from legends_entities import LegendEntity, LegendCreateEntity, LegendBatchEntity, LegendFilterEntity
+from legends_entities import LegendChangeEntity, LegendChangesEntity, LegendNearbyEntity, LegendSuggestionEntity
+from legends_models import LegendModel
+from legends_models.legend import utc_now
+from legends_observability import instrumented
 
 
+@instrumented("bl")
 class LegendBL:
     """Capa de lógica de negocio para legend"""
 
     def __init__(self, db: Session):
         self.db = db
         self.legend_dal = LegendDAL(self.db)
+        self.district_dal = DistrictDAL(self.db)
+        self.legend_archive_dal = LegendArchiveDAL(self.db)
 
-    def create(self, create_entity: LegendCreateEntity):
+    def create(self, create_entity: LegendCreateEntity, idempotency_key: Optional[str] = None):
         """
         Crea una nueva leyenda en la base de datos a través de la capa DAL.
 
+        Con `legends_group_commit_enabled`, la inserción se encola y se confirma junto con las
+        demás leyendas creadas en el mismo instante; la llamada espera el resultado de su leyenda.
+
+        Con una `Idempotency-Key`, el ID de la leyenda se deriva de la clave. Si la inserción falla
+        porque esa leyenda ya existe (un reintento atendido por otro worker), se responde como si
+        se hubiera creado, marcando el resultado con `"replayed"`, siempre que los datos coincidan.
+
         **Parámetros**:
         - `create_entity` (LegendCreateEntity): DTO que representa los datos ingresados por el usuario para registrar una nueva leyenda.
+        - `idempotency_key` (str, opcional): Clave de idempotencia enviada por el cliente.
 
         **Returns**:
         - Diccionario con mensaje de éxito y código de estado `201` si la operación es exitosa.
+        - Diccionario con mensaje de error y código de estado `422` si la clave ya se usó con otros datos.
         - Diccionario con mensaje de error y código de estado `500` si ocurre un fallo en la capa BL.
         """
         try:
-            model = LegendMapper.convert_create_to_model(create_entity)
-            return self.legend_dal.create(model)
+            model = LegendMapper.convert_create_to_model(create_entity, idempotency_key)
+            model.created_at = model.updated_at = utc_now()
+            writer = legend_write_queue if settings.legends_group_commit_enabled else self.legend_dal
+            result = writer.create(model)
+            if "error" in result and idempotency_key:
+                return self._replay_create(model, result)
+            if "error" not in result:
+                invalidation_bus.publish(legend_key(model.id))
+            return result
         except Exception as e:
             return {"error": f"Error en la capa BL al crear la leyenda: {str(e)}", "status": 500}
 
@@ -50,11 +79,15 @@ class LegendBL:
             legend.districtId = entity.districtId
             legend.name = entity.name.strip() if entity.name else None
             legend.description = entity.description.strip() if entity.description else None
+            legend.excerpt = LegendMapper.build_excerpt(legend.description)
             legend.imageUrl = entity.imageUrl.strip() if entity.imageUrl else None
             legend.date = entity.date
             legend.is_active = entity.is_active
-            
+            legend.updated_at = utc_now()
+
             result = self.legend_dal.update(legend)
+            if "error" not in result:
+                invalidation_bus.publish(legend_key(legend.id))
             return result
         except Exception as e:
             return {"error": f"Error en la capa BL al actualizar la leyenda: {str(e)}", "status": 500}
@@ -63,6 +96,11 @@ class LegendBL:
         """
         Desactiva una leyenda existente en la base de datos, realizando un borrado lógico.
 
+        La fila inactiva (o su copia en `legend_archive`) queda como baja en el feed de cambios.
+
+        Si `legends_archive_on_delete` está habilitado, la leyenda además se mueve a la tabla
+        `legend_archive`; si el archivado falla, queda inactiva y la archivará el trabajo periódico.
+
         **Parámetros**:
         - `legend_id` (UUID): Identificador único de la leyenda a eliminar.
 
@@ -76,7 +114,15 @@ class LegendBL:
             return legend
 
         legend.is_active = False
+        legend.updated_at = utc_now()
         result = self.legend_dal.update(legend)
+        if "error" in result:
+            return result
+
+        if settings.legends_archive_on_delete:
+            self.legend_archive_dal.archive([str(legend_id)])
+
+        invalidation_bus.publish(legend_key(legend_id))
         return result
 
     def get_by_id(self, legend_id: UUID):
@@ -99,20 +145,311 @@ class LegendBL:
 
         return LegendMapper.convert_to_entity(legend)
 
-    def get_all(self, skip: int = 0, limit: int = 10):
+    def get_full_by_id(self, legend_id: UUID):
         """
-        Obtiene todas las leyendas desde la capa DAL con soporte para paginación y las transforma en DTOs.
+        Obtiene una leyenda con su categoría, distrito, cantón y provincia en una sola consulta y la transforma en un DTO.
+
+        **Parámetros**:
+        - `legend_id` (UUID): Identificador único de la leyenda a buscar.
+
+        **Returns**:
+        - `LegendFullEntity` si la leyenda existe en la base de datos.
+        - `None` si no existe.
+        - Diccionario con mensaje de error y código de estado si ocurre un problema.
+        """
+        legend = self.legend_dal.get_full_by_id(str(legend_id))
+        if legend is None:
+            return legend
+
+        if isinstance(legend, dict) and "error" in legend:
+            return legend
+
+        return LegendMapper.convert_to_full_entity(legend)
+
+    def get_all(self, skip: int = 0, limit: int = 10, filters: Optional[LegendFilterEntity] = None):
+        """
+        Obtiene todas las leyendas desde la capa DAL con soporte para filtros, orden y paginación y las transforma en DTOs.
 
         **Parámetros**:
         - `skip` (int): Cantidad de registros a omitir (para paginación).
         - `limit` (int): Cantidad máxima de registros a devolver.
+        - `filters` (LegendFilterEntity): Filtros y orden opcionales del listado.
+
+        **Returns**:
+        - Lista de `LegendSummaryEntity` (con el extracto en lugar de la descripción) si la consulta es exitosa.
+        - Diccionario con `"error"` y `"status"` en caso de fallo.
+        """
+        filters = filters or LegendFilterEntity()
+
+        district_ids = self._resolve_district_ids(filters)
+        if isinstance(district_ids, dict) and "error" in district_ids:
+            return district_ids
+        if district_ids is not None and not district_ids:
+            return []
+
+        legends = self.legend_dal.get_all(
+            skip, limit,
+            category_id=filters.categoryId,
+            district_ids=district_ids,
+            date_from=filters.dateFrom,
+            date_to=filters.dateTo,
+            sort=filters.sort
+        )
+        if isinstance(legends, dict) and "error" in legends:
+            return legends
+
+        return [LegendMapper.convert_row_to_summary_entity(x) for x in legends]
+
+    def _replay_create(self, model: LegendModel, result: dict):
+        """
+        Resuelve una inserción fallida con ID derivado de una `Idempotency-Key`.
+
+        Si ya existe una leyenda con ese ID, la clave se usó antes: con los mismos datos se
+        devuelve el resultado de una creación exitosa; con otros, un `422`. Si no existe, el fallo
+        no se debe a la clave y se devuelve `result` tal cual.
+        """
+        existing = self.legend_dal.get_by_id_including_inactive(model.id)
+        if existing is None or isinstance(existing, dict):
+            return result
+
+        fields = ("categoryId", "districtId", "name", "description", "imageUrl", "date")
+        if any(getattr(existing, field) != getattr(model, field) for field in fields):
+            return {"error": "La Idempotency-Key ya se usó con una solicitud diferente.", "status": 422}
+        return {"message": "Leyenda creada exitosamente.", "status": 201, "replayed": True}
+
+    def _resolve_district_ids(self, filters: LegendFilterEntity):
+        """
+        Convierte los filtros de distrito, cantón y provincia en un único conjunto de IDs de distrito.
+
+        **Returns**:
+        - `None` si no hay filtros geográficos.
+        - Lista de IDs de distrito que cumplen todos los filtros (vacía si ninguno los cumple).
+        - Diccionario con `"error"` y `"status"` en caso de fallo.
+        """
+        district_ids = None
+        candidates = []
+        if filters.districtId is not None:
+            candidates.append([filters.districtId])
+        if filters.cantonId is not None:
+            candidates.append(self.district_dal.get_ids_by_canton_id(filters.cantonId))
+        if filters.provinceId is not None:
+            candidates.append(self.district_dal.get_ids_by_province_id(filters.provinceId))
+
+        for ids in candidates:
+            if isinstance(ids, dict) and "error" in ids:
+                return ids
+            district_ids = set(ids) if district_ids is None else district_ids & set(ids)
+
+        return sorted(district_ids) if district_ids is not None else None
+
+    def get_by_ids(self, legend_ids: List[UUID]):
+        """
+        Obtiene varias leyendas desde la capa DAL en una sola consulta y las transforma en DTOs.
+
+        **Parámetros**:
+        - `legend_ids` (List[UUID]): Identificadores únicos de las leyendas a buscar.
+
+        **Returns**:
+        - `LegendBatchEntity` con las leyendas en el orden solicitado y los IDs que no se encontraron.
+        - Diccionario con `"error"` y `"status"` en caso de fallo.
+        """
+        unique_ids = list(dict.fromkeys(legend_ids))
+        legends = self.legend_dal.get_by_ids([str(x) for x in unique_ids])
+        if isinstance(legends, dict) and "error" in legends:
+            return legends
+
+        legends_by_id = {legend.id: legend for legend in legends}
+        return LegendBatchEntity(
+            legends=[LegendMapper.convert_to_entity(legends_by_id[str(x)])
+                     for x in unique_ids if str(x) in legends_by_id],
+            missing=[x for x in unique_ids if str(x) not in legends_by_id]
+        )
+
+    def get_nearby(self, latitude: float, longitude: float, radius_km: float, limit: int = 20):
+        """
+        Obtiene las leyendas activas cuyo distrito está dentro de un radio alrededor de un punto.
+
+        La búsqueda se resuelve con el índice espacial en memoria (`nearby_index`); la base de datos
+        solo se consulta para leer las leyendas encontradas y, si hace falta, para poner el índice al día.
+
+        **Parámetros**:
+        - `latitude` (float): Latitud del punto, en grados.
+        - `longitude` (float): Longitud del punto, en grados.
+        - `radius_km` (float): Radio de búsqueda en kilómetros.
+        - `limit` (int): Cantidad máxima de leyendas a devolver.
 
         **Returns**:
-        - Lista de objetos DTO de leyendas si la consulta es exitosa.
+        - Lista de `LegendNearbyEntity` ordenadas de la más cercana a la más lejana.
         - Diccionario con `"error"` y `"status"` en caso de fallo.
         """
-        legends = self.legend_dal.get_all(skip, limit)
+        refreshed = self.refresh_nearby_index()
+        if isinstance(refreshed, dict) and "error" in refreshed:
+            return refreshed
+
+        matches = nearby_index.search(latitude, longitude, radius_km, limit)
+        if not matches:
+            return []
+
+        legends = self.legend_dal.get_by_ids([legend_id for legend_id, _, _ in matches], summary=True)
         if isinstance(legends, dict) and "error" in legends:
             return legends
 
-        return [LegendMapper.convert_to_entity(x) for x in legends]
+        legends_by_id = {legend.id: legend for legend in legends}
+        return [LegendNearbyEntity(legend=LegendMapper.convert_to_summary_entity(legends_by_id[legend_id]),
+                                   distanceKm=round(distance, 3))
+                for legend_id, _, distance in matches if legend_id in legends_by_id]
+
+    def refresh_nearby_index(self):
+        """
+        Pone al día el índice de leyendas cercanas: lo reconstruye si cambió el catálogo y relee las
+        leyendas modificadas desde la última búsqueda. Las actualizaciones concurrentes se
+        serializan con `refresh_lock` del índice.
+
+        **Returns**:
+        - `None` si el índice quedó al día.
+        - Diccionario con `"error"` y `"status"` en caso de fallo.
+        """
+        if not nearby_index.needs_refresh():
+            return None
+
+        with nearby_index.refresh_lock:
+            if nearby_index.needs_rebuild():
+                # Se marca al día antes de leer, para no perder las invalidaciones que lleguen durante la
+                # lectura; las leyendas pendientes quedan incluidas en la reconstrucción
+                nearby_index.start_rebuild()
+                centroids = self.district_dal.get_centroids()
+                if isinstance(centroids, dict) and "error" in centroids:
+                    nearby_index.mark_stale()
+                    return centroids
+                locations = self.legend_dal.get_district_ids()
+                if isinstance(locations, dict) and "error" in locations:
+                    nearby_index.mark_stale()
+                    return locations
+                nearby_index.rebuild(centroids, locations)
+                return None
+
+            dirty = nearby_index.take_dirty()
+            if dirty:
+                locations = self.legend_dal.get_district_ids(dirty)
+                if isinstance(locations, dict) and "error" in locations:
+                    for legend_id in dirty:
+                        nearby_index.mark_dirty(legend_key(legend_id))
+                    return locations
+                nearby_index.update_legends(dirty, locations)
+            return None
+
+    def autocomplete(self, prefix: str, limit: int = 10):
+        """
+        Obtiene las leyendas activas cuyo nombre, o alguna de sus palabras, empieza con un prefijo.
+
+        La búsqueda se resuelve con el índice de prefijos en memoria (`autocomplete_index`), sin
+        tener en cuenta tildes ni mayúsculas; la base de datos solo se consulta para poner el índice al día.
+
+        **Parámetros**:
+        - `prefix` (str): Texto escrito por el usuario.
+        - `limit` (int): Cantidad máxima de sugerencias a devolver.
+
+        **Returns**:
+        - Lista de `LegendSuggestionEntity`.
+        - Diccionario con `"error"` y `"status"` en caso de fallo.
+        """
+        refreshed = self.refresh_autocomplete_index()
+        if isinstance(refreshed, dict) and "error" in refreshed:
+            return refreshed
+
+        return [LegendSuggestionEntity(id=legend_id, name=name)
+                for legend_id, name in autocomplete_index.search(prefix, limit)]
+
+    def refresh_autocomplete_index(self):
+        """
+        Pone al día el índice de autocompletado: lo construye la primera vez y relee las leyendas
+        modificadas desde la última búsqueda. Las actualizaciones concurrentes se serializan con
+        `refresh_lock` del índice.
+
+        **Returns**:
+        - `None` si el índice quedó al día.
+        - Diccionario con `"error"` y `"status"` en caso de fallo.
+        """
+        if not autocomplete_index.needs_refresh():
+            return None
+
+        with autocomplete_index.refresh_lock:
+            if autocomplete_index.needs_rebuild():
+                # Se marca al día antes de leer, para no perder los cambios que lleguen durante la
+                # lectura; las leyendas pendientes quedan incluidas en la construcción
+                autocomplete_index.start_rebuild()
+                names = self.legend_dal.get_names()
+                if isinstance(names, dict) and "error" in names:
+                    autocomplete_index.mark_stale()
+                    return names
+                autocomplete_index.rebuild(names)
+                return None
+
+            dirty = autocomplete_index.take_dirty()
+            if dirty:
+                names = self.legend_dal.get_names(dirty)
+                if isinstance(names, dict) and "error" in names:
+                    for legend_id in dirty:
+                        autocomplete_index.mark_dirty(legend_key(legend_id))
+                    return names
+                autocomplete_index.update_legends(dirty, names)
+            return None
+
+    def get_changes(self, since: Optional[str] = None, limit: int = 100):
+        """
+        Obtiene los cambios de leyendas posteriores a un cursor, para sincronización incremental.
+
+        Las leyendas activas se devuelven completas y las eliminadas (inactivas o archivadas) como
+        bajas. Los cambios de los últimos `legends_changes_safety_lag` segundos se omiten hasta la
+        siguiente consulta, para no adelantar el cursor por encima de transacciones aún sin confirmar.
+
+        **Parámetros**:
+        - `since` (Optional[str]): Cursor devuelto por la consulta anterior (`None` para empezar desde el inicio).
+        - `limit` (int): Cantidad máxima de cambios a devolver.
+
+        **Returns**:
+        - `LegendChangesEntity` con los cambios y el cursor siguiente.
+        - Diccionario con `"error"` y código de estado `400` si el cursor no es válido.
+        - Diccionario con `"error"` y `"status"` `500` en caso de fallo.
+        """
+        since_at, since_id = None, None
+        if since:
+            cursor = self._decode_cursor(since)
+            if cursor is None:
+                return {"error": "El cursor proporcionado no es válido.", "status": 400}
+            since_at, since_id = cursor
+
+        until = utc_now() - timedelta(seconds=settings.legends_changes_safety_lag)
+        legends = self.legend_dal.get_changes(since_at, since_id, until, limit + 1)
+        if isinstance(legends, dict) and "error" in legends:
+            return legends
+        archived = self.legend_archive_dal.get_changes(since_at, since_id, until, limit + 1)
+        if isinstance(archived, dict) and "error" in archived:
+            return archived
+
+        changes = [LegendChangeEntity(id=x.id, deleted=not x.is_active, updatedAt=x.updated_at,
+                                      legend=LegendMapper.convert_to_entity(x) if x.is_active else None)
+                   for x in legends]
+        changes += [LegendChangeEntity(id=x.id, deleted=True, updatedAt=x.updated_at) for x in archived]
+        changes.sort(key=lambda x: (x.updatedAt, str(x.id)))
+
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+        next_cursor = self._encode_cursor(changes[-1].updatedAt, str(changes[-1].id)) if changes else since
+        return LegendChangesEntity(changes=changes, nextCursor=next_cursor, hasMore=has_more)
+
+    @staticmethod
+    def _encode_cursor(updated_at: datetime, legend_id: str) -> str:
+        """Codifica la posición `(updated_at, id)` como un cursor opaco apto para URLs."""
+        raw = f"{updated_at.isoformat()}|{legend_id}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str):
+        """Decodifica un cursor de `_encode_cursor`; devuelve `None` si no es válido."""
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+            updated_at, legend_id = raw.split("|", 1)
+            return datetime.fromisoformat(updated_at), str(UUID(legend_id))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            return None
@@ -1,6 +1,8 @@
 from legends_entities import CantonEntity
 from legends_models import CantonModel
+from legends_observability import instrumented
 
+@instrumented("mapper")
 class CantonMapper:
     """Clase para mapear datos entre CantonModel y CantonEntity"""
 
@@ -19,4 +21,22 @@ class CantonMapper:
             id=canton_model.id,
             province_id=canton_model.provinceId,
             name=canton_model.name.strip() if canton_model.name else None
+        )
+
+    @staticmethod
+    def convert_row_to_entity(row: tuple) -> CantonEntity:
+        """
+        Convierte una fila de `CantonDAL.get_all` en un DTO, desempaquetando sus columnas por posición.
+
+        Args:
+            row (tuple): Fila con `id`, `provinceId` y `name`, en ese orden.
+
+        Returns:
+            CantonEntity: DTO con los datos transformados.
+        """
+        canton_id, province_id, name = row
+        return CantonEntity(
+            id=canton_id,
+            province_id=province_id,
+            name=name.strip() if name else None
         )
\ No newline at end of file
@@ -1,6 +1,8 @@
 from legends_entities import CategoryEntity
 from legends_models import CategoryModel
+from legends_observability import instrumented
 
+@instrumented("mapper")
 class CategoryMapper:
     """Clase para mapear datos entre CategoryModel y CategoryEntity"""
 
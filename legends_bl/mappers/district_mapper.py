@@ -1,7 +1,9 @@
 from legends_entities import DistrictEntity
 from legends_models import DistrictModel
+from legends_observability import instrumented
 
 
+@instrumented("mapper")
 class DistrictMapper:
     """Clase para mapear datos entre DistrictModel y DistrictEntity"""
 
@@ -19,5 +21,27 @@ class DistrictMapper:
         return DistrictEntity(
             id=district_model.id,
             canton_id=district_model.cantonId,
-            name=district_model.name.strip() if district_model.name else None
+            name=district_model.name.strip() if district_model.name else None,
+            latitude=district_model.latitude,
+            longitude=district_model.longitude
+        )
+
+    @staticmethod
+    def convert_row_to_entity(row: tuple) -> DistrictEntity:
+        """
+        Convierte una fila de `DistrictDAL.get_all` en un DTO, desempaquetando sus columnas por posición.
+
+        Args:
+            row (tuple): Fila con `id`, `cantonId`, `name`, `latitude` y `longitude`, en ese orden.
+
+        Returns:
+            DistrictEntity: DTO con los datos transformados.
+        """
+        district_id, canton_id, name, latitude, longitude = row
+        return DistrictEntity(
+            id=district_id,
+            canton_id=canton_id,
+            name=name.strip() if name else None,
+            latitude=latitude,
+            longitude=longitude
         )
@@ -1,9 +1,23 @@
+import uuid
+from typing import Optional
 from legends_models import LegendModel
 from legends_entities import LegendEntity
 from legends_entities import LegendCreateEntity
-import uuid
+from legends_entities import LegendSummaryEntity
+from legends_entities import LegendFullEntity
+from legends_bl.mappers.canton_mapper import CantonMapper
+from legends_bl.mappers.category_mapper import CategoryMapper
+from legends_bl.mappers.district_mapper import DistrictMapper
+from legends_bl.mappers.province_mapper import ProvinceMapper
+from legends_config.settings import settings
+from legends_models.types import uuid7
+from legends_observability import instrumented
 
+# Espacio de nombres de los IDs derivados de una Idempotency-Key (uuid5)
+IDEMPOTENCY_NAMESPACE = uuid.UUID("6f1c2a4e-8d3b-5e7a-9c10-4b2d8e6f0a13")
 
+
+@instrumented("mapper")
 class LegendMapper:
     """"Clase para la conversión entre modelos de base de datos (`LegendModel`) y DTOs """
 
@@ -29,6 +43,94 @@ class LegendMapper:
             is_active=legend_model.is_active
         )
 
+    @staticmethod
+    def convert_to_full_entity(legend_model: LegendModel) -> LegendFullEntity:
+        """
+        Convierte una instancia de `LegendModel` con sus relaciones cargadas en `LegendFullEntity` (DTO).
+
+        **Parámetros**:
+        - `legend_model` (LegendModel): Leyenda con `category` y `district.canton.province` cargados.
+
+        **Returns**:
+        - `LegendFullEntity`: Leyenda con su categoría, distrito, cantón y provincia.
+        """
+        district = legend_model.district
+        return LegendFullEntity(
+            **LegendMapper.convert_to_entity(legend_model).model_dump(),
+            category=CategoryMapper.convert_to_entity(legend_model.category),
+            district=DistrictMapper.convert_to_entity(district),
+            canton=CantonMapper.convert_to_entity(district.canton),
+            province=ProvinceMapper.convert_to_entity(district.canton.province)
+        )
+
+    @staticmethod
+    def convert_to_summary_entity(legend_model: LegendModel) -> LegendSummaryEntity:
+        """
+        Convierte una instancia de `LegendModel` en `LegendSummaryEntity` (DTO de listados).
+
+        Solo usa el extracto precalculado, por lo que no carga ni descomprime la descripción.
+
+        **Parámetros**:
+        - `legend_model` (LegendModel): Instancia del modelo de base de datos que se convertirá en una entidad.
+
+        **Returns**:
+        - `LegendSummaryEntity`: Instancia de entidad con los datos del listado.
+        """
+        return LegendSummaryEntity(
+            id=legend_model.id,
+            categoryId=legend_model.categoryId,
+            districtId=legend_model.districtId,
+            name=legend_model.name.strip() if legend_model.name else None,
+            excerpt=legend_model.excerpt or "",
+            imageUrl=legend_model.imageUrl.strip() if legend_model.imageUrl else None,
+            date=legend_model.date,
+            is_active=legend_model.is_active
+        )
+
+    @staticmethod
+    def convert_row_to_summary_entity(row: tuple) -> LegendSummaryEntity:
+        """
+        Convierte una fila de `LegendDAL.get_all` en `LegendSummaryEntity`, desempaquetando sus columnas por posición.
+
+        **Parámetros**:
+        - `row` (tuple): Fila con las columnas de `LIST_COLUMNS` (`id`, `categoryId`, `districtId`, `name`,
+          `excerpt`, `imageUrl`, `date`, `is_active`), en ese orden.
+
+        **Returns**:
+        - `LegendSummaryEntity`: Instancia de entidad con los datos del listado.
+        """
+        legend_id, category_id, district_id, name, excerpt, image_url, legend_date, is_active = row
+        return LegendSummaryEntity(
+            id=legend_id,
+            categoryId=category_id,
+            districtId=district_id,
+            name=name.strip() if name else None,
+            excerpt=excerpt or "",
+            imageUrl=image_url.strip() if image_url else None,
+            date=legend_date,
+            is_active=is_active
+        )
+
+    @staticmethod
+    def build_excerpt(description: str) -> str:
+        """
+        Obtiene el extracto de una descripción: su inicio, cortado en un límite de palabra.
+
+        **Parámetros**:
+        - `description` (str): Descripción completa de la leyenda.
+
+        **Returns**:
+        - `str`: Extracto de hasta `excerpt_length` caracteres (más `…` si se recortó).
+        """
+        text = " ".join((description or "").split())
+        if len(text) <= settings.excerpt_length:
+            return text
+
+        cut = text[:settings.excerpt_length]
+        if " " in cut:
+            cut = cut.rsplit(" ", 1)[0]
+        return cut.rstrip(" ,.;:") + "…"
+
     @staticmethod
     def convert_entity_to_model(entity: LegendEntity) -> LegendModel:
         """
@@ -46,28 +148,35 @@ class LegendMapper:
             districtId=entity.districtId,
             name=entity.name.strip() if entity.name else None,
             description=entity.description.strip() if entity.description else None,
+            excerpt=LegendMapper.build_excerpt(entity.description),
             imageUrl=entity.imageUrl.strip() if entity.imageUrl else None,
             date=entity.date,
             is_active=entity.is_active
         )
 
     @staticmethod
-    def convert_create_to_model(create_entity: LegendCreateEntity) -> LegendModel:
+    def convert_create_to_model(create_entity: LegendCreateEntity, idempotency_key: Optional[str] = None) -> LegendModel:
         """
         Convierte una instancia de `LegendCreateEntity` (DTO) en `LegendModel` (modelo de base de datos).
 
+        Con una `Idempotency-Key`, el ID se deriva de la clave (uuid5), de modo que un reintento
+        atendido por otro worker choca con la clave primaria en lugar de crear otra leyenda.
+        Sin ella, el ID es un uuid7 ordenado por tiempo.
+
         **Parámetros**:
         - `create_entity` (LegendCreateEntity): Entidad que representa los datos ingresados por el usuario para crear una leyenda.
+        - `idempotency_key` (str, opcional): Clave de idempotencia enviada por el cliente.
 
         **Returns**:
         - `LegendModel`: Instancia del modelo con los valores listos para ser almacenados en la base de datos.
         """
         return LegendModel(
-            id=str(uuid.uuid4()),
+            id=str(uuid.uuid5(IDEMPOTENCY_NAMESPACE, idempotency_key) if idempotency_key else uuid7()),
             categoryId=create_entity.categoryId,
             districtId=create_entity.districtId,
             name=create_entity.name.strip(),
             description=create_entity.description.strip(),
+            excerpt=LegendMapper.build_excerpt(create_entity.description),
             imageUrl=create_entity.imageUrl.strip(),
             date=create_entity.date,
             is_active=True
@@ -1,7 +1,10 @@
-from legends_entities import ProvinceEntity
+from legends_entities import ProvinceEntity, ProvinceTreeEntity, CantonTreeEntity
 from legends_models import ProvinceModel
+from legends_bl.mappers.district_mapper import DistrictMapper
+from legends_observability import instrumented
 
 
+@instrumented("mapper")
 class ProvinceMapper:
     """Clase para mapear datos entre ProvinceModel y ProvinceEntity"""
 
@@ -20,3 +23,29 @@ class ProvinceMapper:
             id=province_model.id,
             name=province_model.name.strip() if province_model.name else None
         )
+
+    @staticmethod
+    def convert_to_tree_entity(province_model: ProvinceModel) -> ProvinceTreeEntity:
+        """
+        Convierte un modelo ORM con sus cantones y distritos cargados en un DTO jerárquico.
+
+        Parámetros:
+            province_model (ProvinceModel): Instancia del modelo con las relaciones cargadas.
+
+        Returns:
+            ProvinceTreeEntity: DTO con la provincia, sus cantones y los distritos de cada cantón.
+        """
+        return ProvinceTreeEntity(
+            id=province_model.id,
+            name=province_model.name.strip() if province_model.name else None,
+            cantons=[
+                CantonTreeEntity(
+                    id=canton.id,
+                    province_id=canton.provinceId,
+                    name=canton.name.strip() if canton.name else None,
+                    districts=[DistrictMapper.convert_to_entity(district)
+                               for district in sorted(canton.districts, key=lambda d: d.id)]
+                )
+                for canton in sorted(province_model.cantons, key=lambda c: c.id)
+            ]
+        )
@@ -0,0 +1,61 @@
+from typing import Callable
+from legends_cache import NameIndex
+
+
+def refresh_name_index(index: NameIndex, load_names: Callable):
+    """
+    Reconstruye el índice de nombres si cambió el catálogo.
+
+    Las reconstrucciones se serializan con `refresh_lock`, y el índice se marca al día antes de
+    leer los nombres: una invalidación que llegue durante la lectura provoca otra reconstrucción.
+
+    Args:
+        index (NameIndex): Índice de nombres a poner al día.
+        load_names (Callable): Función de la DAL que devuelve las tuplas `(id, name)` a indexar.
+
+    Returns:
+        None | dict: `None` si el índice quedó al día, diccionario con mensaje de error si no.
+    """
+    if not index.needs_rebuild():
+        return None
+
+    with index.refresh_lock:
+        if index.needs_rebuild():
+            index.start_rebuild()
+            names = load_names()
+            if isinstance(names, dict) and "error" in names:
+                index.mark_stale()
+                return names
+            index.rebuild(names)
+    return None
+
+
+def resolve_name(index: NameIndex, load_names: Callable, name: str, not_found: str):
+    """
+    Resuelve un nombre del catálogo con el índice en memoria, tolerando tildes y errores de escritura.
+
+    El índice se reconstruye con `load_names` solo si cambió el catálogo, por lo que la resolución
+    no consulta la base de datos.
+
+    Args:
+        index (NameIndex): Índice de nombres a utilizar.
+        load_names (Callable): Función de la DAL que devuelve las tuplas `(id, name)` a indexar.
+        name (str): Nombre recibido.
+        not_found (str): Mensaje de error si el nombre no se puede resolver.
+
+    Returns:
+        NameMatch | dict: Coincidencia elegida,
+                          diccionario con mensaje de error (con sugerencias, si las hay) si no.
+    """
+    refreshed = refresh_name_index(index, load_names)
+    if refreshed is not None:
+        return refreshed
+
+    match, suggestions = index.resolve(name)
+    if match is not None:
+        return match
+
+    if suggestions:
+        # Sugerencias ordenadas de la más a la menos parecida
+        return {"error": f"{not_found}. ¿Quiso decir: {', '.join(x.name for x in suggestions)}?", "status": 404}
+    return {"error": not_found, "status": 404}
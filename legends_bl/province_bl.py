@@ -1,8 +1,10 @@
 from sqlalchemy.orm import Session
 from legends_dal import ProvinceDAL
 from legends_bl.mappers import ProvinceMapper
+from legends_observability import instrumented
 
 
+@instrumented("bl")
 class ProvinceBL:
     """Capa de lógica de negocio para province"""
 
@@ -32,7 +34,17 @@ class ProvinceBL:
                              diccionario con mensaje de error si no.
         """
         result = self.province_dal.get_by_id(province_id)
-        if "error" in result:
+        if isinstance(result, dict) and "error" in result:
             return result
 
-        return ProvinceMapper(result)
+        return ProvinceMapper.convert_to_entity(result)
+
+    def get_tree(self):
+        """
+        Obtiene la jerarquía completa de provincias, cantones y distritos desde la capa DAL y la transforma en DTOs.
+
+        Returns:
+            list: Lista de objetos DTO de provincias con sus cantones y distritos.
+        """
+        provinces = self.province_dal.get_tree()
+        return [ProvinceMapper.convert_to_tree_entity(x) for x in provinces]
@@ -0,0 +1,9 @@
+from .cache_versions import CacheVersions, cache_versions, CATALOG_NAMESPACE, LEGENDS_NAMESPACE
+from .rendered_cache import RenderedCache, RenderedResponse, cached_response, rendered_endpoint
+from .catalog_response_cache import catalog_response_cache
+from .single_flight import SingleFlight, coalesced_response, legends_single_flight
+from .idempotency import REPLAYED_HEADER, IdempotencyStore, idempotent_response, legends_idempotency_store
+from .invalidation import InvalidationBus, invalidation_bus, legend_key
+from .nearby_index import NearbyIndex, haversine_km, nearby_index
+from .autocomplete_index import AutocompleteIndex, autocomplete_index
+from .name_index import NameIndex, NameMatch, fold_name, province_name_index, canton_name_index
\ No newline at end of file
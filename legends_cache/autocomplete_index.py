@@ -0,0 +1,160 @@
+import threading
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from legends_cache.cache_versions import LEGENDS_NAMESPACE
+from legends_cache.invalidation import invalidation_bus
+from legends_cache.name_index import fold_name
+
+
+class AutocompleteIndex:
+    """
+    Índice en memoria de prefijos de nombres de leyendas activas, para autocompletar.
+
+    Los nombres se normalizan con `fold_name` (sin tildes ni mayúsculas) y se guardan en dos
+    arreglos ordenados: uno con el nombre completo y otro con el texto desde cada palabra
+    siguiente, para que `"llor"` encuentre también "La Llorona". Una búsqueda ubica el prefijo con
+    `bisect` y recorre solo las entradas que lo comparten.
+
+    Se actualiza leyenda por leyenda cuando se crea, modifica o elimina una (`legends:<id>`): esas
+    leyendas quedan pendientes y se releen antes de la siguiente búsqueda.
+
+    Quien pone el índice al día desde la base de datos debe hacerlo con `refresh_lock` tomado, para
+    que dos construcciones no se pisen y las relecturas se apliquen en el orden en que se hicieron.
+    """
+
+    def __init__(self):
+        self.refresh_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._stale = True
+        self._dirty: Set[str] = set()
+        self._names: List[Tuple[str, str, str]] = []
+        self._words: List[Tuple[str, str, str]] = []
+        self._by_legend: Dict[str, str] = {}
+
+    def needs_rebuild(self) -> bool:
+        """Indica si el índice debe construirse (al iniciar)."""
+        return self._stale
+
+    def needs_refresh(self) -> bool:
+        """Indica si hay que construir el índice o releer leyendas pendientes."""
+        return self._stale or bool(self._dirty)
+
+    def mark_stale(self, key: Optional[str] = None):
+        """Marca el índice para construirse de nuevo antes de la siguiente búsqueda."""
+        with self._lock:
+            self._stale = True
+
+    def start_rebuild(self):
+        """
+        Marca el índice como al día y descarta las leyendas pendientes, antes de leer los nombres de
+        la construcción: las leyendas que cambien durante la lectura vuelven a quedar pendientes.
+        """
+        with self._lock:
+            self._stale = False
+            self._dirty = set()
+
+    def mark_dirty(self, key: str):
+        """Marca una leyenda (clave `legends:<id>`) para releerse antes de la siguiente búsqueda."""
+        legend_id = key.split(":", 1)[1] if ":" in key else None
+        if legend_id:
+            with self._lock:
+                self._dirty.add(legend_id)
+
+    def take_dirty(self) -> List[str]:
+        """Devuelve y limpia los IDs de leyendas pendientes de releer."""
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+        return list(dirty)
+
+    def rebuild(self, legends: Iterable[Tuple[str, str]]):
+        """
+        Reconstruye el índice completo.
+
+        Args:
+            legends: Tuplas `(legend_id, nombre)` de las leyendas activas.
+        """
+        names, words, by_legend = [], [], {}
+        for legend_id, name in legends:
+            name = (name or "").strip()
+            by_legend[legend_id] = name
+            name_entry, word_entries = self._entries(legend_id, name)
+            names.append(name_entry)
+            words.extend(word_entries)
+        names.sort()
+        words.sort()
+
+        with self._lock:
+            self._names, self._words, self._by_legend = names, words, by_legend
+
+    def update_legends(self, legend_ids: Iterable[str], active: Iterable[Tuple[str, str]]):
+        """
+        Actualiza el nombre de algunas leyendas.
+
+        Args:
+            legend_ids: IDs de las leyendas releídas.
+            active: Tuplas `(legend_id, nombre)` de las que siguen activas; el resto se retira.
+        """
+        active = dict(active)
+        with self._lock:
+            for legend_id in legend_ids:
+                previous = self._by_legend.pop(legend_id, None)
+                if previous is not None:
+                    name_entry, word_entries = self._entries(legend_id, previous)
+                    self._remove(self._names, name_entry)
+                    for entry in word_entries:
+                        self._remove(self._words, entry)
+
+                name = active.get(legend_id)
+                if name is not None:
+                    name = name.strip()
+                    self._by_legend[legend_id] = name
+                    name_entry, word_entries = self._entries(legend_id, name)
+                    insort(self._names, name_entry)
+                    for entry in word_entries:
+                        insort(self._words, entry)
+
+    def search(self, prefix: str, limit: int) -> List[Tuple[str, str]]:
+        """
+        Busca las leyendas cuyo nombre (o alguna de sus palabras) empieza con el prefijo.
+
+        Args:
+            prefix (str): Texto escrito por el usuario.
+            limit (int): Cantidad máxima de resultados.
+
+        Returns:
+            List[Tuple[str, str]]: Tuplas `(legend_id, nombre)`: primero las que empiezan con el prefijo
+            y luego las que lo contienen al inicio de otra palabra, cada grupo en orden alfabético.
+        """
+        folded = fold_name(prefix)
+        if not folded:
+            return []
+
+        results: Dict[str, str] = {}
+        with self._lock:
+            for entries in (self._names, self._words):
+                position = bisect_left(entries, (folded,))
+                while len(results) < limit and position < len(entries):
+                    key, name, legend_id = entries[position]
+                    if not key.startswith(folded):
+                        break
+                    results.setdefault(legend_id, name)
+                    position += 1
+        return list(results.items())
+
+    @staticmethod
+    def _entries(legend_id: str, name: str) -> Tuple[Tuple[str, str, str], List[Tuple[str, str, str]]]:
+        folded = fold_name(name)
+        words = folded.split(" ")
+        suffixes = [" ".join(words[i:]) for i in range(1, len(words))]
+        return (folded, name, legend_id), [(suffix, name, legend_id) for suffix in suffixes]
+
+    @staticmethod
+    def _remove(entries: List[Tuple[str, str, str]], entry: Tuple[str, str, str]):
+        position = bisect_left(entries, entry)
+        if position < len(entries) and entries[position] == entry:
+            del entries[position]
+
+
+# Instancia única por worker, mantenida al día por el canal de invalidación
+autocomplete_index = AutocompleteIndex()
+invalidation_bus.subscribe(f"{LEGENDS_NAMESPACE}:", autocomplete_index.mark_dirty)
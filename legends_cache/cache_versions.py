@@ -0,0 +1,50 @@
+import threading
+
+# Espacio de nombres para los datos del catálogo (provincias, cantones, distritos y categorías)
+CATALOG_NAMESPACE = "catalog"
+
+# Espacio de nombres para las leyendas; las claves de invalidación de una leyenda son `legends:<id>`
+LEGENDS_NAMESPACE = "legends"
+
+
+class CacheVersions:
+    """
+    Registro de versiones por espacio de nombres.
+
+    Las cachés guardan la versión con la que se construyó cada entrada; incrementar la versión
+    de un espacio de nombres invalida todas sus entradas sin necesidad de recorrerlas.
+    """
+
+    def __init__(self):
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str) -> int:
+        """
+        Obtiene la versión actual de un espacio de nombres.
+
+        Args:
+            namespace (str): Espacio de nombres a consultar.
+
+        Returns:
+            int: Versión actual (0 si nunca se ha incrementado).
+        """
+        return self._versions.get(namespace, 0)
+
+    def bump(self, namespace: str) -> int:
+        """
+        Incrementa la versión de un espacio de nombres, invalidando sus entradas en caché.
+
+        Args:
+            namespace (str): Espacio de nombres a invalidar.
+
+        Returns:
+            int: Nueva versión.
+        """
+        with self._lock:
+            version = self._versions.get(namespace, 0) + 1
+            self._versions[namespace] = version
+            return version
+
+
+cache_versions = CacheVersions()
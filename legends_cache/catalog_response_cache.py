@@ -0,0 +1,6 @@
+from legends_cache.cache_versions import CATALOG_NAMESPACE
+from legends_cache.rendered_cache import RenderedCache
+from legends_config.settings import settings
+
+# Respuestas serializadas de los endpoints del catálogo; se invalidan al incrementar la versión del catálogo
+catalog_response_cache = RenderedCache(CATALOG_NAMESPACE, max_entries=settings.response_cache_max_entries)
@@ -0,0 +1,176 @@
+import dataclasses
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+from legends_cache.rendered_cache import RenderedResponse, rendered_endpoint
+from legends_config.settings import settings
+from legends_entities.responses import ApiResponse
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+
+class _Entry:
+    """Resultado (o ejecución en curso) asociado a una clave de idempotencia."""
+
+    def __init__(self, fingerprint: str):
+        self.fingerprint = fingerprint
+        self.done = threading.Event()
+        self.response: Optional[RenderedResponse] = None
+        self.expires_at = 0.0
+
+
+class IdempotencyStore:
+    """
+    Almacén acotado con expiración de respuestas por clave de idempotencia.
+
+    La primera solicitud con una clave ejecuta el endpoint y guarda su respuesta durante `ttl`
+    segundos; las repeticiones reciben los mismos bytes sin ejecutar el endpoint. Las solicitudes
+    concurrentes con la misma clave esperan a la primera en lugar de ejecutarse de nuevo.
+    Las respuestas con errores del servidor (5xx) no se guardan, para que el cliente pueda reintentar.
+
+    El almacén vive en la memoria del worker, por lo que solo evita repetir trabajo en ese worker.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 10000, wait_timeout: float = 10.0):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.wait_timeout = wait_timeout
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._pending: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def execute(self, key: str, fingerprint: str, render: Callable[[], RenderedResponse]) -> RenderedResponse:
+        """
+        Ejecuta `render` una sola vez por clave y devuelve la respuesta guardada en las repeticiones.
+
+        Args:
+            key (str): Clave de idempotencia enviada por el cliente.
+            fingerprint (str): Huella de la solicitud; una clave reutilizada con otro contenido se rechaza.
+            render (Callable[[], RenderedResponse]): Función que ejecuta el endpoint.
+
+        Returns:
+            RenderedResponse: Respuesta original, la guardada, o un error `409`/`422`.
+        """
+        deadline = time.monotonic() + self.wait_timeout
+        while True:
+            with self._lock:
+                entry = self._get_current(key) or self._pending.get(key)
+                is_leader = entry is None
+                if is_leader:
+                    entry = _Entry(fingerprint)
+                    self._pending[key] = entry
+
+            if entry.fingerprint != fingerprint:
+                return _error(status.HTTP_422_UNPROCESSABLE_ENTITY,
+                              f"La {IDEMPOTENCY_HEADER} ya se usó con una solicitud diferente.")
+
+            if is_leader:
+                return self._run(key, entry, render)
+
+            if not entry.done.wait(max(deadline - time.monotonic(), 0)):
+                return _error(status.HTTP_409_CONFLICT,
+                              f"Una solicitud con la misma {IDEMPOTENCY_HEADER} sigue en proceso.")
+            if entry.response is not None:
+                headers = {name: value for name, value in entry.response.headers.items()
+                           if name.lower() != REPLAYED_HEADER.lower()}
+                return dataclasses.replace(entry.response, headers={**headers, REPLAYED_HEADER: "true"})
+            # La primera solicitud falló sin guardar respuesta: se vuelve a intentar como líder
+
+    def _run(self, key: str, entry: _Entry, render: Callable[[], RenderedResponse]) -> RenderedResponse:
+        response = None
+        try:
+            response = render()
+            return response
+        finally:
+            with self._lock:
+                del self._pending[key]
+                if response is not None and response.status_code < status.HTTP_500_INTERNAL_SERVER_ERROR:
+                    entry.response = response
+                    entry.expires_at = time.monotonic() + self.ttl
+                    self._entries[key] = entry
+                    self._evict()
+            entry.done.set()
+
+    def _get_current(self, key: str) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        return entry
+
+    def _evict(self):
+        # Las entradas se insertan en orden de expiración: las más antiguas están al inicio
+        now = time.monotonic()
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if entry.expires_at > now and len(self._entries) <= self.max_entries:
+                break
+            del self._entries[key]
+
+
+def _error(status_code: int, message: str) -> RenderedResponse:
+    return RenderedResponse.from_api_response(ApiResponse(statusCode=status_code, success=False, message=message))
+
+
+def _fingerprint(request: Request, kwargs: dict) -> str:
+    """Huella de la solicitud a partir de su ruta y de los cuerpos ya validados por FastAPI."""
+    digest = hashlib.blake2b(f"{request.method} {request.url.path}".encode(), digest_size=16)
+    for name in sorted(kwargs):
+        if isinstance(kwargs[name], BaseModel):
+            digest.update(name.encode())
+            digest.update(kwargs[name].model_dump_json().encode())
+    return digest.hexdigest()
+
+
+def _render_with_headers(render: Callable[[], ApiResponse], kwargs: dict) -> RenderedResponse:
+    """Serializa la respuesta del endpoint conservando los encabezados que agregó a su parámetro `Response`."""
+    rendered = RenderedResponse.from_api_response(render())
+    extra = {name: value for kwarg in kwargs.values() if isinstance(kwarg, Response)
+             for name, value in kwarg.headers.items()}
+    return dataclasses.replace(rendered, headers={**rendered.headers, **extra}) if extra else rendered
+
+
+def idempotent_response(store: IdempotencyStore):
+    """
+    Decorador para endpoints de escritura que devuelven `ApiResponse`, que respeta el encabezado `Idempotency-Key`.
+
+    Sin el encabezado, el endpoint se ejecuta normalmente. Con él, las repeticiones de la misma
+    solicitud atendidas por este worker devuelven la respuesta original (con
+    `Idempotent-Replayed: true`) sin volver a ejecutar el endpoint ni consultar la base de datos.
+    El almacén es propio de cada worker: entre workers, el endpoint debe ser idempotente por sí
+    mismo (ver `LegendBL.create`) y puede marcar la repetición con el encabezado en su `Response`.
+
+    Args:
+        store (IdempotencyStore): Almacén de respuestas a utilizar.
+
+    Returns:
+        Callable: Decorador para el endpoint.
+    """
+    def decorator(endpoint: Callable):
+        def handle(request: Request, render: Callable[[], ApiResponse], kwargs: dict):
+            key = request.headers.get(IDEMPOTENCY_HEADER)
+            if key is None:
+                return RenderedResponse.from_api_response(render())
+            if not key or len(key) > MAX_KEY_LENGTH:
+                return _error(status.HTTP_400_BAD_REQUEST,
+                              f"La {IDEMPOTENCY_HEADER} debe tener entre 1 y {MAX_KEY_LENGTH} caracteres.")
+
+            return store.execute(key, _fingerprint(request, kwargs), lambda: _render_with_headers(render, kwargs))
+
+        return rendered_endpoint(endpoint, handle, pass_kwargs=True)
+
+    return decorator
+
+
+# Almacén compartido por los endpoints de escritura de leyendas
+legends_idempotency_store = IdempotencyStore(
+    ttl=settings.idempotency_ttl,
+    max_entries=settings.idempotency_max_entries,
+    wait_timeout=settings.idempotency_wait_timeout,
+)
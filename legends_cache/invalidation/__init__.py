@@ -0,0 +1,37 @@
+from legends_cache.cache_versions import cache_versions, CATALOG_NAMESPACE, LEGENDS_NAMESPACE
+from legends_config.settings import settings
+from .invalidation_bus import InvalidationBus
+from .transports import (InvalidationTransport, LocalTransport, UnixSocketTransport,
+                         PubSubClient, PubSubTransport, InMemoryPubSub)
+
+
+def create_transport() -> InvalidationTransport:
+    """
+    Crea el transporte configurado en `Settings.invalidation_transport`.
+
+    Returns:
+        InvalidationTransport: Transporte por sockets Unix entre los workers del host, o local.
+    """
+    if settings.invalidation_transport == "unix":
+        return UnixSocketTransport(settings.invalidation_socket_dir)
+    return LocalTransport()
+
+
+invalidation_bus = InvalidationBus(create_transport())
+
+# Las cachés versionadas se invalidan incrementando la versión de su espacio de nombres
+invalidation_bus.subscribe(CATALOG_NAMESPACE, lambda key: cache_versions.bump(CATALOG_NAMESPACE))
+invalidation_bus.subscribe(LEGENDS_NAMESPACE, lambda key: cache_versions.bump(LEGENDS_NAMESPACE))
+
+
+def legend_key(legend_id) -> str:
+    """
+    Clave de invalidación de una leyenda.
+
+    Args:
+        legend_id: Identificador único de la leyenda.
+
+    Returns:
+        str: Clave con el formato `legends:<id>`.
+    """
+    return f"{LEGENDS_NAMESPACE}:{legend_id}"
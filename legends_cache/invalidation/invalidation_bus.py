@@ -0,0 +1,74 @@
+import logging
+import threading
+from typing import Callable, List, Tuple
+from legends_cache.invalidation.transports import InvalidationTransport, LocalTransport
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidationBus:
+    """
+    Canal de eventos de invalidación de cachés.
+
+    Las cachés se suscriben por prefijo de clave; `publish` entrega la clave de inmediato a los
+    suscriptores del propio proceso y la difunde por el transporte a los demás workers, que la
+    entregan a sus suscriptores al recibirla.
+    """
+
+    def __init__(self, transport: InvalidationTransport = None):
+        self.transport = transport or LocalTransport()
+        self._subscribers: List[Tuple[str, Callable[[str], None]]] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, prefix: str, callback: Callable[[str], None]):
+        """
+        Registra una función que se llamará con cada clave invalidada que empiece por `prefix`.
+
+        Args:
+            prefix (str): Prefijo de las claves de interés.
+            callback (Callable[[str], None]): Función que recibe la clave invalidada.
+        """
+        with self._lock:
+            self._subscribers.append((prefix, callback))
+
+    def publish(self, key: str):
+        """
+        Invalida una clave en este proceso y en los demás workers.
+
+        Un fallo del transporte se registra pero no interrumpe la operación que invalidó.
+
+        Args:
+            key (str): Clave invalidada (por ejemplo, `legends:<id>` o `catalog`).
+        """
+        self._dispatch(key)
+        try:
+            self.transport.publish(key.encode())
+        except Exception as e:
+            logger.warning("No se pudo difundir la invalidación '%s': %s", key, e)
+
+    def start(self):
+        """
+        Comienza a recibir las invalidaciones de los demás workers.
+
+        Si el transporte no puede iniciarse (por ejemplo, sin soporte de sockets Unix), se
+        registra una advertencia y el canal sigue funcionando solo dentro del proceso.
+        """
+        try:
+            self.transport.start(lambda data: self._dispatch(data.decode()))
+        except Exception as e:
+            logger.warning("No se pudo iniciar el transporte de invalidaciones, se usará solo el proceso local: %s", e)
+            self.transport = LocalTransport()
+
+    def close(self):
+        """Deja de recibir invalidaciones y libera el transporte."""
+        self.transport.close()
+
+    def _dispatch(self, key: str):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for prefix, callback in subscribers:
+            if key.startswith(prefix):
+                try:
+                    callback(key)
+                except Exception as e:
+                    logger.warning("Fallo al procesar la invalidación '%s': %s", key, e)
@@ -0,0 +1,159 @@
+import logging
+import os
+import socket
+import threading
+from typing import Callable, List, Protocol
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidationTransport:
+    """
+    Interfaz de transporte para difundir invalidaciones entre workers.
+
+    Un transporte entrega cada mensaje publicado a los demás procesos suscritos, pero no al
+    proceso que lo publicó (la entrega local la hace `InvalidationBus`).
+    """
+
+    def start(self, on_message: Callable[[bytes], None]):
+        """Comienza a recibir mensajes de otros procesos y los entrega a `on_message`."""
+
+    def publish(self, message: bytes):
+        """Difunde un mensaje a los demás procesos."""
+
+    def close(self):
+        """Deja de recibir mensajes y libera los recursos del transporte."""
+
+
+class LocalTransport(InvalidationTransport):
+    """Transporte que no difunde nada: las invalidaciones solo llegan al propio proceso."""
+
+
+class UnixSocketTransport(InvalidationTransport):
+    """
+    Transporte entre workers del mismo host mediante sockets Unix de datagramas.
+
+    Cada worker crea `<directorio>/<pid>.sock`; publicar envía el mensaje a todos los sockets
+    del directorio salvo el propio. Los sockets de procesos que ya no existen se eliminan al
+    detectarse. El envío no bloquea: si el búfer de un receptor está lleno, el mensaje a ese
+    receptor se descarta y se registra una advertencia.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.path = None
+        self._socket = None
+        self._sender = None
+        self._closed = threading.Event()
+
+    def start(self, on_message: Callable[[bytes], None]):
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        self.path = os.path.join(self.directory, f"{os.getpid()}.sock")
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._socket.bind(self.path)
+        self._socket.settimeout(0.5)
+        threading.Thread(target=self._receive, args=(on_message,), daemon=True,
+                         name="invalidation-receiver").start()
+
+    def _receive(self, on_message: Callable[[bytes], None]):
+        while not self._closed.is_set():
+            try:
+                data = self._socket.recv(65536)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            on_message(data)
+
+    def publish(self, message: bytes):
+        if not os.path.isdir(self.directory):
+            return
+        if self._sender is None:
+            self._sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            self._sender.setblocking(False)
+
+        for name in os.listdir(self.directory):
+            target = os.path.join(self.directory, name)
+            if not name.endswith(".sock") or target == self.path:
+                continue
+            try:
+                self._sender.sendto(message, target)
+            except (ConnectionRefusedError, FileNotFoundError):
+                # El worker dueño del socket ya no existe
+                try:
+                    os.unlink(target)
+                except OSError:
+                    pass
+            except BlockingIOError:
+                logger.warning("Invalidación descartada: el búfer de %s está lleno", target)
+
+    def close(self):
+        self._closed.set()
+        for sock in (self._socket, self._sender):
+            if sock is not None:
+                sock.close()
+        if self.path and os.path.exists(self.path):
+            os.unlink(self.path)
+
+
+class PubSubClient(Protocol):
+    """
+    Cliente de un sistema de publicación/suscripción externo (por ejemplo, Redis).
+
+    Basta con adaptar el cliente real a estos dos métodos para usarlo con `PubSubTransport`.
+    """
+
+    def publish(self, channel: str, message: bytes): ...
+
+    def subscribe(self, channel: str, callback: Callable[[bytes], None]): ...
+
+
+class PubSubTransport(InvalidationTransport):
+    """
+    Transporte sobre un sistema de publicación/suscripción externo, para invalidar entre hosts.
+
+    Cada mensaje lleva el PID y un identificador de instancia como prefijo, para descartar los
+    mensajes propios que el sistema externo devuelve al publicador.
+    """
+
+    def __init__(self, client: PubSubClient, channel: str = "legends-invalidation"):
+        self.client = client
+        self.channel = channel
+        self._origin = f"{os.getpid()}-{id(self)}".encode()
+
+    def start(self, on_message: Callable[[bytes], None]):
+        def receive(data: bytes):
+            origin, _, message = data.partition(b"|")
+            if origin != self._origin:
+                on_message(message)
+
+        self.client.subscribe(self.channel, receive)
+
+    def publish(self, message: bytes):
+        self.client.publish(self.channel, self._origin + b"|" + message)
+
+
+class InMemoryPubSub:
+    """
+    Sustituto local de un sistema de publicación/suscripción externo.
+
+    Entrega los mensajes de forma síncrona a todos los suscriptores del canal dentro del mismo
+    proceso; permite probar varios `InvalidationBus` (uno por "worker") sin infraestructura.
+    """
+
+    def __init__(self):
+        self._subscribers: dict = {}
+        self._lock = threading.Lock()
+
+    def publish(self, channel: str, message: bytes):
+        with self._lock:
+            callbacks: List[Callable] = list(self._subscribers.get(channel, []))
+        for callback in callbacks:
+            callback(message)
+
+    def subscribe(self, channel: str, callback: Callable[[bytes], None]):
+        with self._lock:
+            self._subscribers.setdefault(channel, []).append(callback)
@@ -0,0 +1,203 @@
+import re
+import threading
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+from legends_cache.cache_versions import CATALOG_NAMESPACE
+from legends_cache.invalidation import invalidation_bus
+from legends_config.settings import settings
+
+# Candidatos por trigramas que se puntúan con distancia de edición por cada resultado pedido
+CANDIDATES_PER_RESULT = 2
+
+
+def fold_name(name: str) -> str:
+    """
+    Normaliza un nombre para compararlo: sin tildes, en minúsculas y con los espacios y signos
+    reducidos a un solo espacio (`"  Pérez  Zeledón"` → `"perez zeledon"`).
+
+    Args:
+        name (str): Nombre a normalizar.
+
+    Returns:
+        str: Nombre normalizado.
+    """
+    text = "".join(c for c in unicodedata.normalize("NFKD", name) if not unicodedata.combining(c))
+    return " ".join(re.sub(r"[\W_]+", " ", text.casefold()).split())
+
+
+def trigrams(folded: str) -> Set[str]:
+    """Trigramas de cada palabra, con relleno al inicio y al final como en `pg_trgm`."""
+    grams = set()
+    for word in folded.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Distancia de edición entre dos textos; intercambiar dos letras vecinas cuenta como un solo error."""
+    before_previous, previous = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        char_a, prev_char_a = a[i - 1], a[i - 2] if i > 1 else None
+        current, left = [i], i
+        for j in range(1, len(b) + 1):
+            char_b = b[j - 1]
+            value = previous[j - 1] + (char_a != char_b)
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if left + 1 < value:
+                value = left + 1
+            if j > 1 and char_a == b[j - 2] and prev_char_a == char_b and before_previous[j - 2] + 1 < value:
+                value = before_previous[j - 2] + 1
+            current.append(value)
+            left = value
+        before_previous, previous = previous, current
+    return previous[-1]
+
+
+class NameMatch(NamedTuple):
+    """Coincidencia de una búsqueda por nombre, con una puntuación entre 0 y 1."""
+    id: int
+    name: str
+    score: float
+
+
+class NameIndex:
+    """
+    Índice en memoria de nombres del catálogo (provincias, cantones) tolerante a errores de escritura.
+
+    Los nombres se normalizan con `fold_name`, de modo que las tildes, mayúsculas y espacios no
+    importan. Un índice invertido de trigramas reduce los candidatos y cada candidato se puntúa con
+    la mayor entre la similitud de trigramas (Dice) y la similitud por distancia de edición.
+
+    El índice se reconstruye cuando cambia el catálogo (invalidación `catalog`). Quien lo
+    reconstruye debe tomar `refresh_lock`, marcarlo con `start_rebuild` y solo entonces leer los
+    nombres, para que una invalidación que llegue durante la lectura no se pierda.
+    """
+
+    def __init__(self, min_score: float = 0.8, suggest_min_score: float = 0.4, max_suggestions: int = 5):
+        self.min_score = min_score
+        self.suggest_min_score = suggest_min_score
+        self.max_suggestions = max_suggestions
+        self.refresh_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._stale = True
+        self._entries: List[Tuple[int, str, str, Set[str]]] = []
+        self._exact: Dict[str, List[int]] = {}
+        self._by_trigram: Dict[str, List[int]] = {}
+
+    def needs_rebuild(self) -> bool:
+        """Indica si el índice debe reconstruirse (al iniciar o tras un cambio del catálogo)."""
+        return self._stale
+
+    def mark_stale(self, key: Optional[str] = None):
+        """Marca el índice para reconstruirse antes de la siguiente búsqueda."""
+        with self._lock:
+            self._stale = True
+
+    def start_rebuild(self):
+        """Marca el índice como al día antes de leer los nombres de la reconstrucción."""
+        with self._lock:
+            self._stale = False
+
+    def rebuild(self, names: Iterable[Tuple[int, str]]):
+        """
+        Reconstruye el índice completo.
+
+        Args:
+            names: Tuplas `(id, nombre)` de todos los registros.
+        """
+        entries, exact, by_trigram = [], defaultdict(list), defaultdict(list)
+        for record_id, name in names:
+            folded = fold_name(name or "")
+            grams = trigrams(folded)
+            position = len(entries)
+            entries.append((record_id, (name or "").strip(), folded, grams))
+            exact[folded].append(position)
+            for gram in grams:
+                by_trigram[gram].append(position)
+
+        # Se reemplazan de una vez para que las búsquedas concurrentes vean un índice completo
+        self._entries, self._exact, self._by_trigram = entries, dict(exact), dict(by_trigram)
+
+    def search(self, name: str, limit: int) -> List[NameMatch]:
+        """
+        Busca los nombres más parecidos al recibido.
+
+        Args:
+            name (str): Nombre a buscar, posiblemente con errores de escritura.
+            limit (int): Cantidad máxima de coincidencias a devolver.
+
+        Returns:
+            List[NameMatch]: Coincidencias con puntuación de al menos `suggest_min_score`, de la mejor a la peor.
+        """
+        entries, exact = self._entries, self._exact
+        folded = fold_name(name)
+        if folded in exact:
+            return [NameMatch(entries[i][0], entries[i][1], 1.0) for i in exact[folded]][:limit]
+
+        grams = trigrams(folded)
+        shared = defaultdict(int)
+        for gram in grams:
+            for position in self._by_trigram.get(gram, ()):
+                shared[position] += 1
+
+        # La distancia de edición, más costosa, solo se calcula para los candidatos con más trigramas en común
+        candidates = sorted(((2 * count / (len(grams) + len(entries[position][3])), position)
+                             for position, count in shared.items()), reverse=True)[:limit * CANDIDATES_PER_RESULT]
+
+        matches = []
+        for dice, position in candidates:
+            record_id, original, candidate, _ = entries[position]
+            longest = max(len(folded), len(candidate))
+            score = dice
+            # La diferencia de largo acota la similitud por edición: si no puede superar a Dice, no se calcula
+            if 1 - abs(len(folded) - len(candidate)) / longest > dice:
+                score = max(dice, 1 - edit_distance(folded, candidate) / longest)
+            score = round(score, 3)
+            if score >= self.suggest_min_score:
+                matches.append(NameMatch(record_id, original, score))
+
+        matches.sort(key=lambda x: (-x.score, x.name))
+        return matches[:limit]
+
+    def resolve(self, name: str) -> Tuple[Optional[NameMatch], List[NameMatch]]:
+        """
+        Resuelve un nombre al registro que le corresponde.
+
+        Se acepta la mejor coincidencia si es exacta (tras normalizar) o si alcanza `min_score` y
+        supera claramente a la segunda; en otro caso se devuelven sugerencias.
+
+        Args:
+            name (str): Nombre a resolver.
+
+        Returns:
+            Tuple[Optional[NameMatch], List[NameMatch]]: La coincidencia elegida (o `None`) y las sugerencias ordenadas.
+        """
+        matches = self.search(name, self.max_suggestions)
+        if not matches:
+            return None, []
+
+        best = matches[0]
+        if best.score == 1.0:
+            return best, matches
+        ambiguous = len(matches) > 1 and matches[1].score >= best.score - 0.05
+        if best.score >= self.min_score and not ambiguous:
+            return best, matches
+        return None, matches
+
+
+def _catalog_name_index() -> NameIndex:
+    index = NameIndex(
+        min_score=settings.fuzzy_match_min_score,
+        suggest_min_score=settings.fuzzy_suggest_min_score,
+        max_suggestions=settings.fuzzy_max_suggestions,
+    )
+    invalidation_bus.subscribe(CATALOG_NAMESPACE, index.mark_stale)
+    return index
+
+
+# Instancias únicas por worker, reconstruidas al cambiar el catálogo
+province_name_index = _catalog_name_index()
+canton_name_index = _catalog_name_index()
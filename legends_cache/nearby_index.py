@@ -0,0 +1,177 @@
+import heapq
+import math
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from legends_cache.cache_versions import CATALOG_NAMESPACE, LEGENDS_NAMESPACE
+from legends_cache.invalidation import invalidation_bus
+from legends_config.settings import settings
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = 111.32
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Distancia en kilómetros entre dos puntos sobre la superficie terrestre.
+
+    Args:
+        lat1, lon1 (float): Coordenadas del primer punto, en grados.
+        lat2, lon2 (float): Coordenadas del segundo punto, en grados.
+
+    Returns:
+        float: Distancia en kilómetros.
+    """
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = (math.sin((phi2 - phi1) / 2) ** 2
+         + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+class NearbyIndex:
+    """
+    Índice espacial en memoria de leyendas por el centroide de su distrito.
+
+    Los centroides se agrupan en una cuadrícula de celdas de `cell_km` kilómetros; una búsqueda
+    solo revisa las celdas que cubren el radio y calcula la distancia exacta a esos distritos.
+    Cada distrito guarda los IDs de sus leyendas activas.
+
+    El índice se reconstruye completo cuando cambia el catálogo (invalidación `catalog`) y se
+    actualiza leyenda por leyenda cuando se crea, modifica o elimina una (`legends:<id>`): esas
+    leyendas quedan pendientes y se releen antes de la siguiente búsqueda.
+
+    Quien pone el índice al día desde la base de datos debe hacerlo con `refresh_lock` tomado, para
+    que dos reconstrucciones no se pisen y las relecturas se apliquen en el orden en que se hicieron.
+    """
+
+    def __init__(self, cell_km: float = 10.0):
+        self.cell_degrees = cell_km / KM_PER_DEGREE
+        self.refresh_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._stale = True
+        self._dirty: Set[str] = set()
+        self._centroids: Dict[int, Tuple[float, float]] = {}
+        self._cells: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        self._legends_by_district: Dict[int, Set[str]] = defaultdict(set)
+        self._district_by_legend: Dict[str, int] = {}
+
+    def needs_rebuild(self) -> bool:
+        """Indica si el índice debe reconstruirse (al iniciar o tras un cambio del catálogo)."""
+        return self._stale
+
+    def needs_refresh(self) -> bool:
+        """Indica si hay que reconstruir el índice o releer leyendas pendientes."""
+        return self._stale or bool(self._dirty)
+
+    def mark_stale(self, key: Optional[str] = None):
+        """Marca el índice para reconstruirse antes de la siguiente búsqueda."""
+        with self._lock:
+            self._stale = True
+
+    def start_rebuild(self):
+        """
+        Marca el índice como al día y descarta las leyendas pendientes, antes de leer los datos de la
+        reconstrucción: las invalidaciones que lleguen durante la lectura vuelven a marcarlo.
+        """
+        with self._lock:
+            self._stale = False
+            self._dirty = set()
+
+    def mark_dirty(self, key: str):
+        """Marca una leyenda (clave `legends:<id>`) para releerse antes de la siguiente búsqueda."""
+        legend_id = key.split(":", 1)[1] if ":" in key else None
+        if legend_id:
+            with self._lock:
+                self._dirty.add(legend_id)
+
+    def take_dirty(self) -> List[str]:
+        """Devuelve y limpia los IDs de leyendas pendientes de releer."""
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+        return list(dirty)
+
+    def rebuild(self, centroids: Iterable[Tuple[int, float, float]], legends: Iterable[Tuple[str, int]]):
+        """
+        Reconstruye el índice completo.
+
+        Args:
+            centroids: Tuplas `(district_id, latitud, longitud)` de los distritos con coordenadas.
+            legends: Tuplas `(legend_id, district_id)` de las leyendas activas.
+        """
+        new_centroids = {district_id: (lat, lon) for district_id, lat, lon in centroids}
+        cells = defaultdict(list)
+        for district_id, (lat, lon) in new_centroids.items():
+            cells[self._cell(lat, lon)].append(district_id)
+
+        legends_by_district = defaultdict(set)
+        district_by_legend = {}
+        for legend_id, district_id in legends:
+            legends_by_district[district_id].add(legend_id)
+            district_by_legend[legend_id] = district_id
+
+        with self._lock:
+            self._centroids = new_centroids
+            self._cells = cells
+            self._legends_by_district = legends_by_district
+            self._district_by_legend = district_by_legend
+
+    def update_legends(self, legend_ids: Iterable[str], active: Iterable[Tuple[str, int]]):
+        """
+        Actualiza la ubicación de algunas leyendas.
+
+        Args:
+            legend_ids: IDs de las leyendas releídas.
+            active: Tuplas `(legend_id, district_id)` de las que siguen activas; el resto se retira.
+        """
+        active = dict(active)
+        with self._lock:
+            for legend_id in legend_ids:
+                previous = self._district_by_legend.pop(legend_id, None)
+                if previous is not None:
+                    self._legends_by_district[previous].discard(legend_id)
+                district_id = active.get(legend_id)
+                if district_id is not None:
+                    self._legends_by_district[district_id].add(legend_id)
+                    self._district_by_legend[legend_id] = district_id
+
+    def search(self, lat: float, lon: float, radius_km: float, limit: int) -> List[Tuple[str, int, float]]:
+        """
+        Busca las leyendas de los distritos cuyo centroide está dentro del radio.
+
+        Args:
+            lat (float): Latitud del punto de búsqueda.
+            lon (float): Longitud del punto de búsqueda.
+            radius_km (float): Radio en kilómetros.
+            limit (int): Cantidad máxima de leyendas a devolver.
+
+        Returns:
+            List[Tuple[str, int, float]]: Tuplas `(legend_id, district_id, distancia_km)`, de la más cercana a la más lejana.
+        """
+        lat_span = radius_km / KM_PER_DEGREE
+        lon_span = radius_km / (KM_PER_DEGREE * max(math.cos(math.radians(lat)), 1e-6))
+        min_cell = self._cell(lat - lat_span, lon - lon_span)
+        max_cell = self._cell(lat + lat_span, lon + lon_span)
+
+        results = []
+        with self._lock:
+            for cell_lat in range(min_cell[0], max_cell[0] + 1):
+                for cell_lon in range(min_cell[1], max_cell[1] + 1):
+                    for district_id in self._cells.get((cell_lat, cell_lon), ()):
+                        legend_ids = self._legends_by_district.get(district_id)
+                        if not legend_ids:
+                            continue
+                        d_lat, d_lon = self._centroids[district_id]
+                        distance = haversine_km(lat, lon, d_lat, d_lon)
+                        if distance <= radius_km:
+                            results.extend((legend_id, district_id, distance) for legend_id in legend_ids)
+
+        return heapq.nsmallest(limit, results, key=lambda x: (x[2], x[0]))
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        return math.floor(lat / self.cell_degrees), math.floor(lon / self.cell_degrees)
+
+
+# Instancia única por worker, mantenida al día por el canal de invalidación
+nearby_index = NearbyIndex(cell_km=settings.nearby_cell_km)
+invalidation_bus.subscribe(CATALOG_NAMESPACE, nearby_index.mark_stale)
+invalidation_bus.subscribe(f"{LEGENDS_NAMESPACE}:", nearby_index.mark_dirty)
@@ -0,0 +1,184 @@
+import functools
+import hashlib
+import inspect
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict
+from fastapi import Request, Response, status
+from legends_cache.cache_versions import cache_versions
+from legends_entities.responses import ApiResponse
+from legends_observability import instrumented
+
+
+@instrumented("serialization")
+@dataclass(frozen=True)
+class RenderedResponse:
+    """
+    Respuesta ya serializada, lista para enviarse tal cual.
+
+    Atributos:
+        body (bytes): Cuerpo JSON codificado.
+        status_code (int): Código de estado HTTP de la respuesta.
+        headers (Dict[str, str]): Encabezados de la respuesta, incluido el `ETag`.
+        version (int): Versión del espacio de nombres con la que se generó.
+    """
+    body: bytes
+    status_code: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    version: int = 0
+
+    @property
+    def etag(self) -> str:
+        return self.headers["ETag"]
+
+    def to_response(self, request: Request) -> Response:
+        """
+        Construye la respuesta HTTP, devolviendo `304 Not Modified` si el cliente ya tiene esta versión.
+
+        Args:
+            request (Request): Solicitud entrante, de la que se lee `If-None-Match`.
+
+        Returns:
+            Response: Respuesta cruda que no pasa por la validación de pydantic.
+        """
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and self.status_code == status.HTTP_200_OK:
+            tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+            if self.etag in tags or "*" in tags:
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": self.etag})
+
+        return Response(content=self.body, status_code=self.status_code,
+                        media_type="application/json", headers=self.headers)
+
+    @staticmethod
+    def from_api_response(api_response: ApiResponse, version: int = 0) -> "RenderedResponse":
+        """
+        Serializa un `ApiResponse` y calcula su `ETag` a partir del contenido.
+
+        Args:
+            api_response (ApiResponse): Respuesta a serializar.
+            version (int): Versión del espacio de nombres con la que se generó.
+
+        Returns:
+            RenderedResponse: Respuesta serializada.
+        """
+        body = api_response.model_dump_json().encode()
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        return RenderedResponse(body=body, status_code=api_response.statusCode,
+                                headers={"ETag": etag}, version=version)
+
+
+class RenderedCache:
+    """
+    Caché de respuestas serializadas asociada a un espacio de nombres de `CacheVersions`.
+
+    Cada entrada se reconstruye solo cuando la versión del espacio de nombres cambia; mientras
+    tanto, las lecturas devuelven los mismos bytes sin consultar la base de datos ni serializar.
+    Solo se guardan las respuestas `200`: los errores, como los `404` de nombres inexistentes,
+    llenarían la caché con claves arbitrarias y desplazarían a las respuestas útiles.
+    """
+
+    def __init__(self, namespace: str, max_entries: int = 1024, lock_stripes: int = 16):
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, RenderedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Candados por grupo de claves: solo un hilo genera cada entrada, sin bloquear otras claves
+        self._render_locks = [threading.Lock() for _ in range(lock_stripes)]
+
+    def _get_current(self, key: str, version: int):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.version != version:
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def get_or_render(self, key: str, render: Callable[[], ApiResponse]) -> RenderedResponse:
+        """
+        Obtiene la respuesta en caché para `key`, generándola con `render` si no existe o está desactualizada.
+
+        Args:
+            key (str): Clave de la entrada (ruta y parámetros).
+            render (Callable[[], ApiResponse]): Función que produce la respuesta a serializar.
+
+        Returns:
+            RenderedResponse: Respuesta serializada vigente.
+        """
+        version = cache_versions.get(self.namespace)
+        entry = self._get_current(key, version)
+        if entry is not None:
+            return entry
+
+        with self._render_locks[hash(key) % len(self._render_locks)]:
+            entry = self._get_current(key, version)
+            if entry is not None:
+                return entry
+
+            entry = RenderedResponse.from_api_response(render(), version)
+            if entry.status_code != status.HTTP_200_OK:
+                return entry
+
+            with self._lock:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            return entry
+
+
+def rendered_endpoint(endpoint: Callable, handle: Callable[..., RenderedResponse], pass_kwargs: bool = False):
+    """
+    Envuelve un endpoint que devuelve `ApiResponse` para que responda con bytes ya serializados.
+
+    Agrega `request` a la firma si el endpoint no lo recibe, de modo que FastAPI siga resolviendo
+    los mismos parámetros y dependencias.
+
+    Args:
+        endpoint (Callable): Endpoint original.
+        handle (Callable): Función que recibe la solicitud y una función que ejecuta el endpoint, y devuelve la respuesta serializada.
+        pass_kwargs (bool): Si es `True`, `handle` recibe además los parámetros ya resueltos del endpoint.
+
+    Returns:
+        Callable: Endpoint envuelto.
+    """
+    signature = inspect.signature(endpoint)
+    endpoint_takes_request = "request" in signature.parameters
+    parameters = list(signature.parameters.values())
+    if not endpoint_takes_request:
+        parameters.insert(0, inspect.Parameter(
+            "request", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Request))
+
+    @functools.wraps(endpoint)
+    def wrapper(request: Request, **kwargs):
+        if endpoint_takes_request:
+            kwargs["request"] = request
+
+        if pass_kwargs:
+            rendered = handle(request, lambda: endpoint(**kwargs), kwargs)
+        else:
+            rendered = handle(request, lambda: endpoint(**kwargs))
+        return rendered.to_response(request)
+
+    wrapper.__signature__ = signature.replace(parameters=parameters)
+    return wrapper
+
+
+def cached_response(cache: RenderedCache):
+    """
+    Decorador para endpoints que devuelven `ApiResponse`, que guarda la respuesta serializada por ruta y parámetros de ruta.
+
+    En un acierto se devuelve una `Response` cruda, por lo que se omiten el mapeo, la
+    construcción de `ApiResponse`, la validación del `response_model` y la codificación JSON.
+
+    Args:
+        cache (RenderedCache): Caché donde se guardan las respuestas.
+
+    Returns:
+        Callable: Decorador para el endpoint.
+    """
+    def decorator(endpoint: Callable):
+        return rendered_endpoint(endpoint, lambda request, render: cache.get_or_render(request.url.path, render))
+
+    return decorator
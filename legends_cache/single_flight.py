@@ -0,0 +1,102 @@
+import threading
+import time
+from typing import Callable, Dict
+from fastapi import Request
+from legends_cache.rendered_cache import RenderedResponse, rendered_endpoint
+from legends_config.settings import settings
+
+# Métodos de solo lectura; las escrituras nunca se agrupan
+READ_METHODS = {"GET", "HEAD"}
+
+
+class _Call:
+    """Llamada en curso compartida por el líder y los seguidores de una misma clave."""
+
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.done = threading.Event()
+        self.result = None
+        self.failed = False
+
+
+class SingleFlight:
+    """
+    Agrupa llamadas concurrentes idénticas en una sola ejecución.
+
+    La primera llamada para una clave (el líder) ejecuta la función; las que llegan mientras
+    sigue en curso (los seguidores) esperan y reciben el mismo resultado. Un seguidor solo se
+    une a una llamada iniciada hace menos de `window` segundos, y espera como máximo `max_wait`
+    segundos; si el líder falla o tarda más, el seguidor ejecuta la función por su cuenta.
+    """
+
+    def __init__(self, window: float, max_wait: float):
+        self.window = window
+        self.max_wait = max_wait
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable):
+        """
+        Ejecuta `fn` o reutiliza el resultado de una ejecución en curso con la misma clave.
+
+        Args:
+            key (str): Clave que identifica llamadas idénticas.
+            fn (Callable): Función a ejecutar.
+
+        Returns:
+            El resultado de `fn`, propio o compartido.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None or time.monotonic() - call.started_at > self.window
+            if is_leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not is_leader:
+            if call.done.wait(self.max_wait) and not call.failed:
+                return call.result
+            return fn()
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException:
+            call.failed = True
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+
+
+def coalesced_response(single_flight: SingleFlight):
+    """
+    Decorador para endpoints de lectura que devuelven `ApiResponse`, que agrupa las solicitudes idénticas concurrentes.
+
+    La clave es la ruta con su cadena de consulta; las solicitudes agrupadas comparten una sola
+    ejecución del endpoint (y de su consulta a la base de datos) y la misma respuesta
+    serializada. Las solicitudes que no son `GET`/`HEAD` se ejecutan siempre por separado.
+
+    Args:
+        single_flight (SingleFlight): Agrupador a utilizar.
+
+    Returns:
+        Callable: Decorador para el endpoint.
+    """
+    def handle(request: Request, render: Callable):
+        if request.method not in READ_METHODS:
+            return RenderedResponse.from_api_response(render())
+
+        key = f"{request.url.path}?{request.url.query}"
+        return single_flight.do(key, lambda: RenderedResponse.from_api_response(render()))
+
+    def decorator(endpoint: Callable):
+        return rendered_endpoint(endpoint, handle)
+
+    return decorator
+
+
+# Agrupador compartido por los endpoints de lectura de leyendas
+legends_single_flight = SingleFlight(window=settings.coalesce_window, max_wait=settings.coalesce_max_wait)
@@ -1,5 +1,6 @@
 # Importación de módulos necesarios de SQLAlchemy
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 
@@ -7,7 +8,31 @@ from sqlalchemy.ext.declarative import declarative_base
 from legends_config.settings import settings
 
 SQLACHEMY_DATABASE_URL = settings.database_url
-engine = create_engine(SQLACHEMY_DATABASE_URL)
+
+
+def pool_options(database_url: str) -> dict:
+    """
+    Opciones del pool de conexiones según la configuración.
+
+    SQLite en memoria usa un pool de una sola conexión que no admite estas opciones.
+
+    Args:
+        database_url (str): URL de conexión de la base de datos.
+
+    Returns:
+        dict: Argumentos de `create_engine` para el pool.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+    }
+
+
+engine = create_engine(SQLACHEMY_DATABASE_URL, **pool_options(SQLACHEMY_DATABASE_URL))
 
 # Configuración de la sesión con SQLAlchemy
 # - autocommit=False: Los cambios no se confirman automáticamente
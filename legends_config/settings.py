@@ -1,9 +1,113 @@
+import tempfile
+from typing import Literal, Optional
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 # Clase de configuración que hereda de BaseSettings.
 class Settings(BaseSettings):
     database_url: str
+
+    # Pool de conexiones de SQLAlchemy
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0  # Segundos de espera por una conexión libre
+
+    # Hilos para los endpoints síncronos (limitador de AnyIO)
+    thread_pool_size: Optional[int] = None  # None: db_pool_size + db_max_overflow
+    thread_pool_metrics_enabled: bool = True
+
+    # Almacenamiento de los UUID de leyendas y categorías: texto (CHAR(36)) o binario (BINARY(16))
+    id_storage: Literal["string", "binary"] = "string"
+
+    # Descripciones de leyendas: compresión y extracto para los listados
+    description_compress_threshold: int = 512  # Bytes a partir de los cuales se comprime
+    # Caracteres máximos del extracto; con el "…" final debe caber en la columna excerpt (VARCHAR(300))
+    excerpt_length: int = Field(200, ge=1, le=299)
+
+    # Calentamiento del worker al iniciar (conexiones, consultas y modelos de respuesta)
+    warmup_enabled: bool = True
+    warmup_connections: int = 5
+
+    # Servidor de producción (server.py)
+    server_host: str = "0.0.0.0"
+    server_port: int = 8080
+    server_workers: Optional[int] = None  # None: un worker por núcleo de CPU
+    server_loop: Literal["auto", "asyncio", "uvloop"] = "auto"
+    server_http: Literal["auto", "h11", "httptools"] = "auto"
+    server_keep_alive_timeout: int = 5
+    server_backlog: int = 2048
+    server_graceful_shutdown_timeout: int = 30
+    server_max_requests: Optional[int] = None  # Reciclar el worker tras N solicitudes
+
+    # Caché de respuestas serializadas del catálogo
+    response_cache_max_entries: int = 1024
+
+    # Canal de invalidación de cachés entre workers
+    invalidation_transport: Literal["unix", "local"] = "unix"
+    invalidation_socket_dir: str = f"{tempfile.gettempdir()}/legends-invalidation"
+
+    # Agrupación de lecturas idénticas concurrentes (segundos)
+    coalesce_window: float = 1.0  # Antigüedad máxima de una llamada en curso a la que se unen otras
+    coalesce_max_wait: float = 5.0  # Espera máxima de una solicitud agrupada antes de ejecutar por su cuenta
+
+    # Respuestas guardadas por Idempotency-Key (POST /legends/create)
+    idempotency_ttl: float = 86400.0  # Segundos que se conserva cada respuesta
+    idempotency_max_entries: int = 10000
+    idempotency_wait_timeout: float = 10.0  # Espera máxima de una repetición concurrente antes de responder 409
+
+    # Máximo de identificadores por consulta de leyendas por lote
+    legends_batch_max_ids: int = 100
+
+    # Creación de leyendas con confirmación agrupada (group commit)
+    legends_group_commit_enabled: bool = False
+    legends_group_commit_max_batch: int = 50
+    legends_group_commit_max_delay: float = 0.005  # Segundos que el primer elemento espera a otros
+    legends_group_commit_timeout: float = 10.0  # Segundos que el llamador espera su resultado
+
+    # Búsqueda tolerante a errores de provincias y cantones por nombre
+    fuzzy_match_min_score: float = 0.8  # Puntuación mínima para aceptar un nombre aproximado
+    fuzzy_suggest_min_score: float = 0.4
+    fuzzy_max_suggestions: int = 5
+
+    # Autocompletado de nombres de leyendas (/legends/autocomplete)
+    autocomplete_max_results: int = 20
+
+    # Búsqueda de leyendas cercanas (/legends/nearby)
+    nearby_cell_km: float = 10.0  # Tamaño de las celdas del índice espacial
+    nearby_max_radius_km: float = 100.0
+    nearby_max_results: int = 100
+
+    # Archivo de leyendas eliminadas (tabla legend_archive)
+    legends_archive_batch_size: int = 500
+    legends_archive_on_delete: bool = False  # Mover la leyenda al archivo al eliminarla
+
+    # Feed de cambios de leyendas (/legends/changes)
+    legends_changes_max_limit: int = 500
+    legends_changes_safety_lag: float = 2.0  # Segundos: no se entregan cambios más recientes, que podrían estar sin confirmar
+
+    # Control de admisión por worker
+    admission_enabled: bool = True
+    admission_max_reads: Optional[int] = None  # None: las conexiones que no reservan las escrituras
+    admission_max_writes: Optional[int] = None  # None: un quinto de db_pool_size + db_max_overflow (al menos 1)
+    admission_queue_timeout: float = 2.0  # Segundos de espera antes de rechazar con 503
+    admission_retry_after: int = 1
+    rate_limit_per_second: Optional[float] = None  # Límite por cliente (None: deshabilitado)
+    rate_limit_burst: int = 20
+
+    # Perfilado de solicitudes (opt-in)
+    profiling_secret: Optional[str] = None  # Valor del encabezado X-Profile que activa el perfilado (None: deshabilitado)
+    profiling_sample_rate: float = 0.0  # Fracción de solicitudes perfiladas al azar
+    profiling_dir: Optional[str] = None  # Directorio de los perfiles (None: solo se registran en el log)
+    profiling_top_functions: int = 30
+
+    # Trazas por capa (controlador, BL, mappers, DAL y SQL)
+    tracing_enabled: bool = False
+    tracing_sample_rate: float = 0.01  # Fracción de solicitudes sin traceparent que se trazan
+    tracing_exporter: str = "stdout"  # stdout, file o "modulo:Clase" de un SpanExporter propio
+    tracing_file: str = "traces.jsonl"  # Destino del exportador file
+    tracing_max_statement_length: int = 1000  # Caracteres de cada sentencia SQL guardados en su span
+
     model_config = SettingsConfigDict(
         env_file=".env",
     )
@@ -2,4 +2,6 @@ from .canton_dal import CantonDAL
 from .category_dal import CategoryDAL
 from .district_dal import DistrictDAL
 from .legend_dal import LegendDAL
+from .legend_archive_dal import LegendArchiveDAL
+from .legend_write_queue import LegendWriteQueue, legend_write_queue
 from .province_dal import ProvinceDAL
\ No newline at end of file
@@ -1,8 +1,11 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from legends_models import CantonModel
 from legends_models import ProvinceModel
+from legends_observability import instrumented
 
 
+@instrumented("dal")
 class CantonDAL:
     """Capa de acceso a datos para canton"""
 
@@ -13,12 +16,28 @@ class CantonDAL:
         """
         Obtiene todos los cantones disponibles en la base de datos.
 
+        Se consultan solo las columnas con `select()`: cada cantón llega como una fila liviana
+        (tupla con nombre), sin instancia del ORM, mapa de identidad ni seguimiento de estado.
+
         Returns:
-            list: Lista de instancias de CantonModel representando los cantones.
+            list: Filas con `id`, `provinceId` y `name` de cada cantón.
         """
-        cantons = self.db.query(CantonModel).all()
+        cantons = self.db.execute(select(CantonModel.id, CantonModel.provinceId, CantonModel.name)).all()
         return cantons
 
+    def get_names(self):
+        """
+        Obtiene el identificador y el nombre de todos los cantones.
+
+        Returns:
+            list | dict: Lista de tuplas `(id, name)`,
+                         diccionario con un mensaje de error si la consulta falla.
+        """
+        try:
+            return [(row.id, row.name) for row in self.db.query(CantonModel.id, CantonModel.name).all()]
+        except Exception as e:
+            return {"error": f"Error en la consulta: {str(e)}", "status": 500}
+
     def get_by_id(self, canton_id: int):
         """
         Busca un cantón específico por su identificador único.
@@ -37,34 +56,6 @@ class CantonDAL:
 
         return canton
 
-    def get_by_province(self, province_name: str):
-        """
-        Busca cantones por el nombre de la provincia.
-
-        Parámetros:
-            province_name (str): Nombre de la provincia a buscar.
-
-        Returns:
-            list | dict: Lista de cantones si la provincia existe, 
-                         diccionario con un mensaje de error si no.
-        """
-        try:
-            clean_province_name = province_name.strip()
-
-            # Verificar si la provincia existe antes de buscar cantones
-            province = self.db.query(ProvinceModel).filter(
-                ProvinceModel.name.ilike(clean_province_name)).first()
-            if not province:
-                return {"error": "La provincia no existe en la base de datos", "status": 404}
-
-            # Obtener cantones asociados a la provincia
-            cantons_list = self.db.query(CantonModel).filter(
-                CantonModel.provinceId == province.id).all()
-
-            return cantons_list
-        except Exception as e:
-            return {"error": f"Error en la consulta: {str(e)}", "status": 500}
-
     def get_by_province_id(self, province_id: int):
         """
         Busca cantones por el identificador de la provincia.
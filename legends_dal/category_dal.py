@@ -1,7 +1,9 @@
 from sqlalchemy.orm import Session
 from legends_models import CategoryModel
+from legends_observability import instrumented
 
 
+@instrumented("dal")
 class CategoryDAL:
     """Capa de acceso a datos de category"""
 
@@ -1,8 +1,11 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from legends_models import DistrictModel
 from legends_models import CantonModel
+from legends_observability import instrumented
 
 
+@instrumented("dal")
 class DistrictDAL:
     """Capa de acceso a datos para district"""
 
@@ -13,10 +16,15 @@ class DistrictDAL:
         """
         Obtiene todos los distritos disponibles en la base de datos.
 
+        Se consultan solo las columnas con `select()`: cada distrito llega como una fila liviana
+        (tupla con nombre), sin instancia del ORM, mapa de identidad ni seguimiento de estado.
+
         Returns:
-            list: Lista de instancias de DistrictModel representando los distritos.
+            list: Filas con `id`, `cantonId`, `name`, `latitude` y `longitude` de cada distrito.
         """
-        districts = self.db.query(DistrictModel).all()
+        districts = self.db.execute(select(
+            DistrictModel.id, DistrictModel.cantonId, DistrictModel.name,
+            DistrictModel.latitude, DistrictModel.longitude)).all()
         return districts
 
     def get_by_id(self, district_id: int):
@@ -33,23 +41,21 @@ class DistrictDAL:
             DistrictModel.id == district_id).first()
         return district if district else None
 
-    def get_by_canton(self, canton_name: str):
+    def get_by_canton_id(self, canton_id: int):
         """
-        Busca distritos por el nombre del cantón.
+        Busca distritos por el identificador del cantón.
 
         Parámetros:
-            canton_name (str): Nombre del cantón a buscar.
+            canton_id (int): ID del cantón a buscar.
 
         Returns:
             list | dict: Lista de distritos si el cantón existe, 
                          diccionario con un mensaje de error si no.
         """
         try:
-            clean_canton_name = canton_name.strip()
-
             # Verificar si el cantón existe antes de buscar distritos
             canton = self.db.query(CantonModel).filter(
-                CantonModel.name.ilike(clean_canton_name)).first()
+                CantonModel.id == canton_id).first()
             if not canton:
                 return {"error": "El cantón no existe en la base de datos", "status": 404}
 
@@ -61,28 +67,57 @@ class DistrictDAL:
         except Exception as e:
             return {"error": f"Error en la consulta: {str(e)}", "status": 500}
 
-    def get_by_canton_id(self, canton_id: int):
+    def get_ids_by_canton_id(self, canton_id: int):
         """
-        Busca distritos por el identificador del cantón.
+        Obtiene los identificadores de los distritos de un cantón.
 
         Parámetros:
-            canton_id (int): ID del cantón a buscar.
+            canton_id (int): ID del cantón.
 
         Returns:
-            list | dict: Lista de distritos si el cantón existe, 
-                         diccionario con un mensaje de error si no.
+            list | dict: Lista de IDs de distritos (vacía si el cantón no existe),
+                         diccionario con un mensaje de error si la consulta falla.
         """
         try:
-            # Verificar si el cantón existe antes de buscar distritos
-            canton = self.db.query(CantonModel).filter(
-                CantonModel.id == canton_id).first()
-            if not canton:
-                return {"error": "El cantón no existe en la base de datos", "status": 404}
+            rows = self.db.query(DistrictModel.id).filter(
+                DistrictModel.cantonId == canton_id).all()
 
-            # Obtener distritos asociados al cantón
-            districts_list = self.db.query(DistrictModel).filter(
-                DistrictModel.cantonId == canton.id).all()
+            return [row.id for row in rows]
+        except Exception as e:
+            return {"error": f"Error en la consulta: {str(e)}", "status": 500}
 
-            return districts_list
+    def get_ids_by_province_id(self, province_id: int):
+        """
+        Obtiene los identificadores de los distritos de una provincia.
+
+        Parámetros:
+            province_id (int): ID de la provincia.
+
+        Returns:
+            list | dict: Lista de IDs de distritos (vacía si la provincia no existe),
+                         diccionario con un mensaje de error si la consulta falla.
+        """
+        try:
+            rows = self.db.query(DistrictModel.id).join(
+                CantonModel, DistrictModel.cantonId == CantonModel.id).filter(
+                CantonModel.provinceId == province_id).all()
+
+            return [row.id for row in rows]
+        except Exception as e:
+            return {"error": f"Error en la consulta: {str(e)}", "status": 500}
+
+    def get_centroids(self):
+        """
+        Obtiene el centroide de los distritos que tienen coordenadas registradas.
+
+        Returns:
+            list | dict: Lista de tuplas `(id, latitude, longitude)`,
+                         diccionario con un mensaje de error si la consulta falla.
+        """
+        try:
+            rows = self.db.query(DistrictModel.id, DistrictModel.latitude, DistrictModel.longitude).filter(
+                DistrictModel.latitude.isnot(None), DistrictModel.longitude.isnot(None)).all()
+
+            return [(row.id, row.latitude, row.longitude) for row in rows]
         except Exception as e:
             return {"error": f"Error en la consulta: {str(e)}", "status": 500}
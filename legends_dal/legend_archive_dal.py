@@ -0,0 +1,130 @@
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy import delete, insert, literal, or_, select
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+from legends_models import LegendModel, LegendArchiveModel
+from legends_models.legend import utc_now
+from legends_observability import instrumented
+
+
+@instrumented("dal")
+class LegendArchiveDAL:
+    """Capa de acceso a datos del archivo de leyendas eliminadas"""
+
+    def __init__(self, db: Session):
+        self.db = db  # Recibe una sesión activa de SQLAlchemy
+
+    def get_inactive_ids(self, limit: int):
+        """
+        Obtiene los IDs de un lote de leyendas inactivas que siguen en la tabla `legend`.
+
+        **Parámetros**:
+        - `limit` (int): Cantidad máxima de IDs a devolver.
+
+        **Returns**:
+        - Lista de IDs de leyendas inactivas.
+        - Diccionario con `"error"` y `"status"` en caso de fallo.
+        """
+        try:
+            rows = self.db.query(LegendModel.id).filter(
+                LegendModel.is_active == False).limit(limit).all()
+
+            return [row.id for row in rows]
+        except SQLAlchemyError as e:
+            return {"error": f"Error al consultar las leyendas inactivas: {str(e)}", "status": 500}
+
+    def archive(self, legend_ids: List[str]):
+        """
+        Mueve leyendas de la tabla `legend` a `legend_archive` en una sola transacción.
+
+        **Parámetros**:
+        - `legend_ids` (List[str]): IDs de las leyendas a archivar.
+
+        **Returns**:
+        - Diccionario con `"message"`, `"status"` y la cantidad de leyendas archivadas en `"count"`.
+        - Diccionario con `"error"` y `"status"` en caso de fallo.
+        """
+        try:
+            columns = [c.name for c in LegendArchiveModel.__table__.columns if c.name != "archived_at"]
+            legend = LegendModel.__table__
+            self.db.execute(
+                insert(LegendArchiveModel.__table__).from_select(
+                    columns + ["archived_at"],
+                    select(*[legend.c[name] for name in columns], literal(utc_now()))
+                    .where(legend.c.id.in_(legend_ids))
+                )
+            )
+            result = self.db.execute(delete(legend).where(legend.c.id.in_(legend_ids)))
+            self.db.commit()
+
+            return {"message": "Leyendas archivadas exitosamente.", "status": 200, "count": result.rowcount}
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            return {"error": f"Error al archivar las leyendas: {str(e)}", "status": 500}
+
+    def restore(self, legend_id: str):
+        """
+        Devuelve una leyenda archivada a la tabla `legend` como activa.
+
+        `updated_at` se renueva para que la restauración aparezca en el feed de cambios.
+
+        **Parámetros**:
+        - `legend_id` (str): ID de la leyenda a restaurar.
+
+        **Returns**:
+        - Diccionario con `"message"` y `"status"` si la operación es exitosa.
+        - Diccionario con `"error"` y código de estado `404` si la leyenda no está archivada.
+        - Diccionario con `"error"` y código de estado `500` si ocurre un fallo.
+        """
+        try:
+            archive = LegendArchiveModel.__table__
+            columns = [c.name for c in archive.columns if c.name != "archived_at"]
+            overrides = {"is_active": literal(True), "updated_at": literal(utc_now())}
+            values = [overrides.get(name, archive.c[name]) for name in columns]
+            result = self.db.execute(
+                insert(LegendModel.__table__).from_select(
+                    columns, select(*values).where(archive.c.id == legend_id)
+                )
+            )
+            if not result.rowcount:
+                self.db.rollback()
+                return {"error": "La leyenda no existe en el archivo.", "status": 404}
+
+            self.db.execute(delete(archive).where(archive.c.id == legend_id))
+            self.db.commit()
+
+            return {"message": "Leyenda restaurada exitosamente.", "status": 200}
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            return {"error": f"Error al restaurar la leyenda: {str(e)}", "status": 500}
+
+    def get_changes(self, since_at: Optional[datetime], since_id: Optional[str], until: datetime, limit: int):
+        """
+        Obtiene las bajas archivadas después de un cursor `(updated_at, id)`.
+
+        Las leyendas archivadas ya no están en `legend`, por lo que el feed de cambios las
+        toma de aquí para no perder sus bajas.
+
+        **Parámetros**:
+        - `since_at` (Optional[datetime]): Fecha del último cambio ya leído (`None` para empezar desde el inicio).
+        - `since_id` (Optional[str]): ID del último cambio ya leído, para desempatar cambios con la misma fecha.
+        - `until` (datetime): Fecha máxima (inclusive) de los cambios a devolver.
+        - `limit` (int): Cantidad máxima de registros a devolver.
+
+        **Returns**:
+        - Lista de filas con `id` y `updated_at`, ordenadas por ambos campos.
+        - Diccionario con `"error"` y `"status"` en caso de fallo.
+        """
+        try:
+            query = self.db.query(LegendArchiveModel.id, LegendArchiveModel.updated_at).filter(
+                LegendArchiveModel.updated_at <= until)
+            if since_at is not None:
+                # Rango `>=` sobre el índice (conserva su orden) y descarte de lo ya leído con la misma fecha
+                query = query.filter(LegendArchiveModel.updated_at >= since_at, or_(
+                    LegendArchiveModel.updated_at > since_at, LegendArchiveModel.id > since_id))
+
+            return query.order_by(
+                LegendArchiveModel.updated_at.asc(), LegendArchiveModel.id.asc()).limit(limit).all()
+        except SQLAlchemyError as e:
+            return {"error": f"Error al consultar las leyendas archivadas: {str(e)}", "status": 500}
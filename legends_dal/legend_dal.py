@@ -1,9 +1,17 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer, joinedload
 from sqlalchemy.exc import SQLAlchemyError
-from typing import List
-from legends_models import LegendModel
+from typing import List, Optional
+from datetime import date, datetime
+from sqlalchemy import or_, select
+from legends_models import CantonModel, DistrictModel, LegendModel
+from legends_observability import instrumented
 
+# Columnas del listado de leyendas: el listado solo usa el extracto, por lo que la descripción no se lee ni se descomprime
+LIST_COLUMNS = (LegendModel.id, LegendModel.categoryId, LegendModel.districtId, LegendModel.name,
+                LegendModel.excerpt, LegendModel.imageUrl, LegendModel.date, LegendModel.is_active)
 
+
+@instrumented("dal")
 class LegendDAL:
     """Capa de acceso a datos de legend"""
 
@@ -68,23 +76,196 @@ class LegendDAL:
         except SQLAlchemyError as e:
             return {"error": f"Error al consultar la base de datos: {str(e)}", "status": 500}
 
-    def get_all(self, skip: int = 0, limit: int = 10):
+    def get_by_id_including_inactive(self, legend_id: str):
+        """
+        Obtiene una leyenda según su ID, esté activa o eliminada.
+
+        **Parámetros**:
+        - `legend_id` (str): Identificador único de la leyenda a buscar.
+
+        **Retorna**:
+        - Instancia de `LegendModel` o `None` si no existe.
+        - Diccionario con mensaje de error y código de estado si ocurre un problema.
+        """
+        try:
+            return self.db.query(LegendModel).filter(LegendModel.id == legend_id).first()
+        except SQLAlchemyError as e:
+            return {"error": f"Error al consultar la base de datos: {str(e)}", "status": 500}
+
+    def get_full_by_id(self, legend_id: str):
         """
-        Obtiene todas las leyendas registradas en la base de datos con soporte para paginación.
+        Obtiene una leyenda activa junto con su categoría, distrito, cantón y provincia en una sola consulta.
+
+        Las relaciones se cargan con `joinedload` (`JOIN` internos, ya que todas las claves foráneas
+        son obligatorias), por lo que acceder a ellas no emite consultas adicionales.
+
+        **Parámetros**:
+        - `legend_id` (str): Identificador único de la leyenda a buscar.
+
+        **Returns**:
+        - Instancia de `LegendModel` con `category` y `district.canton.province` cargados, o `None` si no existe.
+        - Diccionario con `"error"` y `"status"` en caso de fallo.
+        """
+        try:
+            legend = self.db.query(LegendModel).options(
+                joinedload(LegendModel.category, innerjoin=True),
+                joinedload(LegendModel.district, innerjoin=True)
+                .joinedload(DistrictModel.canton, innerjoin=True)
+                .joinedload(CantonModel.province, innerjoin=True)
+            ).filter(LegendModel.id == legend_id, LegendModel.is_active == True).first()
+            return legend
+        except SQLAlchemyError as e:
+            return {"error": f"Error al consultar la base de datos: {str(e)}", "status": 500}
+
+    def get_all(self, skip: int = 0, limit: int = 10, category_id: Optional[str] = None,
+                district_ids: Optional[List[int]] = None, date_from: Optional[date] = None,
+                date_to: Optional[date] = None, sort: Optional[str] = None):
+        """
+        Obtiene todas las leyendas registradas en la base de datos con soporte para filtros, orden y paginación.
+
+        Cada combinación de filtros se resuelve con los índices compuestos de `LegendModel`
+        (`is_active` + categoría o distrito + fecha); los filtros por cantón o provincia llegan
+        ya resueltos como `district_ids`, sin unir tablas por cada fila.
+
+        Se consultan con `select()` solo las columnas del listado (`LIST_COLUMNS`): cada leyenda
+        llega como una fila liviana, sin instancia del ORM, mapa de identidad ni seguimiento de estado.
 
         **Parámetros**:
         - `skip` (int): Cantidad de registros a omitir (para paginación).
         - `limit` (int): Cantidad máxima de registros a devolver.
+        - `category_id` (Optional[str]): Solo leyendas de esta categoría.
+        - `district_ids` (Optional[List[int]]): Solo leyendas de estos distritos.
+        - `date_from` (Optional[date]): Fecha mínima (inclusive).
+        - `date_to` (Optional[date]): Fecha máxima (inclusive).
+        - `sort` (Optional[str]): `date`, `-date`, `name` o `-name`.
+
+        **Returns**:
+        - Lista de filas con las columnas de `LIST_COLUMNS` si la consulta es exitosa.
+        - Diccionario con `"error"` y `"status"` en caso de fallo.
+        """
+        try:
+            query = select(*LIST_COLUMNS).where(LegendModel.is_active == True)
+
+            if category_id is not None:
+                query = query.where(LegendModel.categoryId == category_id)
+            if district_ids is not None:
+                if len(district_ids) == 1:
+                    query = query.where(LegendModel.districtId == district_ids[0])
+                else:
+                    query = query.where(LegendModel.districtId.in_(district_ids))
+            if date_from is not None:
+                query = query.where(LegendModel.date >= date_from)
+            if date_to is not None:
+                query = query.where(LegendModel.date <= date_to)
+
+            if sort:
+                column = LegendModel.date if sort.lstrip("-") == "date" else LegendModel.name
+                if sort.startswith("-"):
+                    query = query.order_by(column.desc(), LegendModel.id.desc())
+                else:
+                    query = query.order_by(column.asc(), LegendModel.id.asc())
+
+            legends = self.db.execute(query.offset(skip).limit(limit)).all()
+
+            return legends
+
+        except SQLAlchemyError as e:
+            return {"error": f"Error al obtener las leyendas: {str(e)}", "status": 500}
+
+    def get_by_ids(self, legend_ids: List[str], summary: bool = False):
+        """
+        Obtiene varias leyendas activas según sus IDs con una sola consulta `IN (...)`.
+
+        **Parámetros**:
+        - `legend_ids` (List[str]): Identificadores únicos de las leyendas a buscar.
+        - `summary` (bool): Si es `True`, no se lee la descripción completa (para listados con extracto).
 
         **Returns**:
-        - Lista de leyendas si la consulta es exitosa.
+        - Lista de instancias de `LegendModel` encontradas (en cualquier orden).
         - Diccionario con `"error"` y `"status"` en caso de fallo.
         """
         try:
-            legends: List[LegendModel] = self.db.query(
-                LegendModel).filter(LegendModel.is_active == True).offset(skip).limit(limit).all()
+            query = self.db.query(LegendModel)
+            if summary:
+                query = query.options(defer(LegendModel.description))
+            legends: List[LegendModel] = query.filter(
+                LegendModel.id.in_(legend_ids), LegendModel.is_active == True).all()
 
             return legends
 
         except SQLAlchemyError as e:
             return {"error": f"Error al obtener las leyendas: {str(e)}", "status": 500}
+
+    def get_district_ids(self, legend_ids: Optional[List[str]] = None):
+        """
+        Obtiene el distrito de las leyendas activas, sin leer el resto de sus columnas.
+
+        **Parámetros**:
+        - `legend_ids` (Optional[List[str]]): Leyendas a consultar; `None` para todas las activas.
+
+        **Returns**:
+        - Lista de tuplas `(id, districtId)`.
+        - Diccionario con `"error"` y `"status"` en caso de fallo.
+        """
+        try:
+            query = self.db.query(LegendModel.id, LegendModel.districtId).filter(LegendModel.is_active == True)
+            if legend_ids is not None:
+                query = query.filter(LegendModel.id.in_(legend_ids))
+
+            return [(row.id, row.districtId) for row in query.all()]
+
+        except SQLAlchemyError as e:
+            return {"error": f"Error al obtener los distritos de las leyendas: {str(e)}", "status": 500}
+
+    def get_names(self, legend_ids: Optional[List[str]] = None):
+        """
+        Obtiene el nombre de las leyendas activas, sin leer el resto de sus columnas.
+
+        **Parámetros**:
+        - `legend_ids` (Optional[List[str]]): Leyendas a consultar; `None` para todas las activas.
+
+        **Returns**:
+        - Lista de tuplas `(id, name)`.
+        - Diccionario con `"error"` y `"status"` en caso de fallo.
+        """
+        try:
+            query = self.db.query(LegendModel.id, LegendModel.name).filter(LegendModel.is_active == True)
+            if legend_ids is not None:
+                query = query.filter(LegendModel.id.in_(legend_ids))
+
+            return [(row.id, row.name) for row in query.all()]
+
+        except SQLAlchemyError as e:
+            return {"error": f"Error al obtener los nombres de las leyendas: {str(e)}", "status": 500}
+
+    def get_changes(self, since_at: Optional[datetime], since_id: Optional[str], until: datetime, limit: int):
+        """
+        Obtiene las leyendas modificadas después de un cursor `(updated_at, id)`, incluidas las inactivas.
+
+        Recorre el índice `ix_legend_updated_at` en orden, por lo que cada página cuesta lo mismo
+        sin importar cuántos cambios haya antes del cursor.
+
+        **Parámetros**:
+        - `since_at` (Optional[datetime]): Fecha del último cambio ya leído (`None` para empezar desde el inicio).
+        - `since_id` (Optional[str]): ID del último cambio ya leído, para desempatar cambios con la misma fecha.
+        - `until` (datetime): Fecha máxima (inclusive) de los cambios a devolver.
+        - `limit` (int): Cantidad máxima de registros a devolver.
+
+        **Returns**:
+        - Lista de instancias de `LegendModel` ordenadas por `updated_at` e `id`.
+        - Diccionario con `"error"` y `"status"` en caso de fallo.
+        """
+        try:
+            query = self.db.query(LegendModel).filter(LegendModel.updated_at <= until)
+            if since_at is not None:
+                # Rango `>=` sobre el índice (conserva su orden) y descarte de lo ya leído con la misma fecha
+                query = query.filter(LegendModel.updated_at >= since_at, or_(
+                    LegendModel.updated_at > since_at, LegendModel.id > since_id))
+
+            legends: List[LegendModel] = query.order_by(
+                LegendModel.updated_at.asc(), LegendModel.id.asc()).limit(limit).all()
+
+            return legends
+
+        except SQLAlchemyError as e:
+            return {"error": f"Error al obtener los cambios de leyendas: {str(e)}", "status": 500}
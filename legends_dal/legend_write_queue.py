@@ -0,0 +1,152 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import List, Optional, Tuple
+from sqlalchemy.exc import SQLAlchemyError
+from legends_config.database.db_config import sessionLocal
+from legends_config.settings import settings
+from legends_models import LegendModel
+
+logger = logging.getLogger(__name__)
+
+# Marca que detiene el hilo escritor
+_STOP = object()
+
+
+class LegendWriteQueue:
+    """
+    Cola de inserción de leyendas con confirmación agrupada (group commit).
+
+    Un único hilo escritor toma las leyendas encoladas y las inserta en lotes de hasta
+    `max_batch` elementos en una sola transacción, de modo que una ráfaga de creaciones paga un
+    solo commit en lugar de uno por solicitud. El primer elemento de un lote espera como máximo
+    `max_delay` segundos a que lleguen otros.
+
+    Cada llamador espera en un `Future` el resultado de su propia leyenda. Si el lote falla, sus
+    leyendas se reintentan una por una para que solo fallen las que tienen el error.
+    """
+
+    def __init__(self, max_batch: int = 50, max_delay: float = 0.005, timeout: float = 10.0):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def create(self, model: LegendModel):
+        """
+        Encola una leyenda nueva y espera a que se confirme su lote.
+
+        Mantiene el mismo contrato que `LegendDAL.create`.
+
+        **Parámetros**:
+        - `model` (LegendModel): Instancia del modelo de leyenda con los datos a registrar.
+
+        **Returns**:
+        - Diccionario con la clave `"status"` y el mensaje correspondiente.
+        """
+        self._ensure_started()
+        future: Future = Future()
+        self._queue.put((model, future))
+
+        try:
+            return future.result(self.timeout)
+        except FutureTimeoutError:
+            # Si el lote todavía no empezó, se retira la leyenda; si ya se está escribiendo, se espera su
+            # resultado otro `timeout` como máximo
+            if future.cancel():
+                return {"error": "Tiempo de espera agotado al crear la leyenda.", "status": 503}
+        try:
+            return future.result(self.timeout)
+        except FutureTimeoutError:
+            return {"error": "Tiempo de espera agotado al confirmar la leyenda; es posible que se haya creado.",
+                    "status": 503}
+
+    def close(self):
+        """
+        Escribe las leyendas pendientes y detiene el hilo escritor.
+
+        Bloquea hasta que el hilo termina, por lo que desde el ciclo de eventos debe ejecutarse en
+        el pool de hilos.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="legend-write-queue", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+
+            batch = [item]
+            deadline = time.monotonic() + self.max_delay
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            # Las leyendas cuyo llamador ya se retiró por tiempo de espera no se escriben
+            self._flush([(model, future) for model, future in batch if future.set_running_or_notify_cancel()])
+
+    def _flush(self, batch: List[Tuple[LegendModel, Future]]):
+        if not batch:
+            return
+
+        db = sessionLocal(expire_on_commit=False)
+        try:
+            try:
+                db.add_all([model for model, _ in batch])
+                db.commit()
+                for _, future in batch:
+                    future.set_result({"message": "Leyenda creada exitosamente.", "status": 201})
+                return
+            except SQLAlchemyError as e:
+                db.rollback()
+                if len(batch) == 1:
+                    batch[0][1].set_result({"error": f"Error al crear la leyenda: {str(e)}", "status": 500})
+                    return
+                logger.warning("Falló el lote de %d leyendas; se reintentan una por una: %s", len(batch), e)
+
+            for model, future in batch:
+                try:
+                    db.add(model)
+                    db.commit()
+                    db.expunge(model)
+                    future.set_result({"message": "Leyenda creada exitosamente.", "status": 201})
+                except SQLAlchemyError as e:
+                    db.rollback()
+                    future.set_result({"error": f"Error al crear la leyenda: {str(e)}", "status": 500})
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # Las instancias se devuelven desligadas de la sesión del hilo escritor
+            db.expunge_all()
+            db.close()
+
+
+# Instancia única por worker; solo se usa con `legends_group_commit_enabled`
+legend_write_queue = LegendWriteQueue(
+    max_batch=settings.legends_group_commit_max_batch,
+    max_delay=settings.legends_group_commit_max_delay,
+    timeout=settings.legends_group_commit_timeout,
+)
@@ -1,6 +1,8 @@
-from sqlalchemy.orm import Session
-from legends_models import ProvinceModel
+from sqlalchemy.orm import Session, selectinload
+from legends_models import CantonModel, ProvinceModel
+from legends_observability import instrumented
 
+@instrumented("dal")
 class ProvinceDAL:
     """Capa de acceso a datos de province"""
 
@@ -16,6 +18,19 @@ class ProvinceDAL:
         """
         provinces = self.db.query(ProvinceModel).all()
         return provinces
+
+    def get_names(self):
+        """
+        Obtiene el identificador y el nombre de todas las provincias.
+
+        Returns:
+            list | dict: Lista de tuplas `(id, name)`,
+                         diccionario con un mensaje de error si la consulta falla.
+        """
+        try:
+            return [(row.id, row.name) for row in self.db.query(ProvinceModel.id, ProvinceModel.name).all()]
+        except Exception as e:
+            return {"error": f"Error en la consulta: {str(e)}", "status": 500}
     
     def get_by_id(self, province_id: int):
         """
@@ -33,4 +48,19 @@ class ProvinceDAL:
         if not province:
             return {"error": "La provincia no existe en la base de datos.", "status": 404}
 
-        return province
\ No newline at end of file
+        return province
+
+    def get_tree(self):
+        """
+        Obtiene todas las provincias con sus cantones y distritos.
+
+        Las relaciones se cargan con `selectinload`, por lo que la jerarquía completa se obtiene
+        con tres consultas en lugar de una por cada provincia y cantón.
+
+        Returns:
+            list: Lista de instancias de ProvinceModel con `cantons` y `districts` cargados.
+        """
+        provinces = self.db.query(ProvinceModel).options(
+            selectinload(ProvinceModel.cantons).selectinload(CantonModel.districts)
+        ).order_by(ProvinceModel.id).all()
+        return provinces
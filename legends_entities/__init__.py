@@ -3,5 +3,14 @@ from .categories import CategoryEntity
 from .districts import DistrictEntity
 from .legends import LegendEntity
 from .legends import LegendCreateEntity
+from .legends import LegendBatchEntity
+from .legends import LegendChangeEntity, LegendChangesEntity
+from .legends import LegendFilterEntity
+from .legends import LegendFullEntity
+from .legends import LegendNearbyEntity
+from .legends import LegendSuggestionEntity
+from .legends import LegendSummaryEntity
+from .metrics import ThreadPoolMetricsEntity
 from .provinces import ProvinceEntity
+from .provinces import CantonTreeEntity, ProvinceTreeEntity
 from .responses import ApiResponse
\ No newline at end of file
@@ -1,3 +1,4 @@
+from typing import Optional
 from pydantic import BaseModel
 
 
@@ -9,7 +10,11 @@ class DistrictEntity(BaseModel):
         id (int): Identificador único del distrito.
         canton_id (int): Identificador del cantón al que pertenece el distrito.
         name (str): Nombre del distrito.
+        latitude (Optional[float]): Latitud del centroide del distrito.
+        longitude (Optional[float]): Longitud del centroide del distrito.
     """
     id: int
     canton_id: int
     name: str
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
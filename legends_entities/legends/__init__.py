@@ -1,2 +1,9 @@
+from .legend_batch_entity import LegendBatchEntity
+from .legend_change_entity import LegendChangeEntity, LegendChangesEntity
 from .legend_create_entity import LegendCreateEntity
-from .legend_entity import LegendEntity
\ No newline at end of file
+from .legend_entity import LegendEntity
+from .legend_filter_entity import LegendFilterEntity
+from .legend_full_entity import LegendFullEntity
+from .legend_nearby_entity import LegendNearbyEntity
+from .legend_suggestion_entity import LegendSuggestionEntity
+from .legend_summary_entity import LegendSummaryEntity
\ No newline at end of file
@@ -0,0 +1,16 @@
+from typing import List
+from uuid import UUID
+from pydantic import BaseModel
+from legends_entities.legends.legend_entity import LegendEntity
+
+
+class LegendBatchEntity(BaseModel):
+    """
+    DTO (Data Transfer Object) con el resultado de una consulta de leyendas por lote.
+
+    Atributos:
+        legends (List[LegendEntity]): Leyendas encontradas, en el mismo orden en que se solicitaron.
+        missing (List[UUID]): Identificadores solicitados que no existen o están inactivos.
+    """
+    legends: List[LegendEntity]
+    missing: List[UUID]
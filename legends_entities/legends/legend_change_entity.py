@@ -0,0 +1,35 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+from pydantic import BaseModel
+from legends_entities.legends.legend_entity import LegendEntity
+
+
+class LegendChangeEntity(BaseModel):
+    """
+    DTO (Data Transfer Object) que representa un cambio en una leyenda dentro del feed de cambios.
+
+    Atributos:
+        id (UUID): Identificador de la leyenda modificada.
+        deleted (bool): `True` si la leyenda fue eliminada (baja); en ese caso `legend` es `None`.
+        updatedAt (datetime): Fecha y hora (UTC) del cambio.
+        legend (Optional[LegendEntity]): Estado actual de la leyenda si sigue activa.
+    """
+    id: UUID
+    deleted: bool
+    updatedAt: datetime
+    legend: Optional[LegendEntity] = None
+
+
+class LegendChangesEntity(BaseModel):
+    """
+    DTO (Data Transfer Object) con una página del feed de cambios de leyendas.
+
+    Atributos:
+        changes (List[LegendChangeEntity]): Cambios ordenados del más antiguo al más reciente.
+        nextCursor (Optional[str]): Cursor a enviar como `since` en la siguiente consulta; se mantiene el recibido si no hubo cambios.
+        hasMore (bool): `True` si quedan más cambios por leer de inmediato.
+    """
+    changes: List[LegendChangeEntity]
+    nextCursor: Optional[str] = None
+    hasMore: bool = False
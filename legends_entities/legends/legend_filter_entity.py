@@ -0,0 +1,25 @@
+from typing import Literal, Optional
+from pydantic import BaseModel
+from datetime import date as DateType
+
+
+class LegendFilterEntity(BaseModel):
+    """
+    DTO con los filtros y el orden para el listado de leyendas.
+
+    Atributos:
+        categoryId (Optional[str]): Solo leyendas de esta categoría.
+        districtId (Optional[int]): Solo leyendas de este distrito.
+        cantonId (Optional[int]): Solo leyendas de los distritos de este cantón.
+        provinceId (Optional[int]): Solo leyendas de los distritos de esta provincia.
+        dateFrom (Optional[date]): Fecha mínima (inclusive).
+        dateTo (Optional[date]): Fecha máxima (inclusive).
+        sort (Optional[str]): Orden del listado: `date`, `-date`, `name` o `-name` (`-` para descendente).
+    """
+    categoryId: Optional[str] = None
+    districtId: Optional[int] = None
+    cantonId: Optional[int] = None
+    provinceId: Optional[int] = None
+    dateFrom: Optional[DateType] = None
+    dateTo: Optional[DateType] = None
+    sort: Optional[Literal["date", "-date", "name", "-name"]] = None
@@ -0,0 +1,23 @@
+from legends_entities.cantons import CantonEntity
+from legends_entities.categories import CategoryEntity
+from legends_entities.districts import DistrictEntity
+from legends_entities.legends.legend_entity import LegendEntity
+from legends_entities.provinces.province_entity import ProvinceEntity
+
+
+class LegendFullEntity(LegendEntity):
+    """
+    DTO (Data Transfer Object) que representa una leyenda junto con su categoría y su ubicación completa.
+
+    Incluye todos los atributos de `LegendEntity` y además:
+
+    Atributos:
+        category (CategoryEntity): Categoría de la leyenda.
+        district (DistrictEntity): Distrito donde se origina la leyenda.
+        canton (CantonEntity): Cantón al que pertenece el distrito.
+        province (ProvinceEntity): Provincia a la que pertenece el cantón.
+    """
+    category: CategoryEntity
+    district: DistrictEntity
+    canton: CantonEntity
+    province: ProvinceEntity
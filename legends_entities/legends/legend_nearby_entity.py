@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+from legends_entities.legends.legend_summary_entity import LegendSummaryEntity
+
+
+class LegendNearbyEntity(BaseModel):
+    """
+    DTO (Data Transfer Object) que representa una leyenda encontrada cerca de un punto.
+
+    Atributos:
+        legend (LegendSummaryEntity): Leyenda encontrada, con el extracto en lugar de la descripción.
+        distanceKm (float): Distancia en kilómetros entre el punto consultado y el centroide del distrito de la leyenda.
+    """
+    legend: LegendSummaryEntity
+    distanceKm: float
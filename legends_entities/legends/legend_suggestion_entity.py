@@ -0,0 +1,14 @@
+from uuid import UUID
+from pydantic import BaseModel
+
+
+class LegendSuggestionEntity(BaseModel):
+    """
+    DTO (Data Transfer Object) que representa una sugerencia de autocompletado de leyendas.
+
+    Atributos:
+        id (UUID): Identificador de la leyenda sugerida.
+        name (str): Nombre de la leyenda.
+    """
+    id: UUID
+    name: str
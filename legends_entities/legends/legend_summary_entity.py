@@ -0,0 +1,27 @@
+from uuid import UUID
+from pydantic import BaseModel
+from datetime import date as DateType
+
+
+class LegendSummaryEntity(BaseModel):
+    """
+    DTO (Data Transfer Object) que representa una leyenda en los listados, con un extracto en lugar de la descripción completa.
+
+    Atributos:
+        id (str): Identificador único de la leyenda (UUID en formato string).
+        categoryId (str): Clave foránea que referencia la categoría de la leyenda (UUID en formato string).
+        districtId (int): Clave foránea que referencia el distrito al que pertenece la leyenda.
+        name (str): Nombre de la leyenda.
+        excerpt (str): Inicio de la descripción; la descripción completa se obtiene en `/legends/{legend_id}`.
+        imageUrl (str): URL de la imagen representativa de la leyenda.
+        date (date): Fecha en la que se registró o se originó la leyenda.
+        is_active (bool): Estado de la leyenda (activo/inactivo).
+    """
+    id: UUID
+    categoryId: str
+    districtId: int
+    name: str
+    excerpt: str
+    imageUrl: str
+    date: DateType
+    is_active: bool
@@ -0,0 +1 @@
+from .thread_pool_metrics_entity import ThreadPoolMetricsEntity
\ No newline at end of file
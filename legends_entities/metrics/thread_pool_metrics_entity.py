@@ -0,0 +1,32 @@
+from typing import Optional
+from pydantic import BaseModel
+
+
+class ThreadPoolMetricsEntity(BaseModel):
+    """
+    DTO con las métricas del pool de hilos de los endpoints síncronos y del pool de conexiones del worker.
+
+    Atributos:
+        size (int): Hilos disponibles para los endpoints síncronos.
+        busy (int): Hilos ocupados en este momento.
+        waiting (int): Tareas esperando un hilo libre en este momento.
+        peakBusy (int): Máximo de hilos ocupados observado desde el inicio del worker.
+        dbPoolSize (int): Conexiones permanentes del pool de la base de datos.
+        dbMaxOverflow (int): Conexiones adicionales que el pool puede abrir bajo carga.
+        dbCheckedOut (Optional[int]): Conexiones en uso, si el pool lo informa.
+        queueWaitSamples (int): Cantidad de esperas registradas desde el inicio del worker.
+        queueWaitAvgMs (float): Espera promedio por un hilo, en milisegundos.
+        queueWaitP95Ms (float): Percentil 95 de la espera en las muestras recientes, en milisegundos.
+        queueWaitMaxMs (float): Espera máxima registrada, en milisegundos.
+    """
+    size: int
+    busy: int
+    waiting: int
+    peakBusy: int
+    dbPoolSize: int
+    dbMaxOverflow: int
+    dbCheckedOut: Optional[int] = None
+    queueWaitSamples: int
+    queueWaitAvgMs: float
+    queueWaitP95Ms: float
+    queueWaitMaxMs: float
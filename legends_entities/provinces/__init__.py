@@ -1 +1,2 @@
-from .province_entity import ProvinceEntity
\ No newline at end of file
+from .province_entity import ProvinceEntity
+from .province_tree_entity import CantonTreeEntity, ProvinceTreeEntity
\ No newline at end of file
@@ -0,0 +1,33 @@
+from typing import List
+from pydantic import BaseModel
+from legends_entities.districts import DistrictEntity
+
+
+class CantonTreeEntity(BaseModel):
+    """
+    DTO (Data Transfer Object) para representar un cantón con sus distritos.
+
+    Atributos:
+        id (int): Identificador único del cantón.
+        province_id (int): Identificador de la provincia a la que pertenece el cantón.
+        name (str): Nombre del cantón.
+        districts (List[DistrictEntity]): Distritos del cantón.
+    """
+    id: int
+    province_id: int
+    name: str
+    districts: List[DistrictEntity]
+
+
+class ProvinceTreeEntity(BaseModel):
+    """
+    DTO (Data Transfer Object) para representar una provincia con toda su jerarquía geográfica.
+
+    Atributos:
+        id (int): Identificador único de la provincia.
+        name (str): Nombre de la provincia.
+        cantons (List[CantonTreeEntity]): Cantones de la provincia con sus distritos.
+    """
+    id: int
+    name: str
+    cantons: List[CantonTreeEntity]
@@ -2,4 +2,5 @@ from .canton import CantonModel
 from .category import CategoryModel
 from .district import DistrictModel
 from .legend import LegendModel
+from .legend_archive import LegendArchiveModel
 from .province import ProvinceModel
\ No newline at end of file
@@ -1,6 +1,7 @@
 from legends_config.database.db_config import Base
 from sqlalchemy import Column, String
 from sqlalchemy.orm import relationship
+from legends_models.types import UUIDType
 
 
 class CategoryModel(Base):
@@ -8,7 +9,7 @@ class CategoryModel(Base):
     Modelo que representa una categoría de leyendas en la base de datos.
 
     Atributos:
-        id (str): Identificador único de la categoría (UUID en formato string).
+        id (str): Identificador único de la categoría (UUID; texto o 16 bytes según `id_storage`).
         name (str): Nombre de la categoría.
 
     Relaciones:
@@ -16,7 +17,7 @@ class CategoryModel(Base):
     """
     __tablename__ = "category"
 
-    id = Column(String(36), primary_key=True)
+    id = Column(UUIDType(), primary_key=True)
     name = Column(String(50), nullable=False)
 
     # Relación uno a muchos con LegendModel
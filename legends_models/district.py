@@ -1,5 +1,5 @@
 from legends_config.database.db_config import Base
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Float, Integer, String, ForeignKey
 from sqlalchemy.orm import relationship
 
 
@@ -11,6 +11,8 @@ class DistrictModel(Base):
         id (int): Identificador único del distrito.
         name (str): Nombre del distrito.
         cantonId (int): Clave foránea que referencia el cantón al que pertenece el distrito.
+        latitude (float): Latitud del centroide del distrito, en grados (opcional).
+        longitude (float): Longitud del centroide del distrito, en grados (opcional).
 
     Relaciones:
         canton (CantonModel): Relación muchos a uno con el cantón al que pertenece.
@@ -21,6 +23,8 @@ class DistrictModel(Base):
     id = Column(Integer, primary_key=True)
     name = Column(String(50), nullable=False)
     cantonId = Column(Integer, ForeignKey("canton.id"), nullable=False)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
 
     # Relación muchos a uno con CantonModel
     canton = relationship("CantonModel", back_populates="districts")
@@ -1,6 +1,17 @@
+from datetime import datetime, timezone
 from legends_config.database.db_config import Base
-from sqlalchemy import Column, Integer, String, ForeignKey, Date, Boolean
+from sqlalchemy import Column, Integer, String, ForeignKey, Date, DateTime, Boolean, Index
+from sqlalchemy.dialects import mysql
 from sqlalchemy.orm import relationship
+from legends_models.types import CompressedText, UUIDType
+
+# Fecha y hora con microsegundos (en MySQL, DATETIME sin precisión solo guarda segundos)
+TIMESTAMP_TYPE = DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql")
+
+
+def utc_now() -> datetime:
+    """Devuelve la fecha y hora actual en UTC sin zona horaria, tal como se guarda en `TIMESTAMP_TYPE`."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
 class LegendModel(Base):
@@ -8,29 +19,47 @@ class LegendModel(Base):
     Modelo que representa una leyenda en la base de datos.
 
     Atributos:
-        id (str): Identificador único de la leyenda (UUID en formato string).
+        id (str): Identificador único de la leyenda (UUID ordenado por tiempo, o derivado de la `Idempotency-Key`; texto o 16 bytes según `id_storage`).
         districtId (int): Clave foránea que referencia el distrito donde se origina la leyenda.
-        categoryId (str): Clave foránea que referencia la categoría a la que pertenece la leyenda (UUID en formato string).
+        categoryId (str): Clave foránea que referencia la categoría a la que pertenece la leyenda (UUID; texto o 16 bytes según `id_storage`).
         name (str): Nombre de la leyenda.
-        description (str): Descripción detallada de la leyenda.
+        description (str): Descripción detallada de la leyenda (comprimida si es extensa).
+        excerpt (str): Inicio de la descripción, precalculado para los listados.
         imageUrl (str): URL de la imagen representativa de la leyenda.
         date (date): Fecha en la que se registró o se originó la leyenda.
         is_active (bool): Estado de la leyenda (activo/inactivo).
+        created_at (datetime): Fecha y hora (UTC) de creación.
+        updated_at (datetime): Fecha y hora (UTC) del último cambio, incluida la eliminación; base del feed de cambios.
 
     Relaciones:
         district (DistrictModel): Relación con el distrito de origen.
         category (CategoryModel): Relación con la categoría a la que pertenece.
+
+    Índices:
+        Índices compuestos que empiezan por `is_active` para que cada combinación de filtros y
+        orden del listado (`LegendDAL.get_all`) se resuelva con el índice.
     """
     __tablename__ = "legend"
+    __table_args__ = (
+        Index("ix_legend_active_category_date", "is_active", "categoryId", "date"),
+        Index("ix_legend_active_district_date", "is_active", "districtId", "date"),
+        Index("ix_legend_active_date", "is_active", "date"),
+        Index("ix_legend_active_name", "is_active", "name"),
+        Index("ix_legend_updated_at", "updated_at", "id"),
+    )
 
-    id = Column(String(36), primary_key=True)
-    categoryId = Column(String(36), ForeignKey("category.id"), nullable=False)
+    id = Column(UUIDType(), primary_key=True)
+    categoryId = Column(UUIDType(), ForeignKey("category.id"), nullable=False)
     districtId = Column(Integer, ForeignKey("district.id"), nullable=False)
     name = Column(String(50), nullable=False)
-    description = Column(String, nullable=False)
+    description = Column(CompressedText(), nullable=False)
+    excerpt = Column(String(300), nullable=False, server_default="")
     imageUrl = Column(String(256), nullable=False)
     date = Column(Date, nullable=False)
     is_active = Column(Boolean, nullable=False, default=True)
+    # Sin valor por defecto en el servidor: `NOW()` usaría la zona horaria de la sesión de MySQL, no UTC
+    created_at = Column(TIMESTAMP_TYPE, nullable=False, default=utc_now)
+    updated_at = Column(TIMESTAMP_TYPE, nullable=False, default=utc_now)
 
     # Relación muchos a uno con CategoryModel
     category = relationship("CategoryModel", back_populates="legends")
@@ -0,0 +1,44 @@
+from legends_config.database.db_config import Base
+from sqlalchemy import Column, Integer, String, Date, Boolean, Index
+from legends_models.legend import TIMESTAMP_TYPE
+from legends_models.types import CompressedText, UUIDType
+
+
+class LegendArchiveModel(Base):
+    """
+    Modelo que representa una leyenda eliminada (inactiva) movida fuera de la tabla `legend`.
+
+    Tiene las mismas columnas que `LegendModel` más la fecha de archivado, de modo que la tabla
+    viva y sus índices solo contienen leyendas activas.
+
+    Atributos:
+        id (str): Identificador único de la leyenda (UUID en formato string).
+        categoryId (str): Categoría a la que pertenecía la leyenda (UUID en formato string).
+        districtId (int): Distrito donde se origina la leyenda.
+        name (str): Nombre de la leyenda.
+        description (str): Descripción detallada de la leyenda (comprimida si es extensa).
+        excerpt (str): Inicio de la descripción, precalculado para los listados.
+        imageUrl (str): URL de la imagen representativa de la leyenda.
+        date (date): Fecha en la que se registró o se originó la leyenda.
+        is_active (bool): Estado de la leyenda al archivarse.
+        created_at (datetime): Fecha y hora (UTC) de creación.
+        updated_at (datetime): Fecha y hora (UTC) del último cambio; las filas archivadas son bajas en el feed de cambios.
+        archived_at (datetime): Fecha y hora (UTC) en que se archivó la leyenda.
+    """
+    __tablename__ = "legend_archive"
+    __table_args__ = (
+        Index("ix_legend_archive_updated_at", "updated_at", "id"),
+    )
+
+    id = Column(UUIDType(), primary_key=True)
+    categoryId = Column(UUIDType(), nullable=False)
+    districtId = Column(Integer, nullable=False)
+    name = Column(String(50), nullable=False)
+    description = Column(CompressedText(), nullable=False)
+    excerpt = Column(String(300), nullable=False, server_default="")
+    imageUrl = Column(String(256), nullable=False)
+    date = Column(Date, nullable=False)
+    is_active = Column(Boolean, nullable=False, default=False)
+    created_at = Column(TIMESTAMP_TYPE, nullable=False)
+    updated_at = Column(TIMESTAMP_TYPE, nullable=False)
+    archived_at = Column(TIMESTAMP_TYPE, nullable=False, index=True)
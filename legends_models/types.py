@@ -0,0 +1,102 @@
+import os
+import time
+import uuid
+import zlib
+from typing import Optional
+from sqlalchemy import BINARY, LargeBinary, String
+from sqlalchemy.dialects import mysql
+from sqlalchemy.types import TypeDecorator
+from legends_config.settings import settings
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Genera un UUID versión 7: 48 bits con la hora Unix en milisegundos seguidos de bits aleatorios.
+
+    Los identificadores crecen con el tiempo, por lo que las inserciones caen al final del índice
+    de la clave primaria en lugar de repartirse por todo el árbol.
+
+    Returns:
+        uuid.UUID: Identificador ordenado por tiempo.
+    """
+    value = int(time.time() * 1000) << 80 | int.from_bytes(os.urandom(10), "big")
+    # Versión 7 (bits 48-51) y variante RFC 4122 (bits 64-65)
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    return uuid.UUID(int=value)
+
+
+class UUIDType(TypeDecorator):
+    """
+    Columna de identificador UUID que se guarda como texto (`CHAR(36)`) o como 16 bytes (`BINARY(16)`).
+
+    El modo se toma de `id_storage`. En ambos modos el modelo recibe y devuelve el UUID como texto
+    canónico, por lo que las capas superiores y la API no cambian. Un valor que no es un UUID
+    válido no coincide con ningún registro.
+    """
+    impl = String(36)
+    cache_ok = True
+
+    def __init__(self, binary: Optional[bool] = None):
+        super().__init__()
+        self.binary = settings.id_storage == "binary" if binary is None else binary
+
+    def load_dialect_impl(self, dialect):
+        return dialect.type_descriptor(BINARY(16) if self.binary else String(36))
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        try:
+            parsed = value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+        except ValueError:
+            return b"" if self.binary else str(value)
+        return parsed.bytes if self.binary else str(parsed)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return str(uuid.UUID(bytes=bytes(value)))
+        return value
+
+
+class CompressedText(TypeDecorator):
+    """
+    Columna de texto que se guarda comprimida con zlib cuando supera un tamaño mínimo.
+
+    Los textos cortos (o que no se reducen al comprimirse) se guardan como UTF-8 sin cambios; los
+    comprimidos llevan el prefijo `COMPRESSED_MARKER`, que no aparece en texto. Así también se
+    leen las filas guardadas como texto antes de usar este tipo.
+    """
+    impl = LargeBinary
+    cache_ok = True
+
+    COMPRESSED_MARKER = b"\x00z"
+
+    def __init__(self, threshold: Optional[int] = None, level: int = 6):
+        super().__init__()
+        self.threshold = settings.description_compress_threshold if threshold is None else threshold
+        self.level = level
+
+    def load_dialect_impl(self, dialect):
+        # En MySQL, BLOB admite solo 64 KB
+        return dialect.type_descriptor(mysql.LONGBLOB() if dialect.name == "mysql" else LargeBinary())
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        data = value.encode("utf-8")
+        if len(data) >= self.threshold:
+            compressed = zlib.compress(data, self.level)
+            if len(compressed) + len(self.COMPRESSED_MARKER) < len(data):
+                return self.COMPRESSED_MARKER + compressed
+        return data
+
+    def process_result_value(self, value, dialect):
+        if value is None or isinstance(value, str):
+            return value
+        value = bytes(value)
+        if value.startswith(self.COMPRESSED_MARKER):
+            value = zlib.decompress(value[len(self.COMPRESSED_MARKER):])
+        return value.decode("utf-8")
@@ -0,0 +1,6 @@
+from .layers import (InstrumentedRoute, ObserverGroup, current_observer, endpoint_started, instrumented, observe,
+                     push_observer)
+from .profiler import RequestProfile
+from .tracing import Span, Trace, parse_traceparent
+from .exporters import (BackgroundSpanExporter, FileSpanExporter, SpanExporter, StreamSpanExporter,
+                        load_exporter)
@@ -0,0 +1,128 @@
+import importlib
+import json
+import logging
+import queue
+import sys
+import threading
+from abc import ABC, abstractmethod
+from typing import List, Optional, TextIO
+from legends_observability.tracing import Span
+
+logger = logging.getLogger(__name__)
+
+
+class SpanExporter(ABC):
+    """
+    Destino de los spans de las trazas terminadas.
+
+    Para enviar las trazas a otro sistema basta con heredar de esta clase, implementar `export` y
+    configurar `TRACING_EXPORTER=modulo:Clase`; una subclase sin `export` falla al crearse en
+    `load_exporter`, al iniciar el worker. `export` se llama desde el hilo de
+    `BackgroundSpanExporter`, nunca desde el bucle de eventos, por lo que puede bloquear.
+    """
+
+    @abstractmethod
+    def export(self, spans: List[Span]):
+        """Envía los spans de una traza terminada."""
+
+    def shutdown(self):
+        """Libera los recursos del exportador al apagar el worker."""
+
+
+class StreamSpanExporter(SpanExporter):
+    """Escribe cada span como una línea JSON en un flujo de texto (por defecto, la salida estándar)."""
+
+    def __init__(self, stream: TextIO = None):
+        self.stream = stream or sys.stdout
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Span]):
+        lines = "".join(json.dumps(span.to_dict(), ensure_ascii=False) + "\n" for span in spans)
+        with self._lock:
+            self.stream.write(lines)
+            self.stream.flush()
+
+
+class FileSpanExporter(StreamSpanExporter):
+    """Agrega cada span como una línea JSON a un archivo (JSON Lines)."""
+
+    def __init__(self, path: str):
+        super().__init__(open(path, "a", encoding="utf-8"))
+
+    def shutdown(self):
+        with self._lock:
+            self.stream.close()
+
+
+def load_exporter(spec: str, path: str) -> SpanExporter:
+    """
+    Crea el exportador configurado.
+
+    Args:
+        spec (str): `stdout`, `file` o la ruta `modulo:Clase` de un `SpanExporter` propio.
+        path (str): Archivo de destino para `file`.
+
+    Returns:
+        SpanExporter: Exportador listo para usarse.
+
+    Raises:
+        ValueError: Si `spec` no corresponde a ningún exportador.
+    """
+    if spec == "stdout":
+        return StreamSpanExporter()
+    if spec == "file":
+        return FileSpanExporter(path)
+    module_name, _, class_name = spec.partition(":")
+    if not class_name:
+        raise ValueError(f"Exportador de trazas no válido: '{spec}'. Use stdout, file o modulo:Clase.")
+    exporter = getattr(importlib.import_module(module_name), class_name)()
+    if not isinstance(exporter, SpanExporter):
+        raise ValueError(f"'{spec}' no es un SpanExporter.")
+    return exporter
+
+
+class BackgroundSpanExporter(SpanExporter):
+    """
+    Exporta los spans desde un hilo propio, para que la solicitud no espere al exportador.
+
+    Las trazas se encolan sin bloquear; si la cola está llena (el exportador no da abasto) la
+    traza se descarta y se cuenta en `dropped`. El hilo se inicia con la primera traza, dentro
+    del worker.
+    """
+
+    def __init__(self, exporter: SpanExporter, max_queue: int = 1000):
+        self.exporter = exporter
+        self.dropped = 0
+        self._queue: "queue.Queue[Optional[List[Span]]]" = queue.Queue(max_queue)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def export(self, spans: List[Span]):
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+                    self._thread.start()
+        try:
+            self._queue.put_nowait(spans)
+        except queue.Full:
+            self.dropped += 1
+
+    def shutdown(self):
+        """Exporta las trazas pendientes y detiene el hilo."""
+        with self._lock:
+            if self._thread is not None:
+                self._queue.put(None)
+                self._thread.join()
+                self._thread = None
+        self.exporter.shutdown()
+
+    def _run(self):
+        while True:
+            spans = self._queue.get()
+            if spans is None:
+                return
+            try:
+                self.exporter.export(spans)
+            except Exception:
+                logger.exception("No se pudo exportar una traza")
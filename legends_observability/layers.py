@@ -0,0 +1,169 @@
+import functools
+import inspect
+from contextvars import ContextVar, Token
+from typing import Callable, Optional
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Capas de la aplicación a las que se atribuye el tiempo de una solicitud
+CONTROLLER = "controller"
+BL = "bl"
+MAPPER = "mapper"
+DAL = "dal"
+SQL = "sql"
+SERIALIZATION = "serialization"
+
+# Observador de la solicitud en curso (por ejemplo, un `RequestProfile`); `None` si no se observa.
+# AnyIO copia el contexto a los hilos de los endpoints síncronos, por lo que también es visible ahí.
+# Un observador implementa `enter(layer, name, attributes=None)` y `exit(error=None)`.
+current_observer: ContextVar[Optional[object]] = ContextVar("current_observer", default=None)
+
+# Función que se llama en el hilo del endpoint síncrono justo antes de ejecutarlo (ver `InstrumentedRoute`);
+# permite medir la espera por un hilo sin un salto adicional al pool.
+endpoint_started: ContextVar[Optional[Callable[[], None]]] = ContextVar("endpoint_started", default=None)
+
+
+class ObserverGroup:
+    """Reparte las llamadas de las capas entre varios observadores (por ejemplo, perfil y traza)."""
+
+    def __init__(self, *observers):
+        self.observers = observers
+
+    def enter(self, layer: str, name: str, attributes: Optional[dict] = None):
+        for observer in self.observers:
+            observer.enter(layer, name, attributes)
+
+    def exit(self, error: Optional[BaseException] = None):
+        for observer in reversed(self.observers):
+            observer.exit(error)
+
+
+def push_observer(observer) -> Token:
+    """
+    Activa un observador para la solicitud en curso, sumándolo al que ya estuviera activo.
+
+    Returns:
+        Token: Token para restaurar el observador anterior con `current_observer.reset`.
+    """
+    active = current_observer.get()
+    return current_observer.set(observer if active is None else ObserverGroup(active, observer))
+
+
+def observe(layer: str, name: str, func: Callable) -> Callable:
+    """
+    Envuelve una función para que el observador de la solicitud en curso mida sus llamadas.
+
+    Sin observador, el costo adicional es una lectura de `ContextVar`.
+
+    Args:
+        layer (str): Capa a la que pertenece la función (`bl`, `dal`, ...).
+        name (str): Nombre con el que se reporta (`Clase.metodo`).
+        func (Callable): Función a envolver.
+
+    Returns:
+        Callable: Función envuelta.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        observer = current_observer.get()
+        if observer is None:
+            return func(*args, **kwargs)
+        observer.enter(layer, name)
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            observer.exit(e)
+            raise
+        observer.exit()
+        return result
+
+    return wrapper
+
+
+def instrumented(layer: str):
+    """
+    Decorador de clase que mide todos sus métodos públicos (incluidos los estáticos) como parte de una capa.
+
+    Args:
+        layer (str): Capa a la que pertenece la clase.
+
+    Returns:
+        Callable: Decorador de clase.
+    """
+    def decorator(cls: type) -> type:
+        for name, attribute in list(vars(cls).items()):
+            if name.startswith("_"):
+                continue
+            qualified = f"{cls.__name__}.{name}"
+            if isinstance(attribute, staticmethod):
+                setattr(cls, name, staticmethod(observe(layer, qualified, attribute.__func__)))
+            elif inspect.isfunction(attribute):
+                setattr(cls, name, observe(layer, qualified, attribute))
+        return cls
+
+    return decorator
+
+
+def _notify_started(func: Callable) -> Callable:
+    """Envuelve un endpoint síncrono para que llame a `endpoint_started`, si hay una, al empezar en su hilo."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        callback = endpoint_started.get()
+        if callback is not None:
+            callback()
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+class InstrumentedRoute(APIRoute):
+    """
+    Ruta de FastAPI que mide su endpoint como capa `controller`.
+
+    Se usa como `route_class` de los routers; los endpoints asíncronos no se envuelven. Al
+    empezar en su hilo, el endpoint llama a `endpoint_started`. También deja en el scope de la
+    solicitud la plantilla de la ruta (`route_path`, por ejemplo `/legends/{legend_id}`), para
+    nombrar las trazas.
+    """
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        # `include_router` vuelve a crear la ruta con el endpoint ya envuelto
+        if not inspect.iscoroutinefunction(endpoint) and not getattr(endpoint, "_observed", False):
+            module = endpoint.__module__.rsplit(".", 1)[-1]
+            endpoint = _notify_started(observe(CONTROLLER, f"{module}.{endpoint.__name__}", endpoint))
+            endpoint._observed = True
+        super().__init__(path, endpoint, **kwargs)
+
+    def matches(self, scope):
+        match, child_scope = super().matches(scope)
+        if child_scope:
+            child_scope["route_path"] = self.path_format
+        return match, child_scope
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    observer = current_observer.get()
+    if observer is not None:
+        words = statement.split(None, 1)
+        observer.enter(SQL, f"SQL {words[0].upper()}" if words else "SQL",
+                       {"db.statement": statement, "db.executemany": executemany})
+        context._legends_observer = observer
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    observer = getattr(context, "_legends_observer", None)
+    if observer is not None:
+        context._legends_observer = None
+        observer.exit()
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    context = exception_context.execution_context
+    observer = getattr(context, "_legends_observer", None)
+    if observer is not None:
+        context._legends_observer = None
+        observer.exit(exception_context.original_exception)
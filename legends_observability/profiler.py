@@ -0,0 +1,179 @@
+import cProfile
+import os
+import pstats
+import threading
+import time
+from typing import Dict, List, Optional
+from legends_observability.layers import (BL, CONTROLLER, DAL, MAPPER, SERIALIZATION, SQL,
+                                          current_observer)
+
+# Orden en que se reportan las capas
+LAYERS = (CONTROLLER, BL, MAPPER, DAL, SQL, SERIALIZATION)
+
+
+class RequestProfile:
+    """
+    Perfil de una solicitud: tiempo por capa, llamadas por método y funciones más costosas.
+
+    Las capas instrumentadas (`instrumented`, `InstrumentedRoute` y las sentencias SQL) llaman a
+    `enter`/`exit`. El tiempo de cada capa es exclusivo: mientras un BL llama a un DAL, el tiempo
+    cuenta para el DAL y no para el BL. El resto de la solicitud (dependencias, validación y
+    envío de la respuesta) se reporta como `other`.
+
+    Cada hilo lleva su propia pila de llamadas; al entrar a la primera capa de un hilo (el
+    endpoint, que corre en el pool de hilos de AnyIO) se activa `cProfile` en ese hilo hasta que
+    la pila se vacía.
+    """
+
+    def __init__(self, top_functions: int = 30):
+        self.top_functions = top_functions
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+        self.layers: Dict[str, float] = dict.fromkeys(LAYERS, 0.0)
+        self.calls: Dict[str, List[float]] = {}
+        self.sql_statements = 0
+        self._lock = threading.Lock()
+        self._stacks: Dict[int, list] = {}
+        self._profilers: Dict[int, cProfile.Profile] = {}
+        self._stats: Optional[pstats.Stats] = None
+
+    def enter(self, layer: str, name: str, attributes: Optional[dict] = None):
+        """Registra el inicio de una llamada de una capa en el hilo actual."""
+        now = time.perf_counter()
+        thread_id = threading.get_ident()
+        stack = self._stacks.get(thread_id)
+        if stack is None:
+            stack = self._stacks[thread_id] = []
+        if stack:
+            # La llamada anterior queda en pausa mientras corre la nueva
+            parent = stack[-1]
+            self._add_layer(parent[0], now - parent[3])
+        else:
+            self._start_cprofile(thread_id)
+        if layer == SQL:
+            with self._lock:
+                self.sql_statements += 1
+        # [capa, nombre, inicio, reanudación]
+        stack.append([layer, name, now, now])
+
+    def exit(self, error: Optional[BaseException] = None):
+        """Registra el fin de la última llamada abierta en el hilo actual."""
+        now = time.perf_counter()
+        thread_id = threading.get_ident()
+        stack = self._stacks.get(thread_id)
+        if not stack:
+            return
+        layer, name, started, resumed = stack.pop()
+        self._add_layer(layer, now - resumed)
+        with self._lock:
+            totals = self.calls.setdefault(name, [0, 0.0])
+            totals[0] += 1
+            totals[1] += now - started
+        if stack:
+            stack[-1][3] = now
+        else:
+            self._stop_cprofile(thread_id)
+
+    def finish(self):
+        """Marca el fin de la solicitud."""
+        self.finished = time.perf_counter()
+
+    @property
+    def total(self) -> float:
+        return (self.finished or time.perf_counter()) - self.started
+
+    def summary(self) -> dict:
+        """
+        Resumen del perfil, serializable como JSON.
+
+        Returns:
+            dict: Tiempo total, tiempo por capa, llamadas por método, cantidad de sentencias SQL y
+            funciones con más tiempo acumulado según `cProfile`. Los tiempos están en milisegundos.
+        """
+        total = self.total
+        layers = {layer: round(seconds * 1000, 3) for layer, seconds in self._layer_totals(total).items()}
+        calls = {name: {"calls": count, "totalMs": round(seconds * 1000, 3)}
+                 for name, (count, seconds) in sorted(self.calls.items(), key=lambda x: -x[1][1])}
+        return {
+            "totalMs": round(total * 1000, 3),
+            "layers": layers,
+            "calls": calls,
+            "sqlStatements": self.sql_statements,
+            "topFunctions": self._top_functions(),
+        }
+
+    def server_timing(self) -> str:
+        """Valor del encabezado `Server-Timing` con la duración de cada capa."""
+        total = self.total
+        metrics = [f"{layer};dur={seconds * 1000:.3f}" for layer, seconds in self._layer_totals(total).items() if seconds]
+        metrics.append(f"total;dur={total * 1000:.3f}")
+        return ", ".join(metrics)
+
+    def dump_stats(self, path: str) -> bool:
+        """
+        Guarda las estadísticas de `cProfile` en formato `pstats` (legibles con `snakeviz` o `pstats`).
+
+        Returns:
+            bool: `False` si no hay estadísticas que guardar.
+        """
+        if self._stats is None:
+            return False
+        self._stats.dump_stats(path)
+        return True
+
+    def _layer_totals(self, total: float) -> Dict[str, float]:
+        layers = dict(self.layers)
+        layers["other"] = max(0.0, total - sum(self.layers.values()))
+        return layers
+
+    def _add_layer(self, layer: str, seconds: float):
+        with self._lock:
+            self.layers[layer] = self.layers.get(layer, 0.0) + seconds
+
+    def _start_cprofile(self, thread_id: int):
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Ya hay otro perfilador activo en el hilo (por ejemplo, un depurador)
+            return
+        self._profilers[thread_id] = profiler
+
+    def _stop_cprofile(self, thread_id: int):
+        profiler = self._profilers.pop(thread_id, None)
+        if profiler is None:
+            return
+        profiler.disable()
+        try:
+            stats = pstats.Stats(profiler)
+        except TypeError:
+            # El perfilador no registró ninguna llamada
+            return
+        with self._lock:
+            if self._stats is None:
+                self._stats = stats
+            else:
+                self._stats.add(stats)
+
+    def _top_functions(self) -> List[dict]:
+        if self._stats is None:
+            return []
+        entries = sorted(self._stats.stats.items(), key=lambda x: -x[1][3])[:self.top_functions]
+        return [
+            {
+                "function": f"{_short_path(filename)}:{line}({function})",
+                "calls": calls,
+                "ownMs": round(own * 1000, 3),
+                "cumulativeMs": round(cumulative * 1000, 3),
+            }
+            for (filename, line, function), (_, calls, own, cumulative, _) in entries
+        ]
+
+
+def _short_path(filename: str) -> str:
+    """Ruta relativa al proyecto o a `site-packages`, para que el perfil sea legible."""
+    if "site-packages" in filename:
+        return filename.split("site-packages" + os.sep, 1)[-1]
+    cwd = os.getcwd()
+    return os.path.relpath(filename, cwd) if filename.startswith(cwd) else filename
+
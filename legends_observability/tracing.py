@@ -0,0 +1,164 @@
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from legends_observability.layers import MAPPER
+
+TRACEPARENT_PATTERN = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+def new_trace_id() -> str:
+    return os.urandom(16).hex()
+
+
+def new_span_id() -> str:
+    return os.urandom(8).hex()
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[Tuple[str, str, bool]]:
+    """
+    Interpreta un encabezado `traceparent` (W3C Trace Context).
+
+    Args:
+        value (Optional[str]): Valor del encabezado.
+
+    Returns:
+        Optional[Tuple[str, str, bool]]: ID de la traza, ID del span padre y si el llamador la
+        muestreó, o `None` si falta o no es válido.
+    """
+    match = TRACEPARENT_PATTERN.match(value.strip().lower()) if value else None
+    if match is None:
+        return None
+    trace_id, parent_id, flags = match.groups()
+    if trace_id == "0" * 32 or parent_id == "0" * 16:
+        return None
+    return trace_id, parent_id, bool(int(flags, 16) & 0x01)
+
+
+@dataclass
+class Span:
+    """
+    Operación medida dentro de una traza.
+
+    Atributos:
+        trace_id (str): ID de la traza (32 caracteres hexadecimales).
+        span_id (str): ID del span (16 caracteres hexadecimales).
+        parent_id (Optional[str]): ID del span padre; `None` si la traza empieza aquí.
+        name (str): Nombre de la operación (`LegendBL.get_all`, `GET /legends/{legend_id}`, ...).
+        kind (str): Capa a la que pertenece (`server`, `controller`, `bl`, `mapper`, `dal`, `sql`, ...).
+        start_ns (int): Inicio, en nanosegundos desde la época Unix.
+        end_ns (int): Fin, en nanosegundos desde la época Unix.
+        attributes (dict): Atributos adicionales.
+        error (Optional[str]): Excepción con la que terminó la operación, si falló.
+    """
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    name: str
+    kind: str
+    start_ns: int
+    end_ns: int = 0
+    attributes: dict = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": self.start_ns,
+            "endTimeUnixNano": self.end_ns,
+            "durationMs": round((self.end_ns - self.start_ns) / 1e6, 3),
+            "attributes": self.attributes,
+            "status": "error" if self.error else "ok",
+            "error": self.error,
+        }
+
+
+class Trace:
+    """
+    Traza de una solicitud: un span raíz y un span por cada llamada de las capas instrumentadas.
+
+    Recibe las llamadas de las capas (`enter`/`exit`) como observador de la solicitud en curso.
+    Cada hilo lleva su propia pila de spans abiertos; los spans del hilo del endpoint cuelgan del
+    span raíz. Las llamadas consecutivas a un mismo mapper bajo el mismo padre (por ejemplo, un
+    `convert_to_entity` por cada fila) se agrupan en un solo span con el atributo `count`.
+    """
+
+    def __init__(self, name: str, trace_id: Optional[str] = None, parent_id: Optional[str] = None,
+                 max_statement_length: int = 1000):
+        self.max_statement_length = max_statement_length
+        self.root = Span(trace_id or new_trace_id(), new_span_id(), parent_id, name, "server", time.time_ns())
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+        self._stacks: Dict[int, List[Span]] = {}
+        self._last_child: Dict[str, Span] = {}
+
+    @property
+    def traceparent(self) -> str:
+        """Encabezado `traceparent` que identifica el span raíz de esta traza."""
+        return f"00-{self.root.trace_id}-{self.root.span_id}-01"
+
+    def enter(self, layer: str, name: str, attributes: Optional[dict] = None):
+        """Abre un span hijo del último span abierto en el hilo actual."""
+        now = time.time_ns()
+        thread_id = threading.get_ident()
+        stack = self._stacks.get(thread_id)
+        if stack is None:
+            stack = self._stacks[thread_id] = []
+        parent = stack[-1] if stack else self.root
+
+        if layer == MAPPER:
+            previous = self._last_child.get(parent.span_id)
+            if previous is not None and previous.name == name:
+                # Se reabre el span del lote anterior
+                previous.attributes["count"] += 1
+                stack.append(previous)
+                return
+
+        span = Span(self.root.trace_id, new_span_id(), parent.span_id, name, layer, now)
+        if attributes:
+            span.attributes.update(attributes)
+            statement = span.attributes.get("db.statement")
+            if statement is not None and len(statement) > self.max_statement_length:
+                span.attributes["db.statement"] = statement[:self.max_statement_length] + "…"
+        if layer == MAPPER:
+            span.attributes["count"] = 1
+        stack.append(span)
+
+    def exit(self, error: Optional[BaseException] = None):
+        """Cierra el último span abierto en el hilo actual."""
+        now = time.time_ns()
+        stack = self._stacks.get(threading.get_ident())
+        if not stack:
+            return
+        span = stack.pop()
+        reopened = span.end_ns != 0
+        span.end_ns = now
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+        parent_id = span.parent_id
+        with self._lock:
+            self._last_child[parent_id] = span
+            if not reopened:
+                self.spans.append(span)
+
+    def finish(self, attributes: Optional[dict] = None) -> List[Span]:
+        """
+        Cierra el span raíz.
+
+        Args:
+            attributes (Optional[dict]): Atributos adicionales del span raíz.
+
+        Returns:
+            List[Span]: Todos los spans de la traza, empezando por el raíz.
+        """
+        self.root.end_ns = time.time_ns()
+        if attributes:
+            self.root.attributes.update(attributes)
+        with self._lock:
+            return [self.root, *self.spans]
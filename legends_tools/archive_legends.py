@@ -0,0 +1,49 @@
+"""
+Trabajo de archivado de leyendas eliminadas.
+
+Mueve en lotes las leyendas inactivas de la tabla `legend` a `legend_archive`, de modo que la
+tabla viva y sus índices solo contengan leyendas activas. Pensado para ejecutarse
+periódicamente (por ejemplo, con cron). También permite restaurar una leyenda archivada.
+
+Uso:
+    python -m legends_tools.archive_legends [--batch-size N] [--max-batches N]
+    python -m legends_tools.archive_legends --restore <legend_id>
+"""
+import argparse
+import sys
+from uuid import UUID
+from legends_bl import LegendArchiveBL
+from legends_config.database.db_config import sessionLocal
+from legends_config.settings import settings
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Archiva las leyendas inactivas o restaura una leyenda archivada.")
+    parser.add_argument("--batch-size", type=int, default=settings.legends_archive_batch_size,
+                        help="Cantidad de leyendas por lote (una transacción por lote).")
+    parser.add_argument("--max-batches", type=int, default=None,
+                        help="Cantidad máxima de lotes a procesar en esta ejecución.")
+    parser.add_argument("--restore", type=UUID, default=None,
+                        help="Restaurar la leyenda archivada con este ID en lugar de archivar.")
+    args = parser.parse_args(argv)
+
+    db = sessionLocal()
+    try:
+        legend_archive_bl = LegendArchiveBL(db)
+        if args.restore:
+            result = legend_archive_bl.restore(args.restore)
+        else:
+            result = legend_archive_bl.archive_inactive(args.batch_size, args.max_batches)
+    finally:
+        db.close()
+
+    if "error" in result:
+        print(result["error"], file=sys.stderr)
+        return 1
+
+    print(result["message"])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
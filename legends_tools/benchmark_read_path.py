@@ -0,0 +1,177 @@
+"""
+Comparación de la lectura de listados con el ORM y con `select()` de columnas.
+
+Para `DistrictDAL.get_all`, `CantonDAL.get_all` y `LegendDAL.get_all` ejecuta dos caminos que
+producen los mismos DTOs:
+
+- `orm`: `db.query(Modelo)` (instancias del ORM, con mapa de identidad y estado por fila),
+  como se leían antes los listados.
+- `core`: el método actual de la capa DAL, que consulta solo las columnas con `select()` y
+  devuelve filas livianas, convertidas a DTOs desempaquetándolas por posición.
+
+Para cada camino informa el tiempo por fila de la consulta y de la conversión a DTOs (mediana de
+varias repeticiones, cada una con una sesión nueva) y la memoria máxima por fila durante la
+consulta, medida con `tracemalloc`.
+
+Uso:
+    python -m legends_tools.benchmark_read_path                        # SQLite temporal con 20000 leyendas
+    python -m legends_tools.benchmark_read_path --seed-legends 100000 --repeat 20
+    python -m legends_tools.benchmark_read_path --database-url URL     # contra una base existente
+"""
+import argparse
+import gc
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, List
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, defer, sessionmaker
+from legends_bl.mappers import CantonMapper, DistrictMapper, LegendMapper
+from legends_dal import CantonDAL, DistrictDAL, LegendDAL
+from legends_models import CantonModel, DistrictModel, LegendModel
+from legends_tools.explain_plans import seed_sqlite
+
+
+@dataclass
+class ReadPath:
+    """
+    Forma de leer un listado.
+
+    Atributos:
+        name (str): Nombre del caso (`LegendDAL.get_all[orm]`).
+        fetch (Callable[[Session], list]): Consulta que devuelve las filas o instancias.
+        convert (Callable): Conversión de cada fila o instancia a DTO.
+    """
+    name: str
+    fetch: Callable[[Session], list]
+    convert: Callable
+
+
+@dataclass
+class ReadPathResult:
+    """
+    Resultado de un `ReadPath`.
+
+    Atributos:
+        name (str): Nombre del caso.
+        rows (int): Filas leídas.
+        fetch_us (float): Microsegundos por fila de la consulta (mediana).
+        convert_us (float): Microsegundos por fila de la conversión a DTOs (mediana).
+        peak_bytes (float): Memoria máxima por fila durante la consulta.
+    """
+    name: str
+    rows: int
+    fetch_us: float
+    convert_us: float
+    peak_bytes: float
+
+
+def build_paths(legends_limit: int) -> List[ReadPath]:
+    """Caminos `orm` y `core` de cada listado."""
+    return [
+        ReadPath("DistrictDAL.get_all[orm]", lambda db: db.query(DistrictModel).all(),
+                 DistrictMapper.convert_to_entity),
+        ReadPath("DistrictDAL.get_all[core]", lambda db: DistrictDAL(db).get_all(),
+                 DistrictMapper.convert_row_to_entity),
+        ReadPath("CantonDAL.get_all[orm]", lambda db: db.query(CantonModel).all(),
+                 CantonMapper.convert_to_entity),
+        ReadPath("CantonDAL.get_all[core]", lambda db: CantonDAL(db).get_all(),
+                 CantonMapper.convert_row_to_entity),
+        ReadPath("LegendDAL.get_all[orm]",
+                 lambda db: db.query(LegendModel).options(defer(LegendModel.description)).filter(
+                     LegendModel.is_active == True).offset(0).limit(legends_limit).all(),
+                 LegendMapper.convert_to_summary_entity),
+        ReadPath("LegendDAL.get_all[core]", lambda db: LegendDAL(db).get_all(0, legends_limit),
+                 LegendMapper.convert_row_to_summary_entity),
+    ]
+
+
+def measure(session_factory: sessionmaker, path: ReadPath, repeat: int) -> ReadPathResult:
+    """
+    Mide el tiempo y la memoria de un camino de lectura.
+
+    Args:
+        session_factory (sessionmaker): Fábrica de sesiones de la base de datos.
+        path (ReadPath): Camino a medir.
+        repeat (int): Repeticiones para el tiempo; la primera, de calentamiento, no se cuenta.
+
+    Returns:
+        ReadPathResult: Tiempos y memoria por fila.
+    """
+    fetch_times, convert_times, rows = [], [], 0
+    for i in range(repeat + 1):
+        db = session_factory()
+        try:
+            started = time.perf_counter()
+            result = path.fetch(db)
+            fetched = time.perf_counter()
+            [path.convert(x) for x in result]
+            converted = time.perf_counter()
+        finally:
+            db.close()
+        if isinstance(result, dict) and "error" in result:
+            raise RuntimeError(f"{path.name}: {result['error']}")
+        rows = len(result)
+        if i:
+            fetch_times.append(fetched - started)
+            convert_times.append(converted - fetched)
+        del result
+
+    db = session_factory()
+    try:
+        gc.collect()
+        tracemalloc.start()
+        result = path.fetch(db)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del result
+    finally:
+        db.close()
+
+    per_row = max(rows, 1)
+    return ReadPathResult(
+        name=path.name,
+        rows=rows,
+        fetch_us=statistics.median(fetch_times) / per_row * 1e6,
+        convert_us=statistics.median(convert_times) / per_row * 1e6,
+        peak_bytes=peak / per_row,
+    )
+
+
+def run(engine: Engine, repeat: int, legends_limit: int) -> List[ReadPathResult]:
+    """Mide todos los caminos de lectura contra una base de datos."""
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    return [measure(session_factory, path, repeat) for path in build_paths(legends_limit)]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compara la lectura de listados con el ORM y con select() de columnas.")
+    parser.add_argument("--database-url", default=None,
+                        help="Base de datos con datos (por defecto, una SQLite temporal con datos sintéticos).")
+    parser.add_argument("--seed-legends", type=int, default=20000,
+                        help="Leyendas sintéticas de la base SQLite temporal.")
+    parser.add_argument("--legends-limit", type=int, default=10000, help="Leyendas por consulta del listado.")
+    parser.add_argument("--repeat", type=int, default=10, help="Repeticiones de cada medición.")
+    args = parser.parse_args(argv)
+
+    engine = create_engine(args.database_url) if args.database_url else seed_sqlite(args.seed_legends)
+
+    results = run(engine, args.repeat, args.legends_limit)
+    print(f"{'Caso':<28}{'Filas':>8}{'Consulta µs/fila':>19}{'DTO µs/fila':>14}{'Memoria B/fila':>17}")
+    for result in results:
+        print(f"{result.name:<28}{result.rows:>8}{result.fetch_us:>19.2f}{result.convert_us:>14.2f}"
+              f"{result.peak_bytes:>17.0f}")
+
+    # Cada par orm/core es consecutivo en `build_paths`
+    for orm, core in zip(results[::2], results[1::2]):
+        orm_total, core_total = orm.fetch_us + orm.convert_us, core.fetch_us + core.convert_us
+        print(f"{core.name.split('[')[0]}: {orm_total / core_total:.1f}x más rápido por fila "
+              f"(consulta {orm.fetch_us / core.fetch_us:.1f}x), {orm.peak_bytes / core.peak_bytes:.1f}x menos memoria por fila.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""
+Compresión de descripciones y cálculo de extractos de las leyendas existentes.
+
+Después de convertir la columna `description` a binario y agregar `excerpt` (ver README), este
+trabajo reescribe cada descripción para que `CompressedText` comprima las extensas y completa el
+extracto que usan los listados. Procesa `legend` y `legend_archive` en lotes, una transacción
+por lote, y puede volver a ejecutarse sin efectos adicionales.
+
+Uso:
+    python -m legends_tools.compress_descriptions [--batch-size N]
+"""
+import argparse
+import sys
+from sqlalchemy import Engine, bindparam, select, update
+from legends_bl.mappers import LegendMapper
+from legends_config.database.db_config import engine
+from legends_models import LegendArchiveModel, LegendModel
+
+
+def rewrite_table(engine: Engine, table, batch_size: int) -> int:
+    """
+    Reescribe la descripción y el extracto de todas las filas de una tabla.
+
+    Args:
+        engine (Engine): Motor de la base de datos.
+        table (Table): Tabla `legend` o `legend_archive`.
+        batch_size (int): Filas por lote.
+
+    Returns:
+        int: Cantidad de filas procesadas.
+    """
+    statement = update(table).where(table.c.id == bindparam("row_id")).values(
+        description=bindparam("new_description"), excerpt=bindparam("new_excerpt"))
+
+    processed, last_id = 0, None
+    while True:
+        query = select(table.c.id, table.c.description).order_by(table.c.id).limit(batch_size)
+        if last_id is not None:
+            query = query.where(table.c.id > last_id)
+
+        with engine.begin() as conn:
+            rows = conn.execute(query).all()
+            if not rows:
+                return processed
+            conn.execute(statement, [
+                {"row_id": row.id, "new_description": row.description,
+                 "new_excerpt": LegendMapper.build_excerpt(row.description)}
+                for row in rows
+            ])
+
+        processed += len(rows)
+        last_id = rows[-1].id
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Comprime las descripciones y calcula los extractos de las leyendas.")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Filas por lote (una transacción por lote).")
+    args = parser.parse_args(argv)
+
+    for model in (LegendModel, LegendArchiveModel):
+        processed = rewrite_table(engine, model.__table__, args.batch_size)
+        print(f"{model.__tablename__}: {processed} filas procesadas.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,347 @@
+"""
+Verificación de planes de ejecución (EXPLAIN) de las consultas de la capa DAL.
+
+Ejecuta cada método de `LegendDAL`, `CantonDAL`, `DistrictDAL`, `ProvinceDAL` y `CategoryDAL`
+contra una base de datos con datos, captura las sentencias SQL que emiten y obtiene su plan.
+Termina con código 1 si algún plan recorre completa una tabla o necesita ordenar en memoria
+(filesort) sobre una tabla con más filas que el umbral, de modo que pueda usarse como control
+en CI. Con `--ddl` imprime el DDL de los índices que necesitan los modelos.
+
+Uso:
+    python -m legends_tools.explain_plans [--database-url URL] [--threshold N]
+    python -m legends_tools.explain_plans --seed-legends 50000   # SQLite temporal con datos sintéticos
+    python -m legends_tools.explain_plans --ddl
+"""
+import argparse
+import datetime
+import sys
+import tempfile
+import uuid
+from dataclasses import dataclass, field
+from typing import Callable, List
+from sqlalchemy import Index, create_engine, event, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.schema import CreateIndex
+from legends_config.database.db_config import Base
+from legends_config.settings import settings
+from legends_dal import CantonDAL, CategoryDAL, DistrictDAL, LegendDAL, LegendArchiveDAL, ProvinceDAL
+from legends_models import CantonModel, CategoryModel, DistrictModel, LegendModel, ProvinceModel
+
+
+@dataclass
+class Probe:
+    """
+    Llamada representativa a un método de la capa DAL.
+
+    Atributos:
+        name (str): Nombre del método (`Clase.metodo[variante]`).
+        call (Callable[[Session], object]): Función que ejecuta el método con una sesión.
+        allow_scan (bool): Si se permite recorrer la tabla completa (listados completos, o sin filtros con
+            `LIMIT` y en el orden de un índice); los ordenamientos en memoria se detectan igualmente.
+    """
+    name: str
+    call: Callable[[Session], object]
+    allow_scan: bool = False
+
+
+@dataclass
+class PlanReport:
+    """
+    Plan de ejecución de una sentencia emitida por un `Probe`.
+
+    Atributos:
+        probe (str): Nombre del `Probe` que emitió la sentencia.
+        statement (str): Sentencia SQL.
+        plan (List[str]): Líneas del plan de ejecución.
+        problems (List[str]): Regresiones detectadas en el plan.
+    """
+    probe: str
+    statement: str
+    plan: List[str]
+    problems: List[str] = field(default_factory=list)
+
+
+def build_probes(db: Session) -> List[Probe]:
+    """
+    Construye las llamadas a cada método de la capa DAL usando valores reales de la base de datos.
+
+    Args:
+        db (Session): Sesión de la base de datos a analizar.
+
+    Returns:
+        List[Probe]: Llamadas a ejecutar.
+    """
+    province = db.query(ProvinceModel).first()
+    canton = db.query(CantonModel).first()
+    district = db.query(DistrictModel).first()
+    category = db.query(CategoryModel).first()
+    legend = db.query(LegendModel).first()
+
+    province_id = province.id if province else 1
+    canton_id = canton.id if canton else 1
+    district_id = district.id if district else 1
+    category_id = category.id if category else ""
+    legend_id = legend.id if legend else str(uuid.uuid4())
+    changed_at = legend.updated_at if legend else datetime.datetime(2020, 1, 1)
+    today = datetime.date.today()
+
+    return [
+        Probe("CategoryDAL.get_all", lambda s: CategoryDAL(s).get_all(), allow_scan=True),
+        Probe("ProvinceDAL.get_all", lambda s: ProvinceDAL(s).get_all(), allow_scan=True),
+        Probe("ProvinceDAL.get_names", lambda s: ProvinceDAL(s).get_names(), allow_scan=True),
+        Probe("ProvinceDAL.get_by_id", lambda s: ProvinceDAL(s).get_by_id(province_id)),
+        Probe("ProvinceDAL.get_tree", lambda s: ProvinceDAL(s).get_tree(), allow_scan=True),
+        Probe("CantonDAL.get_all", lambda s: CantonDAL(s).get_all(), allow_scan=True),
+        Probe("CantonDAL.get_names", lambda s: CantonDAL(s).get_names(), allow_scan=True),
+        Probe("CantonDAL.get_by_id", lambda s: CantonDAL(s).get_by_id(canton_id)),
+        Probe("CantonDAL.get_by_province_id", lambda s: CantonDAL(s).get_by_province_id(province_id)),
+        Probe("DistrictDAL.get_all", lambda s: DistrictDAL(s).get_all(), allow_scan=True),
+        Probe("DistrictDAL.get_by_id", lambda s: DistrictDAL(s).get_by_id(district_id)),
+        Probe("DistrictDAL.get_by_canton_id", lambda s: DistrictDAL(s).get_by_canton_id(canton_id)),
+        Probe("DistrictDAL.get_ids_by_canton_id", lambda s: DistrictDAL(s).get_ids_by_canton_id(canton_id)),
+        Probe("DistrictDAL.get_ids_by_province_id", lambda s: DistrictDAL(s).get_ids_by_province_id(province_id)),
+        Probe("DistrictDAL.get_centroids", lambda s: DistrictDAL(s).get_centroids(), allow_scan=True),
+        Probe("LegendDAL.get_by_id", lambda s: LegendDAL(s).get_by_id(legend_id)),
+        Probe("LegendDAL.get_full_by_id", lambda s: LegendDAL(s).get_full_by_id(legend_id)),
+        Probe("LegendDAL.get_by_ids", lambda s: LegendDAL(s).get_by_ids([legend_id, str(uuid.uuid4())])),
+        Probe("LegendDAL.get_district_ids", lambda s: LegendDAL(s).get_district_ids(), allow_scan=True),
+        Probe("LegendDAL.get_district_ids[ids]",
+              lambda s: LegendDAL(s).get_district_ids([legend_id, str(uuid.uuid4())])),
+        Probe("LegendDAL.get_names", lambda s: LegendDAL(s).get_names(), allow_scan=True),
+        Probe("LegendDAL.get_names[ids]", lambda s: LegendDAL(s).get_names([legend_id, str(uuid.uuid4())])),
+        Probe("LegendDAL.get_all", lambda s: LegendDAL(s).get_all(), allow_scan=True),
+        Probe("LegendDAL.get_all[sort=-date]", lambda s: LegendDAL(s).get_all(sort="-date"), allow_scan=True),
+        Probe("LegendDAL.get_all[sort=name]", lambda s: LegendDAL(s).get_all(sort="name"), allow_scan=True),
+        Probe("LegendDAL.get_all[category]",
+              lambda s: LegendDAL(s).get_all(category_id=category_id, sort="date")),
+        Probe("LegendDAL.get_all[district]",
+              lambda s: LegendDAL(s).get_all(district_ids=[district_id], sort="-date")),
+        Probe("LegendDAL.get_all[districts]",
+              lambda s: LegendDAL(s).get_all(district_ids=[district_id, district_id + 1])),
+        Probe("LegendDAL.get_all[dates]",
+              lambda s: LegendDAL(s).get_all(date_from=today.replace(year=today.year - 1), date_to=today)),
+        # Las leyendas inactivas son pocas: el prefijo `is_active` del índice basta para encontrarlas
+        Probe("LegendArchiveDAL.get_inactive_ids",
+              lambda s: LegendArchiveDAL(s).get_inactive_ids(500), allow_scan=True),
+        Probe("LegendDAL.get_changes",
+              lambda s: LegendDAL(s).get_changes(changed_at, legend_id, datetime.datetime.now(), 100)),
+        Probe("LegendArchiveDAL.get_changes",
+              lambda s: LegendArchiveDAL(s).get_changes(changed_at, legend_id, datetime.datetime.now(), 100)),
+    ]
+
+
+def capture_statements(engine: Engine, db: Session, probe: Probe) -> List[tuple]:
+    """
+    Ejecuta un `Probe` y devuelve las sentencias SQL que emitió con sus parámetros.
+    """
+    captured = []
+
+    def listener(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        probe.call(db)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+        db.rollback()
+    return captured
+
+
+# Columnas cuyo filtro por sí solo no reduce las filas a recorrer (un índice que solo las usa equivale a un recorrido completo)
+LOW_SELECTIVITY_COLUMNS = {"is_active"}
+
+
+def _only_low_selectivity(detail: str) -> bool:
+    """
+    Indica si una búsqueda de SQLite (`SEARCH tabla USING INDEX idx (col=? AND ...)`) solo restringe columnas poco selectivas.
+    """
+    if "(" not in detail:
+        return False
+    constraints = detail[detail.rindex("(") + 1:detail.rindex(")")].split(" AND ")
+    columns = {c.split("=")[0].split(">")[0].split("<")[0].strip() for c in constraints}
+    return columns <= LOW_SELECTIVITY_COLUMNS
+
+
+def explain(engine: Engine, statement: str, parameters, table_sizes: dict, threshold: int, allow_scan: bool):
+    """
+    Obtiene el plan de una sentencia y detecta recorridos completos u ordenamientos en memoria.
+
+    Returns:
+        tuple: Líneas del plan y lista de problemas detectados.
+    """
+    plan, problems = [], []
+    with engine.connect() as conn:
+        if engine.dialect.name == "sqlite":
+            rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+            table = ""
+            for row in rows:
+                detail = row[-1]
+                plan.append(detail)
+                words = detail.split()
+                if words[0] in ("SCAN", "SEARCH"):
+                    table = words[1]
+                size = table_sizes.get(table, 0)
+                if size <= threshold:
+                    continue
+                if words[0] == "SCAN" and not allow_scan:
+                    problems.append(f"recorrido completo de '{table}' ({size} filas): {detail}")
+                if words[0] == "SEARCH" and not allow_scan and _only_low_selectivity(detail):
+                    problems.append(f"búsqueda solo por columnas poco selectivas en '{table}' ({size} filas): {detail}")
+                if detail.startswith("USE TEMP B-TREE FOR ORDER BY"):
+                    problems.append(f"ordenamiento en memoria de '{table}' ({size} filas): {detail}")
+        else:
+            result = conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+            columns = list(result.keys())
+            for row in result.all():
+                values = dict(zip(columns, row))
+                plan.append(", ".join(f"{k}={v}" for k, v in values.items()))
+                table = values.get("table") or ""
+                size = table_sizes.get(table, 0)
+                if size <= threshold:
+                    continue
+                if values.get("type") in ("ALL", "index") and not allow_scan:
+                    problems.append(f"recorrido completo de '{table}' ({size} filas)")
+                if "Using filesort" in (values.get("Extra") or ""):
+                    problems.append(f"filesort sobre '{table}' ({size} filas)")
+    return plan, problems
+
+
+def check_plans(engine: Engine, threshold: int) -> List[PlanReport]:
+    """
+    Captura y analiza el plan de cada sentencia emitida por la capa DAL.
+
+    Args:
+        engine (Engine): Motor de la base de datos con datos.
+        threshold (int): Cantidad de filas a partir de la cual un recorrido completo es una regresión.
+
+    Returns:
+        List[PlanReport]: Un reporte por sentencia.
+    """
+    db = sessionmaker(bind=engine, autoflush=False)()
+    try:
+        table_sizes = {
+            table.name: db.execute(select(func.count()).select_from(table)).scalar()
+            for table in Base.metadata.sorted_tables
+        }
+        reports = []
+        for probe in build_probes(db):
+            for statement, parameters in capture_statements(engine, db, probe):
+                plan, problems = explain(engine, statement, parameters, table_sizes, threshold, probe.allow_scan)
+                reports.append(PlanReport(probe.name, statement, plan, problems))
+        return reports
+    finally:
+        db.close()
+
+
+def index_ddl(engine: Engine) -> List[str]:
+    """
+    Genera el DDL de los índices declarados en los modelos y de las claves foráneas sin índice.
+
+    Returns:
+        List[str]: Sentencias `CREATE INDEX` para el dialecto del motor.
+    """
+    statements = []
+    for table in Base.metadata.sorted_tables:
+        indexes = sorted(table.indexes, key=lambda i: i.name)
+        leading_columns = {list(index.columns)[0].name for index in indexes}
+        for index in indexes:
+            statements.append(str(CreateIndex(index).compile(dialect=engine.dialect)).strip() + ";")
+
+        for fk in sorted(table.foreign_keys, key=lambda f: f.parent.name):
+            column = fk.parent
+            if column.name in leading_columns or column.primary_key:
+                continue
+            # Index() se asocia a la tabla al crearse; se retira después de compilarlo para no alterar los modelos
+            index = Index(f"ix_{table.name}_{column.name}", column)
+            statements.append(str(CreateIndex(index).compile(dialect=engine.dialect)).strip() + ";")
+            table.indexes.discard(index)
+    return statements
+
+
+def seed_sqlite(legends: int) -> Engine:
+    """
+    Crea una base de datos SQLite temporal con el catálogo y `legends` leyendas sintéticas.
+    """
+    path = tempfile.NamedTemporaryFile(suffix=".db", delete=False).name
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+
+    categories = [CategoryModel(id=str(uuid.uuid4()), name=f"Categoría {i}") for i in range(8)]
+    db.add_all(categories)
+    district_ids = []
+    for province_id in range(1, 8):
+        db.add(ProvinceModel(id=province_id, name=f"Provincia {province_id}"))
+        for c in range(12):
+            canton_id = province_id * 100 + c
+            db.add(CantonModel(id=canton_id, provinceId=province_id, name=f"Cantón {canton_id}"))
+            for d in range(6):
+                district_id = canton_id * 100 + d
+                district_ids.append(district_id)
+                db.add(DistrictModel(id=district_id, cantonId=canton_id, name=f"Distrito {district_id}"))
+    db.commit()
+
+    start = datetime.date(1900, 1, 1)
+    db.bulk_insert_mappings(LegendModel, [
+        {
+            "id": str(uuid.uuid4()),
+            "categoryId": categories[i % len(categories)].id,
+            "districtId": district_ids[i % len(district_ids)],
+            "name": f"Leyenda {i}",
+            "description": "Descripción",
+            "imageUrl": "https://example.com/image.png",
+            "date": start + datetime.timedelta(days=i % 45000),
+            "is_active": i % 10 != 0,
+            "created_at": datetime.datetime(2020, 1, 1) + datetime.timedelta(seconds=i),
+            "updated_at": datetime.datetime(2020, 1, 1) + datetime.timedelta(seconds=i),
+        }
+        for i in range(legends)
+    ])
+    db.commit()
+    db.close()
+
+    with engine.connect() as conn:
+        conn.exec_driver_sql("ANALYZE")
+    return engine
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Verifica los planes de ejecución de las consultas de la capa DAL.")
+    parser.add_argument("--database-url", default=settings.database_url,
+                        help="Base de datos con datos a analizar (por defecto DATABASE_URL).")
+    parser.add_argument("--seed-legends", type=int, default=0,
+                        help="Analizar una base SQLite temporal con esta cantidad de leyendas sintéticas.")
+    parser.add_argument("--threshold", type=int, default=1000,
+                        help="Filas a partir de las cuales un recorrido completo o filesort es una regresión.")
+    parser.add_argument("--ddl", action="store_true", help="Imprimir el DDL de índices y terminar.")
+    parser.add_argument("--verbose", action="store_true", help="Imprimir el plan de cada sentencia.")
+    args = parser.parse_args(argv)
+
+    engine = seed_sqlite(args.seed_legends) if args.seed_legends else create_engine(args.database_url)
+
+    if args.ddl:
+        print("\n".join(index_ddl(engine)))
+        return 0
+
+    reports = check_plans(engine, args.threshold)
+    failures = 0
+    for report in reports:
+        status = "FALLA" if report.problems else "OK"
+        print(f"[{status}] {report.probe}")
+        if args.verbose or report.problems:
+            print(f"    {' '.join(report.statement.split())}")
+            for line in report.plan:
+                print(f"      plan: {line}")
+        for problem in report.problems:
+            failures += 1
+            print(f"      ! {problem}")
+
+    print(f"{len(reports)} sentencias analizadas, {failures} regresiones.")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,297 @@
+"""
+Exportación de las respuestas de lectura a archivos JSON estáticos, para servirlas desde un CDN.
+
+Genera en un directorio la respuesta de cada endpoint de lectura del catálogo (`/provinces/...`,
+`/cantons/...`, `/districts/...`, `/categories/`), las páginas de `/legends/` y cada
+`/legends/{id}` y `/legends/{id}/full`. Cada archivo se escribe como `.json` y precomprimido como `.json.gz`, y
+`manifest.json` indica para cada ruta su archivo, su tamaño y su hash SHA-256.
+
+Las respuestas se obtienen ejecutando los mismos endpoints dentro del proceso, por lo que los
+archivos son idénticos a lo que responde la API. Los archivos solo se reescriben si cambió su
+contenido.
+
+La primera ejecución (o con `--full`) genera todas las leyendas. Las siguientes usan el cursor del
+feed de cambios guardado en el manifiesto y solo vuelven a generar las leyendas creadas o
+modificadas desde entonces, y eliminan los archivos de las eliminadas. El catálogo y las páginas
+del listado se regeneran siempre.
+
+Uso:
+    python -m legends_tools.export_snapshot --output DIR [--page-size N] [--full]
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sys
+from typing import Dict, Iterator, Optional, Tuple
+from urllib.parse import quote, urlencode
+import anyio
+from fastapi import FastAPI
+from legends_api.controllers import (cantons_router, categories_router, district_router, legends_router,
+                                     provinces_router)
+from legends_bl import LegendBL
+from legends_config.database.db_config import sessionLocal
+from legends_dal import CantonDAL, ProvinceDAL
+from legends_models.legend import utc_now
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+def build_app() -> FastAPI:
+    """
+    Aplicación con solo los routers de lectura y sin middlewares, para generar las respuestas
+    sin control de admisión ni límites de velocidad.
+    """
+    app = FastAPI()
+    for router in (provinces_router, cantons_router, district_router, categories_router, legends_router):
+        app.include_router(router)
+    return app
+
+
+async def render(app: FastAPI, path: str, query: Optional[dict] = None) -> Tuple[int, bytes]:
+    """
+    Ejecuta una solicitud `GET` contra la aplicación dentro del proceso.
+
+    Args:
+        app (FastAPI): Aplicación a consultar.
+        path (str): Ruta sin codificar (por ejemplo, `/cantons/by-province/San José`).
+        query (Optional[dict]): Parámetros de la consulta.
+
+    Returns:
+        Tuple[int, bytes]: Código de estado y cuerpo de la respuesta.
+    """
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "server": ("snapshot", 80), "client": ("127.0.0.1", 0), "root_path": "",
+        "path": path, "raw_path": quote(path).encode(), "query_string": urlencode(query or {}).encode(),
+        "headers": [(b"host", b"snapshot"), (b"accept", b"application/json")],
+    }
+    status_code, body = 500, []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+        elif message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status_code, b"".join(body)
+
+
+def file_for(path: str, query: Optional[dict] = None) -> str:
+    """
+    Archivo (relativo al directorio de salida) que corresponde a una ruta.
+
+    Las rutas que terminan en `/` usan `index.json`; las páginas del listado de leyendas se
+    guardan como `legends/pages/<skip>-<limit>.json`.
+    """
+    if query:
+        return f"legends/pages/{query['skip']}-{query['limit']}.json"
+    return f"{path.strip('/')}/index.json" if path.endswith("/") else f"{path.lstrip('/')}.json"
+
+
+class SnapshotWriter:
+    """
+    Escribe los archivos del snapshot y lleva el registro del manifiesto.
+
+    Un archivo solo se reescribe si su hash cambió respecto al manifiesto anterior.
+    """
+
+    def __init__(self, output: str, previous: Dict[str, dict]):
+        self.output = output
+        self.previous = previous
+        self.files: Dict[str, dict] = {}
+        self.written = 0
+
+    def write(self, route: str, file: str, body: bytes):
+        """Registra la respuesta de una ruta y escribe su archivo (y su versión `.gz`) si cambió."""
+        digest = hashlib.sha256(body).hexdigest()
+        target = os.path.join(self.output, file)
+        old = self.previous.get(route)
+        if old is None or old["sha256"] != digest or old["file"] != file or not os.path.exists(target):
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            _atomic_write(target, body)
+            # Sin fecha en el encabezado gzip, para que el mismo contenido produzca los mismos bytes
+            _atomic_write(target + ".gz", gzip.compress(body, compresslevel=9, mtime=0))
+            self.written += 1
+        self.files[route] = {"file": file, "sha256": digest, "size": len(body)}
+
+    def keep(self, route: str):
+        """Conserva sin cambios un archivo del snapshot anterior."""
+        self.files[route] = self.previous[route]
+
+    def remove_stale(self) -> int:
+        """Elimina los archivos del snapshot anterior que ya no corresponden a ninguna ruta."""
+        current = {entry["file"] for entry in self.files.values()}
+        removed = 0
+        for route, entry in self.previous.items():
+            if route not in self.files and entry["file"] not in current:
+                for name in (entry["file"], entry["file"] + ".gz"):
+                    target = os.path.join(self.output, name)
+                    if os.path.exists(target):
+                        os.remove(target)
+                removed += 1
+        return removed
+
+
+def _atomic_write(target: str, data: bytes):
+    temporary = f"{target}.tmp"
+    with open(temporary, "wb") as file:
+        file.write(data)
+    os.replace(temporary, target)
+
+
+def iter_changes(since: Optional[str]) -> Iterator[Tuple[str, bool, Optional[str]]]:
+    """
+    Recorre el feed de cambios de leyendas desde un cursor.
+
+    Yields:
+        Tuple[str, bool, Optional[str]]: ID de la leyenda, si fue eliminada y el cursor tras el cambio.
+
+    Raises:
+        ValueError: Si el cursor no es válido o la consulta falla.
+    """
+    db = sessionLocal()
+    try:
+        legend_bl = LegendBL(db)
+        while True:
+            page = legend_bl.get_changes(since, 500)
+            if isinstance(page, dict) and "error" in page:
+                raise ValueError(page["error"])
+            for change in page.changes:
+                yield str(change.id), change.deleted, page.nextCursor
+            since = page.nextCursor
+            if not page.hasMore:
+                return
+    finally:
+        db.close()
+
+
+def catalog_routes() -> Iterator[str]:
+    """Rutas de lectura del catálogo, incluidas las de cada provincia y cantón."""
+    db = sessionLocal()
+    try:
+        provinces = ProvinceDAL(db).get_names()
+        cantons = CantonDAL(db).get_names()
+    finally:
+        db.close()
+    for result in (provinces, cantons):
+        if isinstance(result, dict) and "error" in result:
+            raise ValueError(result["error"])
+
+    yield from ("/provinces/", "/provinces/tree", "/cantons/", "/districts/", "/categories/")
+    for province_id, name in provinces:
+        yield f"/provinces/{province_id}"
+        yield f"/cantons/by-province-id/{province_id}"
+        yield f"/cantons/by-province/{name.strip()}"
+    for canton_id, name in cantons:
+        yield f"/districts/by-canton-id/{canton_id}"
+        yield f"/districts/by-canton/{name.strip()}"
+
+
+async def export(output: str, page_size: int, full: bool) -> int:
+    """
+    Genera o actualiza el snapshot en el directorio de salida.
+
+    Args:
+        output (str): Directorio de salida.
+        page_size (int): Leyendas por página del listado.
+        full (bool): Regenerar todas las leyendas aunque exista un snapshot anterior.
+
+    Returns:
+        int: Código de salida del proceso.
+    """
+    manifest_path = os.path.join(output, MANIFEST_NAME)
+    previous = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding="utf-8") as file:
+            previous = json.load(file)
+        if previous.get("version") != MANIFEST_VERSION:
+            previous = {}
+
+    app = build_app()
+    writer = SnapshotWriter(output, previous.get("files", {}))
+
+    # Catálogo
+    for route in await anyio.to_thread.run_sync(lambda: list(catalog_routes())):
+        status_code, body = await render(app, route)
+        if status_code == 200:
+            writer.write(route, file_for(route), body)
+
+    # Páginas del listado, hasta la primera incompleta
+    skip = 0
+    while True:
+        query = {"skip": skip, "limit": page_size}
+        status_code, body = await render(app, "/legends/", query)
+        if status_code != 200:
+            raise RuntimeError(f"/legends/ respondió {status_code}")
+        writer.write(f"/legends/?{urlencode(query)}", file_for("/legends/", query), body)
+        if len(json.loads(body)["data"] or []) < page_size:
+            break
+        skip += page_size
+
+    # Leyendas: todas, o solo las modificadas desde el cursor del snapshot anterior
+    since = None if full else previous.get("changesCursor")
+    try:
+        changes = await anyio.to_thread.run_sync(lambda: list(iter_changes(since)))
+    except ValueError as e:
+        if since is None:
+            raise
+        print(f"El cursor del snapshot anterior no es válido ({e}); se regeneran todas las leyendas.")
+        since = None
+        changes = await anyio.to_thread.run_sync(lambda: list(iter_changes(None)))
+
+    # El feed está ordenado, por lo que el último cambio de cada leyenda es su estado actual
+    changed: Dict[str, bool] = {legend_id: deleted for legend_id, deleted, _ in changes}
+    cursor = changes[-1][2] if changes else since
+
+    if since is not None:
+        for route in writer.previous:
+            if route.startswith("/legends/") and "?" not in route and route.split("/")[2] not in changed:
+                writer.keep(route)
+
+    for legend_id, deleted in changed.items():
+        if deleted:
+            continue
+        for route in (f"/legends/{legend_id}", f"/legends/{legend_id}/full"):
+            status_code, body = await render(app, route)
+            if status_code == 200:
+                writer.write(route, file_for(route), body)
+
+    removed = writer.remove_stale()
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "generatedAt": utc_now().isoformat() + "Z",
+        "changesCursor": cursor,
+        "files": dict(sorted(writer.files.items())),
+    }
+    os.makedirs(output, exist_ok=True)
+    _atomic_write(manifest_path, json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8"))
+
+    print(f"{len(writer.files)} rutas en el snapshot: {writer.written} archivos escritos, "
+          f"{removed} eliminados, {len(changed)} leyendas con cambios.")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Exporta las respuestas de lectura a archivos JSON estáticos.")
+    parser.add_argument("--output", required=True, help="Directorio de salida del snapshot.")
+    parser.add_argument("--page-size", type=int, default=100, help="Leyendas por página del listado (máximo 100).")
+    parser.add_argument("--full", action="store_true", help="Regenerar todas las leyendas, sin usar el snapshot anterior.")
+    args = parser.parse_args(argv)
+
+    if not 1 <= args.page_size <= 100:
+        print("--page-size debe estar entre 1 y 100.", file=sys.stderr)
+        return 1
+
+    return anyio.run(export, args.output, args.page_size, args.full)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+"""
+Migración de los identificadores UUID de texto a binario (`BINARY(16)`).
+
+Convierte `category.id`, `legend.id`, `legend.categoryId` y las mismas columnas de
+`legend_archive`. Los valores no cambian (la API sigue mostrando los mismos UUID); solo pasan de
+36 caracteres a 16 bytes, lo que reduce el tamaño de la clave primaria y de los índices que la
+incluyen. Las leyendas nuevas ya reciben UUID ordenados por tiempo (versión 7).
+
+Pasos:
+    1. Renombra las tablas actuales a `<tabla>_old`.
+    2. Crea las tablas con el esquema binario y todos sus índices.
+    3. Copia las filas en lotes, ordenadas por clave primaria.
+    4. Verifica la cantidad de filas y elimina las tablas `_old` (salvo con `--keep-old`).
+
+Debe ejecutarse con `ID_STORAGE=binary` y con la aplicación detenida.
+
+Uso:
+    ID_STORAGE=binary python -m legends_tools.migrate_ids [--batch-size N] [--keep-old]
+"""
+import argparse
+import sys
+from sqlalchemy import Engine, MetaData, Table, inspect, insert, select, text
+from legends_config.database.db_config import engine
+from legends_config.settings import settings
+from legends_models import CategoryModel, LegendArchiveModel, LegendModel
+
+# En orden de dependencia: las categorías antes que las leyendas que las referencian
+MODELS = (CategoryModel, LegendModel, LegendArchiveModel)
+
+
+def is_text(engine: Engine, table_name: str) -> bool:
+    """
+    Indica si la columna `id` de la tabla todavía guarda los UUID como texto.
+
+    Se comprueba el tipo de texto y no el binario porque SQLite no reconoce `BINARY` al reflejar
+    el esquema.
+
+    Args:
+        engine (Engine): Motor de la base de datos.
+        table_name (str): Nombre de la tabla.
+
+    Returns:
+        bool: `True` si la columna es de texto y debe migrarse.
+    """
+    column = next(c for c in inspect(engine).get_columns(table_name) if c["name"] == "id")
+    try:
+        return column["type"].python_type is str
+    except NotImplementedError:
+        return False
+
+
+def rename_old_tables(engine: Engine, table_names: list):
+    """
+    Renombra las tablas a `<tabla>_old`.
+
+    Salvo en MySQL, los nombres de índice son únicos en toda la base de datos, por lo que antes se
+    eliminan los índices secundarios para que las tablas nuevas puedan crearlos con el mismo nombre.
+    """
+    preparer = engine.dialect.identifier_preparer
+    with engine.begin() as conn:
+        for name in table_names:
+            if engine.dialect.name != "mysql":
+                for index in inspect(conn).get_indexes(name):
+                    conn.execute(text(f"DROP INDEX {preparer.quote(index['name'])}"))
+            conn.execute(text(f"ALTER TABLE {preparer.quote(name)} RENAME TO {preparer.quote(name + '_old')}"))
+
+
+def copy_rows(engine: Engine, model, batch_size: int) -> int:
+    """
+    Copia las filas de `<tabla>_old` a la tabla nueva en lotes, una transacción por lote.
+
+    Los UUID se leen como texto y `UUIDType` los convierte a binario al insertarlos.
+
+    Returns:
+        int: Cantidad de filas copiadas.
+    """
+    new = model.__table__
+    old = Table(f"{new.name}_old", MetaData(), autoload_with=engine)
+    columns = [c.name for c in new.columns if c.name in old.c]
+
+    copied, last_id = 0, None
+    while True:
+        query = select(*[old.c[name] for name in columns]).order_by(old.c.id).limit(batch_size)
+        if last_id is not None:
+            query = query.where(old.c.id > last_id)
+
+        with engine.begin() as conn:
+            rows = conn.execute(query).mappings().all()
+            if not rows:
+                return copied
+            conn.execute(insert(new), [dict(row) for row in rows])
+
+        copied += len(rows)
+        last_id = rows[-1]["id"]
+
+
+def count_rows(engine: Engine, table_name: str) -> int:
+    """Cantidad de filas de una tabla."""
+    with engine.connect() as conn:
+        return conn.execute(select(text("COUNT(*)")).select_from(text(table_name))).scalar_one()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Migra los UUID de leyendas y categorías a binario.")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Filas por lote (una transacción por lote).")
+    parser.add_argument("--keep-old", action="store_true", help="Conservar las tablas `_old` tras migrar.")
+    args = parser.parse_args(argv)
+
+    if settings.id_storage != "binary":
+        print("Configure ID_STORAGE=binary para ejecutar la migración.", file=sys.stderr)
+        return 1
+
+    names = [model.__tablename__ for model in MODELS if inspect(engine).has_table(model.__tablename__)]
+    pending = [name for name in names if is_text(engine, name)]
+    if not pending:
+        print("Los identificadores ya están en formato binario.")
+        return 0
+
+    leftovers = [f"{name}_old" for name in pending if inspect(engine).has_table(f"{name}_old")]
+    if leftovers:
+        print(f"Existen tablas de una migración anterior sin terminar: {', '.join(leftovers)}.", file=sys.stderr)
+        return 1
+
+    models = [model for model in MODELS if model.__tablename__ in pending]
+    rename_old_tables(engine, list(reversed(pending)))
+    MODELS[0].metadata.create_all(engine, tables=[model.__table__ for model in models])
+
+    for model in models:
+        copied = copy_rows(engine, model, args.batch_size)
+        expected = count_rows(engine, f"{model.__tablename__}_old")
+        if copied != expected:
+            print(f"{model.__tablename__}: se copiaron {copied} de {expected} filas; "
+                  f"se conservan las tablas _old.", file=sys.stderr)
+            return 1
+        print(f"{model.__tablename__}: {copied} filas migradas.")
+
+    if not args.keep_old:
+        preparer = engine.dialect.identifier_preparer
+        with engine.begin() as conn:
+            # Primero las tablas que referencian a otras
+            for name in reversed(pending):
+                conn.execute(text(f"DROP TABLE {preparer.quote(name + '_old')}"))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,51 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 from legends_api.controllers import cantons_router
 from legends_api.controllers import categories_router
 from legends_api.controllers import district_router
+from legends_api.controllers import health_router
 from legends_api.controllers import legends_router
 from legends_api.controllers import provinces_router
+from legends_api.middlewares import AdmissionControlMiddleware, ProfilingMiddleware, TracingMiddleware
+from legends_api.startup import admission_budgets, configure_thread_pool, run_warmup, thread_pool_monitor
+from legends_cache import invalidation_bus
+from legends_config.database.db_config import engine
+from legends_dal import legend_write_queue
+from legends_observability import BackgroundSpanExporter, load_exporter
+from legends_config.settings import settings
+
+# Exportador de trazas, compartido por el middleware y el cierre del worker
+span_exporter = (BackgroundSpanExporter(load_exporter(settings.tracing_exporter, settings.tracing_file))
+                 if settings.tracing_enabled else None)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Ciclo de vida de la aplicación.
+
+    El calentamiento se ejecuta en segundo plano para que el worker acepte conexiones
+    (y responda `/ready` con 503) mientras se prepara. También se ajusta el pool de hilos de los
+    endpoints síncronos y se empieza a recibir las invalidaciones de caché de los demás workers.
+    Al apagarse, se escriben las leyendas pendientes de la cola agrupada y se liberan las
+    conexiones del pool, y se exportan las trazas pendientes.
+    """
+    app.state.is_ready = False
+    configure_thread_pool()
+    invalidation_bus.start()
+    warmup_task = asyncio.create_task(run_in_threadpool(run_warmup, app))
+    yield
+    await warmup_task
+    invalidation_bus.close()
+    await run_in_threadpool(legend_write_queue.close)
+    engine.dispose()
+    if span_exporter is not None:
+        span_exporter.shutdown()
+
 
 app = FastAPI(
     title="LegendsCR.API",
@@ -14,8 +54,31 @@ app = FastAPI(
     license_info={
         "name": "MIT",
         "url": "https://opensource.org/licenses/MIT"
-    }
+    },
+    lifespan=lifespan
 )
+# El perfilado es el middleware más interno, para no medir la espera del control de admisión
+if settings.profiling_secret or settings.profiling_sample_rate > 0:
+    app.add_middleware(
+        ProfilingMiddleware,
+        secret=settings.profiling_secret,
+        sample_rate=settings.profiling_sample_rate,
+        output_dir=settings.profiling_dir,
+        top_functions=settings.profiling_top_functions,
+    )
+
+if settings.admission_enabled:
+    admission_max_reads, admission_max_writes = admission_budgets()
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        max_reads=admission_max_reads,
+        max_writes=admission_max_writes,
+        queue_timeout=settings.admission_queue_timeout,
+        retry_after=settings.admission_retry_after,
+        rate_limit=settings.rate_limit_per_second,
+        rate_burst=settings.rate_limit_burst,
+    )
+
 origins = ["http://localhost:3000",]
 app.add_middleware(
     CORSMiddleware,
@@ -25,11 +88,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-app.include_router(cantons_router)
-app.include_router(categories_router)
-app.include_router(district_router)
-app.include_router(legends_router)
-app.include_router(provinces_router)
+# Las trazas son el middleware más externo, para que el span raíz cubra toda la solicitud
+if span_exporter is not None:
+    app.add_middleware(
+        TracingMiddleware,
+        exporter=span_exporter,
+        sample_rate=settings.tracing_sample_rate,
+        max_statement_length=settings.tracing_max_statement_length,
+    )
+
+# Medición de la espera por un hilo; no se aplica a /ready ni a las métricas, que deben responder aunque el pool esté lleno
+tracked = [Depends(thread_pool_monitor.track)] if settings.thread_pool_metrics_enabled else None
+app.include_router(cantons_router, dependencies=tracked)
+app.include_router(categories_router, dependencies=tracked)
+app.include_router(district_router, dependencies=tracked)
+app.include_router(health_router)
+app.include_router(legends_router, dependencies=tracked)
+app.include_router(provinces_router, dependencies=tracked)
 
 if __name__ == "__main__":
     uvicorn.run("main:app", port=8080, reload=True)
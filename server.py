@@ -0,0 +1,31 @@
+import os
+import uvicorn
+from legends_config.settings import settings
+
+
+def run():
+    """
+    Punto de entrada de producción.
+
+    Levanta varios workers de uvicorn configurados desde `Settings`. Al apagarse, uvicorn deja
+    de aceptar conexiones y espera hasta `server_graceful_shutdown_timeout` segundos a que
+    terminen las solicitudes en curso; luego cada worker libera el pool de conexiones en el
+    cierre del ciclo de vida de la aplicación. Con `server_max_requests` cada worker se recicla
+    tras atender esa cantidad de solicitudes y el proceso supervisor lo vuelve a levantar.
+    """
+    uvicorn.run(
+        "main:app",
+        host=settings.server_host,
+        port=settings.server_port,
+        workers=settings.server_workers or os.cpu_count() or 1,
+        loop=settings.server_loop,
+        http=settings.server_http,
+        timeout_keep_alive=settings.server_keep_alive_timeout,
+        backlog=settings.server_backlog,
+        timeout_graceful_shutdown=settings.server_graceful_shutdown_timeout,
+        limit_max_requests=settings.server_max_requests,
+    )
+
+
+if __name__ == "__main__":
+    run()